@@ -1,22 +1,37 @@
 """
 AutoQuant-Alpha | src/config.py
 Centralized configuration loaded from environment variables.
-Fails loudly at import time if required variables are missing.
+Fails loudly if required variables are missing. The .env file is only
+parsed on the first lookup miss — importing this module does no disk IO.
 """
 from __future__ import annotations
 
+import functools
 import logging
 import os
 from dataclasses import dataclass, field
 
-from dotenv import load_dotenv
+# Bound once: skips the os.getenv wrapper frame on each lookup. Still the
+# live mapping, so monkeypatch.setenv and runtime exports are visible.
+_ENVIRON = os.environ
 
-load_dotenv()  # loads .env file if present; silently skips if absent
+
+@functools.lru_cache(maxsize=1)
+def _ensure_dotenv_loaded() -> None:
+    """Load .env once, on demand. AUTOQUANT_SKIP_DOTENV=1 disables it."""
+    if os.getenv("AUTOQUANT_SKIP_DOTENV") == "1":
+        return
+    from dotenv import load_dotenv
+
+    load_dotenv()  # loads .env file if present; silently skips if absent
 
 
 def _require_env(key: str) -> str:
     """Fetch a required environment variable or raise immediately."""
-    value = os.getenv(key)
+    value = _ENVIRON.get(key)
+    if not value:
+        _ensure_dotenv_loaded()
+        value = _ENVIRON.get(key)
     if not value:
         raise EnvironmentError(
             f"Required environment variable '{key}' is not set. "
@@ -25,7 +40,7 @@ def _require_env(key: str) -> str:
     return value
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AlpacaConfig:
     api_key: str
     secret_key: str
@@ -33,16 +48,27 @@ class AlpacaConfig:
 
     @classmethod
     def from_env(cls) -> "AlpacaConfig":
-        return cls(
-            api_key=_require_env("ALPACA_API_KEY"),
-            secret_key=_require_env("ALPACA_SECRET_KEY"),
-            base_url=os.getenv(
-                "ALPACA_BASE_URL", "https://paper-api.alpaca.markets"
-            ),
-        )
+        """Return the process-wide config; environment is read only once."""
+        return _load_alpaca_from_env()
+
+    @classmethod
+    def invalidate(cls) -> None:
+        """Drop the cached config so the next from_env() re-reads the environment."""
+        _load_alpaca_from_env.cache_clear()
+
+
+@functools.lru_cache(maxsize=1)
+def _load_alpaca_from_env() -> AlpacaConfig:
+    return AlpacaConfig(
+        api_key=_require_env("ALPACA_API_KEY"),
+        secret_key=_require_env("ALPACA_SECRET_KEY"),
+        base_url=os.getenv(
+            "ALPACA_BASE_URL", "https://paper-api.alpaca.markets"
+        ),
+    )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AppConfig:
     alpaca: AlpacaConfig = field(default_factory=AlpacaConfig.from_env)
     log_level: str = field(
@@ -9,78 +9,198 @@ from __future__ import annotations
 
 import platform
 import sys
+import threading
 import time
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import Any
 
-from alpaca.trading.client import TradingClient
-from rich.columns import Columns
 from rich.console import Console
-from rich.live import Live
 from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
 
 from src.config import AlpacaConfig
+from src.health_check import _get_trading_client, _keep_warm
 from src.logger import get_logger
 
 log = get_logger(__name__)
 console = Console()
 
+# UI frame pacing, independent of how often the account is re-fetched.
+_FRAME_INTERVAL = 0.25
 
-def _env_panel() -> Panel:
-    """Render system/environment info panel."""
-    table = Table.grid(padding=(0, 2))
-    table.add_column(style="bold cyan")
-    table.add_column()
 
-    table.add_row("Python", sys.version.split()[0])
-    table.add_row("Platform", platform.platform(terse=True))
-    table.add_row(
-        "UTC Time",
-        datetime.now(tz=timezone.utc).strftime("%Y-%m-%d %H:%M:%S"),
-    )
-    table.add_row("Container", "Docker ✓" if _in_docker() else "Host")
+def _in_docker() -> bool:
+    return Path("/.dockerenv").exists()
 
-    return Panel(table, title="[bold]Environment[/bold]", border_style="blue")
 
+# Static for the life of the process — resolved once, not on every refresh.
+_PY_VERSION = sys.version.split()[0]
+_PLATFORM = platform.platform(terse=True)
+_CONTAINER = "Docker ✓" if _in_docker() else "Host"
 
-def _in_docker() -> bool:
-    return Path("/.dockerenv").exists()
 
+@dataclass(frozen=True)
+class _AccountSnapshot:
+    """Result of one get_account() round trip."""
+    account: Any | None
+    latency_ms: float
+    error: Exception | None = None
+
+
+class _AccountCache:
+    """Latest-value slot: written by the refresh thread, read by the UI loop."""
+
+    def __init__(self) -> None:
+        self.snapshot: _AccountSnapshot | None = None
+        self.lock = threading.Lock()
+
+    def set(self, snapshot: _AccountSnapshot) -> None:
+        with self.lock:
+            self.snapshot = snapshot
+
+    def get(self) -> _AccountSnapshot | None:
+        with self.lock:
+            return self.snapshot
 
-def _account_panel(config: AlpacaConfig) -> Panel:
-    """Fetch and render Alpaca account snapshot."""
+
+def _fetch_snapshot(config: AlpacaConfig) -> _AccountSnapshot:
+    """Fetch the Alpaca account; never raises."""
     t0 = time.monotonic()
     try:
-        client = TradingClient(
-            api_key=config.api_key,
-            secret_key=config.secret_key,
-            paper=True,
-        )
+        client = _get_trading_client(config.api_key, config.secret_key)
         acct = client.get_account()
         latency_ms = round((time.monotonic() - t0) * 1000, 1)
+        return _AccountSnapshot(account=acct, latency_ms=latency_ms)
+    except Exception as exc:
+        latency_ms = round((time.monotonic() - t0) * 1000, 1)
+        return _AccountSnapshot(account=None, latency_ms=latency_ms, error=exc)
 
-        table = Table.grid(padding=(0, 2))
-        table.add_column(style="bold green")
-        table.add_column()
-
-        table.add_row("Account ID", str(acct.id)[:8] + "…")
-        table.add_row("Status", str(acct.status))
-        table.add_row("Equity", f"${float(acct.equity):,.2f}")          # type: ignore
-        table.add_row("Cash", f"${float(acct.cash):,.2f}")              # type: ignore
-        table.add_row("Buying Power", f"${float(acct.buying_power):,.2f}")  # type: ignore
-        table.add_row("Latency", f"{latency_ms} ms")
-
-        color = "green" if float(acct.equity) > 0 else "red"           # type: ignore
-        return Panel(
-            table,
-            title=f"[bold]Alpaca Paper Trading[/bold] [{color}]● LIVE[/{color}]",
-            border_style=color,
-        )
+
+def _refresh_account(
+    config: AlpacaConfig,
+    cache: _AccountCache,
+    stop: threading.Event,
+    refresh_interval: float,
+    wake: threading.Event | None = None,
+) -> None:
+    """
+    Producer loop: keeps the cache fresh so the UI never waits on the network.
+    Re-fetches every refresh_interval seconds, or immediately when `wake` is
+    set (by the trade-update stream after a fill).
+    """
+    wake = wake if wake is not None else stop
+    while not stop.is_set():
+        cache.set(_fetch_snapshot(config))
+        wake.wait(refresh_interval)
+        if wake is not stop:
+            wake.clear()
+
+
+def _start_trade_stream(config: AlpacaConfig, wake: threading.Event) -> Any | None:
+    """
+    Subscribe to Alpaca's trade_updates websocket on a daemon thread.
+    Order fills are what move equity/cash, so each pushed event wakes the
+    account refresher instead of waiting for the next polling interval.
+    Returns the stream (for stop()) or None if it could not be started.
+    """
+    try:
+        from alpaca.trading.stream import TradingStream
+
+        stream = TradingStream(config.api_key, config.secret_key, paper=True)
     except Exception as exc:
-        err_text = Text(f"Connection failed: {exc}", style="bold red")
-        return Panel(err_text, title="[bold]Alpaca Paper Trading[/bold] [red]● DOWN[/red]", border_style="red")
+        log.warning("Trade stream unavailable, polling only", extra={"error": repr(exc)})
+        return None
+
+    async def _on_trade_update(data: Any) -> None:
+        wake.set()
+
+    stream.subscribe_trade_updates(_on_trade_update)
+    threading.Thread(target=stream.run, name="trade-stream", daemon=True).start()
+    return stream
+
+
+_ENV_TIME_ROW = 2
+_ACCOUNT_LABELS = ("Account ID", "Status", "Equity", "Cash", "Buying Power", "Latency")
+_ACCOUNT_TITLE = "[bold]Alpaca Paper Trading[/bold] [{color}]● {state}[/{color}]"
+
+
+def _utc_now_str() -> str:
+    return datetime.now(tz=timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _grid(label_style: str, labels: tuple[str, ...], values: list[str]) -> Table:
+    table = Table.grid(padding=(0, 2))
+    table.add_column(style=label_style)
+    table.add_column()
+    for label, value in zip(labels, values):
+        table.add_row(label, value)
+    return table
+
+
+class _DashboardView:
+    """
+    Persistent render tree. Tables, panels and the Columns wrapper are built
+    once; each frame rewrites only the value cells that changed and the
+    caller triggers an explicit Live.refresh().
+    """
+
+    def __init__(self) -> None:
+        from rich.columns import Columns
+
+        self.env_table = _grid(
+            "bold cyan",
+            ("Python", "Platform", "UTC Time", "Container"),
+            [_PY_VERSION, _PLATFORM, _utc_now_str(), _CONTAINER],
+        )
+        self.env_panel = Panel(
+            self.env_table, title="[bold]Environment[/bold]", border_style="blue"
+        )
+        self.account_table = _grid(
+            "bold green", _ACCOUNT_LABELS, ["—"] * len(_ACCOUNT_LABELS)
+        )
+        self.account_panel = Panel(
+            Text("Connecting…", style="dim"),
+            title=_ACCOUNT_TITLE.format(color="yellow", state="WAIT"),
+            border_style="yellow",
+        )
+        self.layout = Columns([self.env_panel, self.account_panel], equal=True)
+        self._snapshot: _AccountSnapshot | None = None
+
+    def update(self, snapshot: _AccountSnapshot | None) -> None:
+        self.env_table.columns[1]._cells[_ENV_TIME_ROW] = _utc_now_str()
+        if snapshot is not self._snapshot:
+            self._snapshot = snapshot
+            self._render_account(snapshot)
+
+    def _render_account(self, snapshot: _AccountSnapshot | None) -> None:
+        panel = self.account_panel
+        if snapshot is None:
+            return
+        if snapshot.error is not None or snapshot.account is None:
+            panel.renderable = Text(
+                f"Connection failed: {snapshot.error}", style="bold red"
+            )
+            panel.title = _ACCOUNT_TITLE.format(color="red", state="DOWN")
+            panel.border_style = "red"
+            return
+
+        acct = snapshot.account
+        equity = float(acct.equity)
+        self.account_table.columns[1]._cells[:] = [
+            str(acct.id)[:8] + "…",
+            str(acct.status),
+            f"${equity:,.2f}",
+            f"${float(acct.cash):,.2f}",
+            f"${float(acct.buying_power):,.2f}",
+            f"{snapshot.latency_ms} ms",
+        ]
+        color = "green" if equity > 0 else "red"
+        panel.renderable = self.account_table
+        panel.title = _ACCOUNT_TITLE.format(color=color, state="LIVE")
+        panel.border_style = color
 
 
 def _status_bar(refresh_count: int) -> Text:
@@ -92,6 +212,9 @@ def _status_bar(refresh_count: int) -> Text:
 
 
 def run_dashboard(config: AlpacaConfig, refresh_interval: float = 5.0) -> None:
+    # Deferred: config-error exits never pay for the Live/Columns machinery.
+    from rich.live import Live
+
     console.print(
         Panel(
             "[bold yellow]AutoQuant-Alpha — Day 1 Dashboard[/bold yellow]\n"
@@ -100,18 +223,35 @@ def run_dashboard(config: AlpacaConfig, refresh_interval: float = 5.0) -> None:
         )
     )
     count = 0
+    stop = threading.Event()
+    wake = threading.Event()
+    cache = _AccountCache()
+    _keep_warm(_get_trading_client(config.api_key, config.secret_key), stop)
+    threading.Thread(
+        target=_refresh_account,
+        args=(config, cache, stop, refresh_interval, wake),
+        name="account-refresh",
+        daemon=True,
+    ).start()
+    stream = _start_trade_stream(config, wake)
     try:
-        with Live(console=console, refresh_per_second=4) as live:
+        view = _DashboardView()
+        with Live(view.layout, console=console, auto_refresh=False) as live:
             while True:
                 count += 1
-                layout = Columns(
-                    [_env_panel(), _account_panel(config)],
-                    equal=True,
-                )
-                live.update(layout)
-                time.sleep(refresh_interval)
+                view.update(cache.get())
+                live.refresh()
+                time.sleep(_FRAME_INTERVAL)
     except KeyboardInterrupt:
         console.print("\n[dim]Dashboard stopped.[/dim]")
+    finally:
+        stop.set()
+        wake.set()
+        if stream is not None:
+            try:
+                stream.stop()
+            except Exception:
+                pass
 
 
 def main() -> None:
@@ -11,54 +11,125 @@ Usage:
 """
 from __future__ import annotations
 
+import functools
+import os
 import sys
+import threading
 import time
-
-from alpaca.trading.client import TradingClient
-from alpaca.trading.requests import GetAssetsRequest
+from typing import TYPE_CHECKING
 
 from src.config import AlpacaConfig
 from src.logger import get_logger
 
+if TYPE_CHECKING:
+    from alpaca.trading.client import TradingClient
+
 log = get_logger(__name__)
 
+# (api_key, secret_key) -> (monotonic timestamp, healthy). Dashboard and
+# health endpoint poll concurrently; results younger than the TTL are reused.
+_CACHE: dict[tuple[str, str], tuple[float, bool]] = {}
+_CACHE_TTL = float(os.getenv("HEALTH_CACHE_TTL", "1.0"))
+_CACHE_LOCK = threading.Lock()
+
+# Health check, dashboard and strategies share one Alpaca endpoint; the
+# requests default (10 pooled connections) is too small under concurrency.
+_POOL_MAXSIZE = 40
+_KEEPALIVE_INTERVAL = 30.0
+
+
+@functools.lru_cache(maxsize=4)
+def _get_trading_client(
+    api_key: str, secret_key: str, paper: bool = True
+) -> TradingClient:
+    """One TradingClient per credential set — keeps the HTTP session pooled."""
+    # Deferred: alpaca's pydantic models are the bulk of CLI startup time.
+    from alpaca.trading.client import TradingClient
+    from requests.adapters import HTTPAdapter
+
+    client = TradingClient(api_key=api_key, secret_key=secret_key, paper=paper)
+    session = getattr(client, "_session", None)
+    if session is not None and hasattr(session, "mount"):
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=_POOL_MAXSIZE)
+        session.mount("https://", adapter)
+    return client
+
+
+def _keep_warm(
+    client: TradingClient,
+    stop: threading.Event,
+    interval: float = _KEEPALIVE_INTERVAL,
+) -> threading.Thread:
+    """
+    Ping GET /v2/clock every `interval` seconds from a daemon thread so the
+    pooled TLS connection is not dropped as idle between refreshes.
+    """
+
+    def _loop() -> None:
+        while not stop.wait(interval):
+            try:
+                client.get_clock()
+            except Exception as exc:
+                log.warning("Keepalive ping failed", extra={"error": repr(exc)})
+
+    thread = threading.Thread(target=_loop, name="alpaca-keepalive", daemon=True)
+    thread.start()
+    return thread
 
-def check_alpaca_health(config: AlpacaConfig) -> bool:
+
+def check_alpaca_health(config: AlpacaConfig, use_cache: bool = True) -> bool:
     """
     Authenticate to Alpaca Paper Trading and verify account is funded.
     Returns True if healthy, False otherwise.
-    Logs structured JSON with latency_ms on every call.
+    Logs structured JSON with latency_ms on every uncached call.
+
+    With use_cache=True, a result younger than HEALTH_CACHE_TTL seconds
+    is returned without hitting the API.
     """
+    key = (config.api_key, config.secret_key)
+    if use_cache:
+        with _CACHE_LOCK:
+            cached = _CACHE.get(key)
+        if cached is not None and time.monotonic() - cached[0] < _CACHE_TTL:
+            return cached[1]
+
+    healthy = _run_health_check(config)
+    with _CACHE_LOCK:
+        _CACHE[key] = (time.monotonic(), healthy)
+    return healthy
+
+
+def _run_health_check(config: AlpacaConfig) -> bool:
     t_start = time.monotonic()
     try:
-        client = TradingClient(
-            api_key=config.api_key,
-            secret_key=config.secret_key,
-            paper=True,
-        )
+        client = _get_trading_client(config.api_key, config.secret_key)
         account = client.get_account()
         latency_ms = round((time.monotonic() - t_start) * 1000, 2)
 
         equity = float(account.equity)  # type: ignore[arg-type]
         if equity <= 0:
             log.error(
-                f"Alpaca account equity is zero or negative | equity={equity}"
+                "Alpaca account equity is zero or negative",
+                extra={"equity": equity},
             )
             return False
 
         log.info(
-            f"Alpaca sandbox healthy | equity={equity:.2f}"
-            f" | latency_ms={latency_ms}"
-            f" | account_id={account.id}"
-            f" | status={account.status}"
+            "Alpaca sandbox healthy",
+            extra={
+                "equity": equity,
+                "latency_ms": latency_ms,
+                "account_id": str(account.id),
+                "status": str(account.status),
+            },
         )
         return True
 
     except Exception as exc:
         latency_ms = round((time.monotonic() - t_start) * 1000, 2)
         log.error(
-            f"Alpaca health check failed | error={exc!r}"
-            f" | latency_ms={latency_ms}"
+            "Alpaca health check failed",
+            extra={"error": repr(exc), "latency_ms": latency_ms},
         )
         return False
 
@@ -67,7 +138,7 @@ def main() -> None:
     try:
         config = AlpacaConfig.from_env()
     except EnvironmentError as exc:
-        log.error(f"Configuration error | error={exc}")
+        log.error("Configuration error", extra={"error": str(exc)})
         sys.exit(1)
 
     healthy = check_alpaca_health(config)
@@ -5,25 +5,50 @@ Output is newline-delimited JSON — grep-able, parseable by any log aggregator.
 """
 from __future__ import annotations
 
-import json
 import logging
 import sys
 from datetime import datetime, timezone
 
+try:
+    import orjson
+
+    def _dumps(payload: dict[str, object]) -> str:
+        return orjson.dumps(payload, default=str).decode()
+
+except ImportError:  # pragma: no cover — orjson is in requirements.txt
+    import json
+
+    def _dumps(payload: dict[str, object]) -> str:
+        return json.dumps(payload, default=str)
+
+
+# Attributes every LogRecord carries; anything else came in via extra=.
+_STANDARD_ATTRS = frozenset(
+    logging.LogRecord("", 0, "", 0, "", None, None).__dict__
+) | {"message", "asctime"}
+
 
 class _JSONFormatter(logging.Formatter):
-    """Formats log records as single-line JSON objects."""
+    """
+    Formats log records as single-line JSON objects.
+    Fields passed via extra={...} are merged into the payload as typed
+    values, so callers never pre-format strings that may be filtered out.
+    """
 
     def format(self, record: logging.LogRecord) -> str:
+        # record.created is stamped by logging itself — no extra clock read.
         payload: dict[str, object] = {
-            "ts": datetime.now(tz=timezone.utc).isoformat(),
+            "ts": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
             "level": record.levelname,
             "module": record.module,
             "msg": record.getMessage(),
         }
+        for key, value in record.__dict__.items():
+            if key not in _STANDARD_ATTRS:
+                payload[key] = value
         if record.exc_info:
             payload["exc"] = self.formatException(record.exc_info)
-        return json.dumps(payload)
+        return _dumps(payload)
 
 
 def get_logger(name: str, level: str = "INFO") -> logging.Logger:
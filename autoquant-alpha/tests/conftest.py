@@ -0,0 +1,11 @@
+from __future__ import annotations
+
+import pytest
+
+from src.config import AlpacaConfig
+
+
+@pytest.fixture(autouse=True)
+def _fresh_alpaca_config() -> None:
+    """from_env() is memoized; tests that monkeypatch env need a clean slate."""
+    AlpacaConfig.invalidate()
@@ -5,8 +5,8 @@ Not a unit test — run directly: python tests/stress_test.py
 from __future__ import annotations
 
 import os
-import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 from src.config import AlpacaConfig
 from src.logger import get_logger
@@ -17,39 +17,33 @@ os.environ["ALPACA_API_KEY"] = "stress_test_key"
 os.environ["ALPACA_SECRET_KEY"] = "stress_test_secret"
 
 
-def load_config_thread(thread_id: int, results: list[bool]) -> None:
+def load_config_thread(thread_id: int) -> bool:
     try:
         cfg = AlpacaConfig.from_env()
         assert cfg.api_key == "stress_test_key"
-        results.append(True)
+        return True
     except Exception as exc:
-        log.error(f"Thread {thread_id} failed | error={exc!r}")
-        results.append(False)
+        log.error("Thread %d failed", thread_id, extra={"error": repr(exc)})
+        return False
 
 
 def main() -> None:
     n_threads = 50
-    results: list[bool] = []
-    threads = [
-        threading.Thread(
-            target=load_config_thread, args=(i, results), daemon=True
-        )
-        for i in range(n_threads)
-    ]
 
     t0 = time.monotonic()
-    for t in threads:
-        t.start()
-    for t in threads:
-        t.join()
+    with ThreadPoolExecutor(max_workers=n_threads) as pool:
+        results = list(pool.map(load_config_thread, range(n_threads)))
     elapsed_ms = round((time.monotonic() - t0) * 1000, 2)
 
     successes = sum(results)
     log.info(
-        f"Stress test complete | threads={n_threads}"
-        f" | successes={successes}"
-        f" | failures={n_threads - successes}"
-        f" | elapsed_ms={elapsed_ms}"
+        "Stress test complete",
+        extra={
+            "threads": n_threads,
+            "successes": successes,
+            "failures": n_threads - successes,
+            "elapsed_ms": elapsed_ms,
+        },
     )
     assert successes == n_threads, f"Only {successes}/{n_threads} threads succeeded"
     print(f"\n✓ Stress test passed: {n_threads}/{n_threads} threads | {elapsed_ms}ms")
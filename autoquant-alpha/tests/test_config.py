@@ -53,3 +53,50 @@ class TestAlpacaConfig:
         cfg = AlpacaConfig.from_env()
         with pytest.raises((AttributeError, TypeError)):
             cfg.api_key = "mutated"  # type: ignore[misc]
+
+    def test_from_env_is_cached(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("ALPACA_API_KEY", "k")
+        monkeypatch.setenv("ALPACA_SECRET_KEY", "s")
+        first = AlpacaConfig.from_env()
+        monkeypatch.setenv("ALPACA_API_KEY", "changed")
+        assert AlpacaConfig.from_env() is first
+
+        AlpacaConfig.invalidate()
+        assert AlpacaConfig.from_env().api_key == "changed"
+
+
+class TestLazyDotenv:
+    def test_dotenv_not_loaded_when_env_set(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        import dotenv
+
+        import src.config as config_module
+
+        calls: list[int] = []
+        monkeypatch.setattr(dotenv, "load_dotenv", lambda: calls.append(1))
+        monkeypatch.delenv("AUTOQUANT_SKIP_DOTENV", raising=False)
+        config_module._ensure_dotenv_loaded.cache_clear()
+        monkeypatch.setenv("TEST_VAR", "hello")
+
+        assert _require_env("TEST_VAR") == "hello"
+        assert calls == []
+
+    def test_dotenv_loaded_once_on_miss(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        import dotenv
+
+        import src.config as config_module
+
+        calls: list[int] = []
+        monkeypatch.setattr(dotenv, "load_dotenv", lambda: calls.append(1))
+        monkeypatch.delenv("AUTOQUANT_SKIP_DOTENV", raising=False)
+        monkeypatch.delenv("TEST_NONEXISTENT_VAR", raising=False)
+        config_module._ensure_dotenv_loaded.cache_clear()
+
+        for _ in range(3):
+            with pytest.raises(EnvironmentError):
+                _require_env("TEST_NONEXISTENT_VAR")
+        assert calls == [1]
+        config_module._ensure_dotenv_loaded.cache_clear()
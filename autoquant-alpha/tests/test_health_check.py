@@ -8,8 +8,10 @@ from dataclasses import dataclass
 from unittest.mock import MagicMock, patch
 
 import pytest
+from requests.adapters import HTTPAdapter
 
 from src.config import AlpacaConfig
+from src import health_check
 from src.health_check import check_alpaca_health
 
 
@@ -29,13 +31,19 @@ def _fake_config() -> AlpacaConfig:
     )
 
 
+@pytest.fixture(autouse=True)
+def _clear_health_cache() -> None:
+    health_check._CACHE.clear()
+    health_check._get_trading_client.cache_clear()
+
+
 class TestCheckAlpacaHealth:
     def test_returns_true_on_success(self) -> None:
         fake_acct = _FakeAccount()
         mock_client = MagicMock()
         mock_client.get_account.return_value = fake_acct
 
-        with patch("src.health_check.TradingClient", return_value=mock_client):
+        with patch("alpaca.trading.client.TradingClient", return_value=mock_client):
             result = check_alpaca_health(_fake_config())
 
         assert result is True
@@ -45,7 +53,7 @@ class TestCheckAlpacaHealth:
         mock_client = MagicMock()
         mock_client.get_account.return_value = fake_acct
 
-        with patch("src.health_check.TradingClient", return_value=mock_client):
+        with patch("alpaca.trading.client.TradingClient", return_value=mock_client):
             result = check_alpaca_health(_fake_config())
 
         assert result is False
@@ -54,7 +62,7 @@ class TestCheckAlpacaHealth:
         mock_client = MagicMock()
         mock_client.get_account.side_effect = ConnectionError("timeout")
 
-        with patch("src.health_check.TradingClient", return_value=mock_client):
+        with patch("alpaca.trading.client.TradingClient", return_value=mock_client):
             result = check_alpaca_health(_fake_config())
 
         assert result is False
@@ -64,7 +72,61 @@ class TestCheckAlpacaHealth:
         mock_client = MagicMock()
         mock_client.get_account.return_value = fake_acct
 
-        with patch("src.health_check.TradingClient", return_value=mock_client):
+        with patch("alpaca.trading.client.TradingClient", return_value=mock_client):
             result = check_alpaca_health(_fake_config())
 
         assert result is False
+
+
+class TestHealthCache:
+    def test_cached_result_skips_api_call(self) -> None:
+        mock_client = MagicMock()
+        mock_client.get_account.return_value = _FakeAccount()
+
+        with patch("alpaca.trading.client.TradingClient", return_value=mock_client):
+            assert check_alpaca_health(_fake_config()) is True
+            assert check_alpaca_health(_fake_config()) is True
+
+        assert mock_client.get_account.call_count == 1
+
+    def test_use_cache_false_bypasses_cache(self) -> None:
+        mock_client = MagicMock()
+        mock_client.get_account.return_value = _FakeAccount()
+
+        with patch("alpaca.trading.client.TradingClient", return_value=mock_client):
+            check_alpaca_health(_fake_config())
+            check_alpaca_health(_fake_config(), use_cache=False)
+
+        assert mock_client.get_account.call_count == 2
+
+    def test_expired_entry_is_refreshed(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(health_check, "_CACHE_TTL", 0.0)
+        mock_client = MagicMock()
+        mock_client.get_account.return_value = _FakeAccount()
+
+        with patch("alpaca.trading.client.TradingClient", return_value=mock_client):
+            check_alpaca_health(_fake_config())
+            check_alpaca_health(_fake_config())
+
+        assert mock_client.get_account.call_count == 2
+
+
+class TestTradingClientReuse:
+    def test_client_constructed_once_per_credentials(self) -> None:
+        mock_client = MagicMock()
+        mock_client.get_account.return_value = _FakeAccount()
+
+        with patch(
+            "alpaca.trading.client.TradingClient", return_value=mock_client
+        ) as ctor:
+            check_alpaca_health(_fake_config(), use_cache=False)
+            check_alpaca_health(_fake_config(), use_cache=False)
+
+        assert ctor.call_count == 1
+        assert mock_client.get_account.call_count == 2
+
+    def test_session_pool_is_enlarged(self) -> None:
+        client = health_check._get_trading_client("FAKE_KEY", "FAKE_SECRET")
+        adapter = client._session.get_adapter("https://paper-api.alpaca.markets")
+        assert isinstance(adapter, HTTPAdapter)
+        assert adapter.poolmanager.connection_pool_kw["maxsize"] == health_check._POOL_MAXSIZE
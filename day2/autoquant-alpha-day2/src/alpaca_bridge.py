@@ -9,15 +9,22 @@ We use these to validate our YTM/duration calculations against live market data.
 
 from __future__ import annotations
 
+import functools
 import os
 from datetime import date, timedelta
 from dotenv import load_dotenv
 
 load_dotenv()
 
+BENCHMARK_TICKERS: tuple[str, ...] = ("AGG", "TLT", "IEF")
 
+
+@functools.lru_cache(maxsize=1)
 def get_alpaca_client():
-    """Return Alpaca StockHistoricalDataClient if credentials available."""
+    """
+    Return Alpaca StockHistoricalDataClient if credentials available.
+    Cached: one client (and one pooled HTTP session) per process.
+    """
     try:
         from alpaca.data.historical import StockHistoricalDataClient
         api_key = os.getenv("ALPACA_API_KEY", "")
@@ -48,9 +55,23 @@ def fetch_etf_price(ticker: str) -> float | None:
 
 
 def fetch_benchmark_prices() -> dict[str, float | None]:
-    """Fetch all benchmark ETF prices for validation."""
-    return {
-        "AGG": fetch_etf_price("AGG"),
-        "TLT": fetch_etf_price("TLT"),
-        "IEF": fetch_etf_price("IEF"),
-    }
+    """
+    Fetch all benchmark ETF prices for validation.
+    One multi-symbol quote request — a single round trip for all tickers.
+    """
+    prices: dict[str, float | None] = dict.fromkeys(BENCHMARK_TICKERS)
+    client = get_alpaca_client()
+    if client is None:
+        return prices
+
+    try:
+        from alpaca.data.requests import StockLatestQuoteRequest
+        request = StockLatestQuoteRequest(symbol_or_symbols=list(BENCHMARK_TICKERS))
+        quotes = client.get_stock_latest_quote(request)
+        for ticker in BENCHMARK_TICKERS:
+            q = quotes.get(ticker)
+            if q is not None:
+                prices[ticker] = float((q.ask_price + q.bid_price) / 2.0)
+    except Exception as e:
+        print(f"[alpaca_bridge] Could not fetch {', '.join(BENCHMARK_TICKERS)}: {e}")
+    return prices
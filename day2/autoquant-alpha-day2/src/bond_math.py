@@ -4,10 +4,17 @@ All hot paths are vectorized. No Python loops in pricing critical section.
 """
 
 from __future__ import annotations
+import math
 import numpy as np
 from dataclasses import dataclass, field
 from datetime import date
 
+from .bond_math_jit import NUMBA_AVAILABLE, price_and_derivative_jit, solve_ytm_jit
+
+# Below this many cash flows NumPy dispatch is cheap enough that the
+# compiled solver is not worth the call boundary.
+_JIT_MIN_CASHFLOWS = 4
+
 
 @dataclass(slots=True)
 class CashFlowSchedule:
@@ -16,10 +23,17 @@ class CashFlowSchedule:
     amounts: np.ndarray      # Cash flow amounts (float64)
     coupon_dates: list[date]
     settlement: date
+    frequency: int = 2       # Compounding frequency scaled_times was built for
+    scaled_times: np.ndarray = field(default=None, repr=False)  # times × frequency
 
     def __post_init__(self) -> None:
         assert len(self.times) == len(self.amounts), "times/amounts length mismatch"
         assert (self.times > 0).all(), "All cash flows must be in the future"
+        self.scaled_times = self.times * self.frequency
+
+    def scaled_for(self, frequency: int) -> np.ndarray | None:
+        """Cached times × frequency, or None if built for another frequency."""
+        return self.scaled_times if frequency == self.frequency else None
 
 
 def future_value(
@@ -64,14 +78,24 @@ def discount_factors(
     ytm: float,
     *,
     frequency: int = 2,  # Semi-annual default (US convention)
+    scaled_times: np.ndarray | None = None,
 ) -> np.ndarray:
     """
     Vectorized discount factors: df[i] = 1 / (1 + ytm/freq)^(times[i] * freq)
     
     This is the hot path. NumPy broadcasts across the entire times array
     in a single C-level operation — no Python loop.
+    Computed as exp(-t·k·log1p(y/k)): one scalar log, then a vectorized
+    exp, which is cheaper than an elementwise pow with fractional exponents.
+    Pass scaled_times (= times × frequency, e.g. CashFlowSchedule.scaled_times)
+    to skip the multiply on repeated calls.
     """
-    return 1.0 / (1.0 + ytm / frequency) ** (times * frequency)
+    if ytm == 0.0:
+        return np.ones_like(times, dtype=np.float64)
+    if scaled_times is None:
+        scaled_times = times * frequency
+    log_term = math.log1p(ytm / frequency)
+    return np.exp(-log_term * scaled_times)
 
 
 def dirty_price(schedule: CashFlowSchedule, ytm: float, frequency: int = 2) -> float:
@@ -80,9 +104,12 @@ def dirty_price(schedule: CashFlowSchedule, ytm: float, frequency: int = 2) -> f
     This is what you *actually pay* when buying a bond.
     Assumes face value is embedded in the final cash flow.
     """
-    df = discount_factors(schedule.times, ytm, frequency=frequency)
-    # np.dot: single BLAS call, faster than sum(a*b for a,b in zip(...))
-    return float(np.dot(schedule.amounts, df))
+    df = discount_factors(
+        schedule.times, ytm, frequency=frequency,
+        scaled_times=schedule.scaled_for(frequency),
+    )
+    # np.vdot: single BLAS call, no elementwise-product temporary
+    return float(np.vdot(schedule.amounts, df))
 
 
 def accrued_interest(
@@ -111,12 +138,14 @@ def bond_duration(schedule: CashFlowSchedule, ytm: float, frequency: int = 2) ->
     Macaulay duration: time-weighted average of discounted cash flows.
     Used as the first derivative in Newton-Raphson YTM solver.
     """
-    df = discount_factors(schedule.times, ytm, frequency=frequency)
-    discounted = schedule.amounts * df
-    total_pv = float(np.sum(discounted))
+    df = discount_factors(
+        schedule.times, ytm, frequency=frequency,
+        scaled_times=schedule.scaled_for(frequency),
+    )
+    total_pv = float(np.vdot(schedule.amounts, df))
     if total_pv == 0:
         raise ValueError("Bond PV is zero — check cash flow schedule")
-    return float(np.dot(schedule.times, discounted)) / total_pv
+    return float(np.vdot(schedule.times, schedule.amounts * df)) / total_pv
 
 
 def modified_duration(schedule: CashFlowSchedule, ytm: float, frequency: int = 2) -> float:
@@ -130,9 +159,168 @@ def dv01(schedule: CashFlowSchedule, ytm: float, face: float = 100.0, frequency:
     Dollar value of 1 basis point.
     DV01 = -dP/dy × 0.0001 ≈ modified_duration × dirty_price × 0.0001
     """
-    dp = dirty_price(schedule, ytm, frequency=frequency)
-    md = modified_duration(schedule, ytm, frequency=frequency)
-    return md * dp * 0.0001
+    _, dp_dr = _price_and_derivative(
+        schedule.amounts, schedule.times, ytm, frequency=frequency,
+        scaled_times=schedule.scaled_for(frequency),
+    )
+    return -dp_dr * 0.0001
+
+
+def bond_metrics(
+    schedule: CashFlowSchedule,
+    ytm: float,
+    frequency: int = 2,
+) -> tuple[float, float, float]:
+    """
+    (dirty price, modified duration, DV01) in one fused pass.
+    Equivalent to dirty_price + modified_duration + dv01, which each build
+    their own discount factor array; here P and dP/dy come from a single
+    traversal and both risk measures are derived from them.
+    """
+    return bond_metrics_arrays(
+        schedule.times, schedule.amounts, ytm, frequency,
+        scaled_times=schedule.scaled_for(frequency),
+    )
+
+
+def bond_metrics_arrays(
+    times: np.ndarray,
+    amounts: np.ndarray,
+    ytm: float,
+    frequency: int = 2,
+    scaled_times: np.ndarray | None = None,
+) -> tuple[float, float, float]:
+    """
+    bond_metrics on bare (times, amounts) arrays — the hot-path entry point.
+    No CashFlowSchedule is needed; pass scaled_times (= times × frequency)
+    when it is already at hand.
+    """
+    if NUMBA_AVAILABLE and len(times) > _JIT_MIN_CASHFLOWS:
+        pv, dp_dy = price_and_derivative_jit(times, amounts, ytm, frequency)
+    else:
+        pv, dp_dy = _price_and_derivative(
+            amounts, times, ytm, frequency=frequency, scaled_times=scaled_times,
+        )
+    if pv == 0:
+        raise ValueError("Bond PV is zero — check cash flow schedule")
+    return pv, -dp_dy / pv, -dp_dy * 0.0001
+
+
+def dirty_prices_vec(
+    schedule: CashFlowSchedule,
+    ytms: np.ndarray,
+    frequency: int = 2,
+) -> np.ndarray:
+    """
+    Dirty prices of one schedule at K yields in a single 2D kernel.
+    Builds the (K, M) discount factor matrix by broadcasting, then one
+    matrix-vector product (BLAS gemv) instead of K Python-level calls.
+    Use for rate shocks, scenario grids and DV01 sweeps.
+    """
+    return _discount_matrix(schedule, ytms, frequency) @ schedule.amounts
+
+
+def price_sensitivities_vec(
+    schedule: CashFlowSchedule,
+    ytms: np.ndarray,
+    frequency: int = 2,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    (dirty prices, dP/dy) at K yields from one (K, M) discount factor matrix.
+    Modified duration (-dP/dy / P) and DV01 (-dP/dy × 1bp) follow from these
+    without recomputing discount factors.
+    """
+    ytms = np.asarray(ytms, dtype=np.float64)
+    df = _discount_matrix(schedule, ytms, frequency)
+    prices = df @ schedule.amounts
+    dp_dy = -(df @ (schedule.amounts * schedule.times)) / (1.0 + ytms / frequency)
+    return prices, dp_dy
+
+
+def _discount_matrix(
+    schedule: CashFlowSchedule,
+    ytms: np.ndarray,
+    frequency: int,
+) -> np.ndarray:
+    """(K, M) discount factors for K yields × M cash flows, via exp/log1p."""
+    ytms = np.asarray(ytms, dtype=np.float64)
+    scaled = schedule.scaled_for(frequency)
+    if scaled is None:
+        scaled = schedule.times * frequency
+    log_terms = np.log1p(ytms / frequency)[:, None]
+    return np.exp(-log_terms * scaled[None, :])
+
+
+@dataclass(slots=True)
+class PortfolioSchedule:
+    """
+    Structure-of-arrays cash flows for N bonds, zero-padded to M columns.
+    Padding slots carry amount 0 and time 0, so they contribute nothing
+    to any PV sum and need no separate validity mask.
+    """
+    times: np.ndarray        # (N, M) year fractions
+    amounts: np.ndarray      # (N, M) cash flow amounts, 0 in padding
+    frequencies: np.ndarray  # (N,) compounding frequency per bond
+    lengths: np.ndarray      # (N,) real cash flows per row
+
+
+def stack_schedules(
+    schedules: list[CashFlowSchedule],
+    frequencies: list[int] | np.ndarray,
+    dtype: np.dtype | type = np.float64,
+) -> PortfolioSchedule:
+    """
+    One-time packing of per-bond schedules into padded (N, M) matrices.
+    dtype=np.float32 halves the bytes the bandwidth-bound reprice streams;
+    PV error stays around 1e-7 relative — far below bp-level sensitivity.
+    """
+    n = len(schedules)
+    lengths = np.fromiter((len(s.times) for s in schedules), dtype=np.int64, count=n)
+    width = int(lengths.max()) if n else 0
+    times = np.zeros((n, width), dtype=dtype)
+    amounts = np.zeros((n, width), dtype=dtype)
+    for i, s in enumerate(schedules):
+        m = lengths[i]
+        times[i, :m] = s.times
+        amounts[i, :m] = s.amounts
+    return PortfolioSchedule(
+        times=times,
+        amounts=amounts,
+        frequencies=np.asarray(frequencies, dtype=np.float64),
+        lengths=lengths,
+    )
+
+
+def portfolio_dirty_prices(portfolio: PortfolioSchedule, ytms: np.ndarray) -> np.ndarray:
+    """
+    Dirty prices of all N bonds (one YTM each) in one broadcast:
+    df = exp(-k·T·log1p(y/k)) over the (N, M) matrix, then a row-wise
+    Σ A·df. Replaces N per-bond calls with a handful of array ops.
+    Per-bond rates are computed in float64 before the matrix step.
+    """
+    k = portfolio.frequencies
+    rate = (k * np.log1p(np.asarray(ytms, dtype=np.float64) / k))[:, None]
+    # Matrix work runs in the storage dtype; prices come back as float64
+    df = np.exp(-rate.astype(portfolio.times.dtype) * portfolio.times)
+    return np.einsum("ij,ij->i", df, portfolio.amounts).astype(np.float64)
+
+
+def _price_and_derivative(
+    amounts: np.ndarray,
+    times: np.ndarray,
+    ytm: float,
+    frequency: int = 2,
+    scaled_times: np.ndarray | None = None,
+) -> tuple[float, float]:
+    """
+    Fused kernel: (dirty price, dP/dy) from one discount factor pass.
+    Closed form dP/dy = -Σ tᵢ·CFᵢ·dfᵢ / (1 + y/k), which equals
+    -modified_duration × P without the duration → discount_factors chain.
+    """
+    df = discount_factors(times, ytm, frequency=frequency, scaled_times=scaled_times)
+    pv = float(np.vdot(amounts, df))
+    dp_dy = -float(np.vdot(times, amounts * df)) / (1.0 + ytm / frequency)
+    return pv, dp_dy
 
 
 def solve_ytm(
@@ -144,11 +332,14 @@ def solve_ytm(
     max_iter: int = 50,
 ) -> float:
     """
-    Newton-Raphson YTM solver with explicit bracketing and bisection fallback.
+    Halley (second-order Newton-Raphson) YTM solver with explicit bracketing
+    and bisection fallback.
     
     Why NR over scipy.optimize?
-    - We own the derivative (duration) analytically — no finite difference needed
-    - NR converges quadratically once near the root (vs bisection's linear)
+    - We own both derivatives analytically — no finite difference needed
+    - Halley's step y -= 2ff' / (2f'^2 - ff'') converges cubically near the
+      root (vs plain NR's quadratic, bisection's linear); P'' is closed form:
+      Σ aᵢ·tᵢ·(tᵢ + 1/k)·dfᵢ / (1 + y/k)²
     - Explicit fallback: if |step| > 0.5 or we diverge, bisect instead
     
     Returns: YTM as decimal (e.g., 0.0423 for 4.23%)
@@ -174,24 +365,57 @@ def solve_ytm(
     r = (annual_coupon + (approx_par - target_price) / years) / ((approx_par + target_price) / 2.0)
     r = max(r_low + 0.001, min(r, r_high - 0.001))
 
-    # ── Newton-Raphson with bisection fallback ───────────────────────
+    if NUMBA_AVAILABLE and len(schedule.times) > _JIT_MIN_CASHFLOWS:
+        r, converged, error = solve_ytm_jit(
+            schedule.times, schedule.amounts, target_price, frequency,
+            r, r_low, r_high, tol, max_iter,
+        )
+        if converged:
+            return r
+        raise RuntimeError(
+            f"YTM solver did not converge after {max_iter} iterations. "
+            f"Final error: {error:.2e}. Check cash flow schedule."
+        )
+
+    # ── Halley iteration with bisection fallback ─────────────────────
+    # Loop invariants bound once: -k·t, a·t and a·t·(t + 1/k) never change
+    # across iterates, so each step is one exp plus three dot products.
+    # The (P, P', P'') evaluated at the new r drives both the bracket update
+    # and the next step.
+    scaled_times = schedule.scaled_for(frequency)
+    neg_kt = -(scaled_times if scaled_times is not None else schedule.times * frequency)
+    amounts = schedule.amounts
+    amounts_t = amounts * schedule.times
+    amounts_tt = amounts_t * (schedule.times + 1.0 / frequency)
+    log1p = math.log1p
+
+    def price_and_slopes(y: float) -> tuple[float, float, float]:
+        base = 1.0 + y / frequency
+        df = np.exp(neg_kt * log1p(y / frequency))
+        return (
+            float(np.vdot(amounts, df)),
+            -float(np.vdot(amounts_t, df)) / base,
+            float(np.vdot(amounts_tt, df)) / (base * base),
+        )
+
+    p, dp_dr, d2p_dr2 = price_and_slopes(r)
     for iteration in range(max_iter):
-        p = dirty_price(schedule, r, frequency=frequency)
         error = p - target_price
 
         if abs(error) < tol:
             return r
 
-        # Analytical derivative: dP/dr = -modified_duration × P × (1 + r/freq)
-        # Equivalently: use duration * price directly
-        md = modified_duration(schedule, r, frequency=frequency)
-        dp_dr = -md * p
-
         if abs(dp_dr) < 1e-12:
             # Derivative too flat — fall back to bisection
             r = (r_low + r_high) / 2.0
         else:
-            step = error / dp_dr
+            # Halley step; fall back to the Newton step when the second-order
+            # correction would shrink the denominator below f'^2
+            denom = 2.0 * dp_dr * dp_dr - error * d2p_dr2
+            if denom > dp_dr * dp_dr:
+                step = 2.0 * error * dp_dr / denom
+            else:
+                step = error / dp_dr
             r_new = r - step
 
             # If NR step leaves bracket or is too large, bisect instead
@@ -201,8 +425,8 @@ def solve_ytm(
             r = r_new
 
         # Update bracket
-        p_current = dirty_price(schedule, r, frequency=frequency)
-        if p_current > target_price:
+        p, dp_dr, d2p_dr2 = price_and_slopes(r)
+        if p > target_price:
             r_low = r
         else:
             r_high = r
@@ -0,0 +1,113 @@
+"""
+Numba-compiled YTM solver kernels.
+The Newton-Raphson loop is dominated by NumPy dispatch overhead on short
+schedules; compiled scalar loops remove it. Falls back to plain Python
+(same results, no speedup) when numba is not installed.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover — exercised only without numba
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):  # type: ignore[no-redef]
+        """No-op stand-in for numba.njit."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
+
+
+@njit(cache=True, fastmath=True)
+def price_and_derivative_jit(
+    times: np.ndarray,
+    amounts: np.ndarray,
+    ytm: float,
+    frequency: int,
+) -> tuple[float, float]:
+    """(dirty price, dP/dy) in one scalar loop over the cash flows."""
+    base = 1.0 + ytm / frequency
+    pv = 0.0
+    time_weighted = 0.0
+    for i in range(times.shape[0]):
+        disc = amounts[i] * base ** (-times[i] * frequency)
+        pv += disc
+        time_weighted += times[i] * disc
+    return pv, -time_weighted / base
+
+
+@njit(cache=True, fastmath=True)
+def price_derivatives_jit(
+    times: np.ndarray,
+    amounts: np.ndarray,
+    ytm: float,
+    frequency: int,
+) -> tuple[float, float, float]:
+    """(dirty price, dP/dy, d²P/dy²) in one scalar loop over the cash flows."""
+    base = 1.0 + ytm / frequency
+    inv_k = 1.0 / frequency
+    pv = 0.0
+    time_weighted = 0.0
+    convexity_weighted = 0.0
+    for i in range(times.shape[0]):
+        t = times[i]
+        disc = amounts[i] * base ** (-t * frequency)
+        pv += disc
+        time_weighted += t * disc
+        convexity_weighted += t * (t + inv_k) * disc
+    return pv, -time_weighted / base, convexity_weighted / (base * base)
+
+
+@njit(cache=True, fastmath=True)
+def solve_ytm_jit(
+    times: np.ndarray,
+    amounts: np.ndarray,
+    target_price: float,
+    frequency: int,
+    r: float,
+    r_low: float,
+    r_high: float,
+    tol: float,
+    max_iter: int,
+) -> tuple[float, bool, float]:
+    """
+    Halley iteration with bisection fallback — same algorithm as
+    bond_math.solve_ytm, starting from an already-bracketed guess.
+    Returns (ytm, converged, final_error).
+    """
+    error = np.nan
+    p, dp_dr, d2p_dr2 = price_derivatives_jit(times, amounts, r, frequency)
+    for _ in range(max_iter):
+        error = p - target_price
+
+        if abs(error) < tol:
+            return r, True, error
+
+        # Branchless step selection and bracket update: the solver zigzags,
+        # so these predicates are unpredictable; arithmetic selects compile
+        # to conditional moves instead of mispredicted jumps.
+        r_mid = (r_low + r_high) * 0.5
+        flat = abs(dp_dr) < 1e-12
+        # Halley denominator, replaced by the Newton one (2f'^2) when the
+        # second-order term would shrink it below f'^2; +flat keeps it nonzero
+        denom = 2.0 * dp_dr * dp_dr - error * d2p_dr2
+        halley = np.float64(denom > dp_dr * dp_dr)
+        denom = halley * denom + (1.0 - halley) * 2.0 * dp_dr * dp_dr
+        step = 2.0 * error * dp_dr / (denom + np.float64(flat))
+        r_new = r - step
+        use_bisect = np.float64(
+            flat | (r_new <= r_low) | (r_new >= r_high) | (abs(step) > 0.5)
+        )
+        r = use_bisect * r_mid + (1.0 - use_bisect) * r_new
+
+        # Price at the new r serves the bracket update and the next step
+        p, dp_dr, d2p_dr2 = price_derivatives_jit(times, amounts, r, frequency)
+        sel = np.float64(p > target_price)
+        r_low = sel * r + (1.0 - sel) * r_low
+        r_high = sel * r_high + (1.0 - sel) * r
+
+    return r, False, error
@@ -5,18 +5,23 @@ This is the public interface the rest of the engine calls.
 
 from __future__ import annotations
 
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import date, timedelta
 import numpy as np
 
-from .day_count import DayCount, year_fractions_vectorized, year_fraction
+from .day_count import DayCount, _is_leap, year_fractions_vectorized, year_fraction
 from .bond_math import (
     CashFlowSchedule,
-    dirty_price,
+    PortfolioSchedule,
+    bond_metrics,
+    bond_metrics_arrays,
     clean_price,
     accrued_interest,
-    dv01,
-    modified_duration,
+    portfolio_dirty_prices,
+    price_sensitivities_vec,
+    stack_schedules,
     solve_ytm,
     future_value,
     present_value,
@@ -51,35 +56,64 @@ class PriceResult:
     solver_converged: bool
 
 
+@dataclass(slots=True)
+class PriceBatch:
+    """One bond priced at K yields. Arrays are aligned with `ytm`."""
+    settlement: date
+    ytm: np.ndarray
+    dirty: np.ndarray
+    clean: np.ndarray
+    accrued: float
+    modified_dur: np.ndarray
+    dv01_per_face: np.ndarray
+
+
+_DAYS_IN_MONTH = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+# Coupon frequency → months per period for the standard schedules
+_MONTHS_PER_PERIOD = {1: 12, 2: 6, 3: 4, 4: 3, 6: 2, 12: 1}
+
+
+def _month_length(year: int, month: int) -> int:
+    if month == 2 and _is_leap(year):
+        return 29
+    return _DAYS_IN_MONTH[month]
+
+
+def _months_per_period(frequency: int) -> int:
+    months = _MONTHS_PER_PERIOD.get(frequency)
+    return months if months is not None else 12 // frequency
+
+
 def _generate_coupon_dates(spec: BondSpec, settlement: date) -> list[date]:
     """
     Walk backward from maturity to generate all future coupon dates.
     This correctly handles irregular stub periods at the front.
+
+    Steps over an absolute month index (year × 12 + month) with one divmod
+    per period, appends and reverses once (no O(n²) insert(0)), and clamps
+    end-of-month days from a lookup table instead of catching ValueError.
+    Clamping is sticky: once Aug 31 becomes Feb 28, earlier dates keep 28.
     """
-    months_per_period = 12 // spec.frequency
-    dates: list[date] = [spec.maturity_date]
-    current = spec.maturity_date
+    months_per_period = _months_per_period(spec.frequency)
+    maturity = spec.maturity_date
+    month_index = maturity.year * 12 + maturity.month - 1
+    day = maturity.day
+    dates: list[date] = [maturity]
 
     while True:
-        # Step back by coupon period
-        month = current.month - months_per_period
-        year = current.year
-        while month <= 0:
-            month += 12
-            year -= 1
-        try:
-            prev = date(year, month, current.day)
-        except ValueError:
-            # Handle end-of-month: e.g., Feb 28/29
-            import calendar
-            last_day = calendar.monthrange(year, month)[1]
-            prev = date(year, month, last_day)
-
+        month_index -= months_per_period
+        year, month0 = divmod(month_index, 12)
+        month_len = _month_length(year, month0 + 1)
+        if month_len < day:
+            day = month_len
+        prev = date(year, month0 + 1, day)
         if prev <= settlement:
             break
-        dates.insert(0, prev)
-        current = prev
+        dates.append(prev)
 
+    dates.reverse()
     return dates
 
 
@@ -102,19 +136,14 @@ def build_schedule(spec: BondSpec, settlement: date) -> tuple[CashFlowSchedule,
 
     # Accrued interest calculation
     # Find last coupon date (the coupon date just before settlement)
-    months_per_period = 12 // spec.frequency
+    months_per_period = _months_per_period(spec.frequency)
     first_future_coupon = coupon_dates[0]
-    month = first_future_coupon.month - months_per_period
-    year = first_future_coupon.year
-    while month <= 0:
-        month += 12
-        year -= 1
-    try:
-        last_coupon_date = date(year, month, first_future_coupon.day)
-    except ValueError:
-        import calendar
-        last_day = calendar.monthrange(year, month)[1]
-        last_coupon_date = date(year, month, last_day)
+    year, month0 = divmod(
+        first_future_coupon.year * 12 + first_future_coupon.month - 1 - months_per_period, 12
+    )
+    # EOM clamp from the month-length table (no ValueError / calendar import)
+    day = min(first_future_coupon.day, _month_length(year, month0 + 1))
+    last_coupon_date = date(year, month0 + 1, day)
 
     days_since = (settlement - last_coupon_date).days
     days_in_period = (first_future_coupon - last_coupon_date).days
@@ -126,16 +155,43 @@ def build_schedule(spec: BondSpec, settlement: date) -> tuple[CashFlowSchedule,
         amounts=amounts,
         coupon_dates=coupon_dates,
         settlement=settlement,
+        frequency=spec.frequency,
     )
     return schedule, accr
 
 
 class BondPricer:
     """
-    Production bond pricer. Stateless — safe to call from multiple threads.
-    Caches schedule per (cusip, settlement) for portfolio repricing efficiency.
+    Production bond pricer. Safe to call from multiple threads.
+    Caches schedule per (cusip, settlement) for portfolio repricing efficiency:
+    the schedule is invariant under YTM, so repricing the same bond (DV01
+    sweeps, market ticks) skips the date walk and day-count pass.
     """
 
+    def __init__(self, max_cached_schedules: int = 16_384) -> None:
+        self._max_cached = max_cached_schedules
+        self._schedule_cache: OrderedDict[tuple, tuple[CashFlowSchedule, float]] = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+    def _schedule(self, spec: BondSpec, settlement: date) -> tuple[CashFlowSchedule, float]:
+        """LRU-cached build_schedule keyed on every schedule-determining field."""
+        key = (
+            spec.cusip, settlement, spec.maturity_date, spec.frequency,
+            spec.day_count, spec.face_value, spec.coupon_rate,
+        )
+        with self._cache_lock:
+            hit = self._schedule_cache.get(key)
+            if hit is not None:
+                self._schedule_cache.move_to_end(key)
+                return hit
+
+        built = build_schedule(spec, settlement)
+        with self._cache_lock:
+            self._schedule_cache[key] = built
+            if len(self._schedule_cache) > self._max_cached:
+                self._schedule_cache.popitem(last=False)
+        return built
+
     def price(
         self,
         spec: BondSpec,
@@ -146,11 +202,13 @@ class BondPricer:
         if settlement is None:
             settlement = date.today() + timedelta(days=2)  # T+2 settlement
 
-        schedule, accr = build_schedule(spec, settlement)
-        dp = dirty_price(schedule, ytm, frequency=spec.frequency)
+        schedule, accr = self._schedule(spec, settlement)
+        # Schedules are built at spec.frequency, so scaled_times always applies
+        dp, md, dv = bond_metrics_arrays(
+            schedule.times, schedule.amounts, ytm, spec.frequency,
+            schedule.scaled_times,
+        )
         cp = dp - accr
-        md = modified_duration(schedule, ytm, frequency=spec.frequency)
-        dv = dv01(schedule, ytm, face=spec.face_value, frequency=spec.frequency)
 
         return PriceResult(
             settlement=settlement,
@@ -163,6 +221,55 @@ class BondPricer:
             solver_converged=True,
         )
 
+    def price_batch(
+        self,
+        spec: BondSpec,
+        ytms: np.ndarray,
+        settlement: date | None = None,
+    ) -> PriceBatch:
+        """
+        Price one bond at many YTMs (DV01 sweeps, scenario grids).
+        The schedule is built once; prices, durations and DV01s all come
+        from a single (n_ytm, n_cashflow) discount factor matrix.
+        """
+        if settlement is None:
+            settlement = date.today() + timedelta(days=2)
+
+        ytms = np.asarray(ytms, dtype=np.float64)
+        schedule, accr = self._schedule(spec, settlement)
+        dirty, dp_dy = price_sensitivities_vec(schedule, ytms, frequency=spec.frequency)
+
+        return PriceBatch(
+            settlement=settlement,
+            ytm=ytms,
+            dirty=dirty,
+            clean=dirty - accr,
+            accrued=accr,
+            modified_dur=-dp_dy / dirty,
+            dv01_per_face=-dp_dy * 0.0001,
+        )
+
+    def build_portfolio(
+        self,
+        specs: list[BondSpec],
+        settlement: date | None = None,
+        dtype: np.dtype | type = np.float64,
+    ) -> PortfolioSchedule:
+        """
+        Pack many bonds into one structure-of-arrays schedule (setup cost,
+        paid once). Reprice it with price_portfolio at any YTM vector.
+        Pass dtype=np.float32 for bandwidth-bound portfolio sweeps.
+        """
+        if settlement is None:
+            settlement = date.today() + timedelta(days=2)
+        schedules = [self._schedule(spec, settlement)[0] for spec in specs]
+        return stack_schedules(schedules, [spec.frequency for spec in specs], dtype=dtype)
+
+    @staticmethod
+    def price_portfolio(portfolio: PortfolioSchedule, ytms: np.ndarray) -> np.ndarray:
+        """Dirty price per bond, one YTM per bond, in a single broadcast."""
+        return portfolio_dirty_prices(portfolio, ytms)
+
     def price_from_market(
         self,
         spec: BondSpec,
@@ -173,7 +280,7 @@ class BondPricer:
         if settlement is None:
             settlement = date.today() + timedelta(days=2)
 
-        schedule, accr = build_schedule(spec, settlement)
+        schedule, accr = self._schedule(spec, settlement)
         target_dirty = market_clean_price + accr
 
         converged = True
@@ -183,9 +290,7 @@ class BondPricer:
             converged = False
             ytm = spec.coupon_rate  # Fallback to coupon rate
 
-        dp = dirty_price(schedule, ytm, frequency=spec.frequency)
-        md = modified_duration(schedule, ytm, frequency=spec.frequency)
-        dv = dv01(schedule, ytm, face=spec.face_value, frequency=spec.frequency)
+        dp, md, dv = bond_metrics(schedule, ytm, frequency=spec.frequency)
 
         return PriceResult(
             settlement=settlement,
@@ -7,6 +7,7 @@ from __future__ import annotations
 
 import time
 from datetime import date, timedelta
+from functools import lru_cache
 
 import numpy as np
 from rich.console import Console
@@ -67,29 +68,41 @@ SAMPLE_BONDS: list[tuple[str, BondSpec, float]] = [
 ]
 
 
-def make_pricing_table(tick: int) -> Table:
-    """Main pricing table — updates each tick with slightly varying YTMs."""
-    table = Table(
-        title=f"[bold cyan]Bond Pricer — Tick {tick:04d}[/bold cyan]",
-        box=box.ROUNDED,
-        border_style="cyan",
-        show_lines=True,
-    )
-    table.add_column("Bond", style="bold white", width=10)
-    table.add_column("YTM", justify="right", style="yellow")
-    table.add_column("Clean Price", justify="right", style="green")
-    table.add_column("Dirty Price", justify="right", style="green")
-    table.add_column("Accrued", justify="right", style="blue")
-    table.add_column("Mod. Dur", justify="right", style="magenta")
-    table.add_column("DV01", justify="right", style="red")
+# Per-tick YTM drift, drawn once up front instead of one RNG call per tick.
+_NOISE_SIGMA = 0.0005
 
-    # Simulate minor YTM drift
-    noise = np.random.normal(0, 0.0005)
 
+def make_noise_buffer(n_ticks: int, seed: int = 0) -> np.ndarray:
+    """Pre-generated YTM noise; tick i uses buf[i % len(buf)]."""
+    return np.random.default_rng(seed).normal(0.0, _NOISE_SIGMA, size=max(n_ticks, 1))
+
+
+_DEFAULT_NOISE = make_noise_buffer(256)
+
+
+_PRICING_COLUMNS: tuple[tuple[str, dict], ...] = (
+    ("Bond", {"style": "bold white", "width": 10}),
+    ("YTM", {"justify": "right", "style": "yellow"}),
+    ("Clean Price", {"justify": "right", "style": "green"}),
+    ("Dirty Price", {"justify": "right", "style": "green"}),
+    ("Accrued", {"justify": "right", "style": "blue"}),
+    ("Mod. Dur", {"justify": "right", "style": "magenta"}),
+    ("DV01", {"justify": "right", "style": "red"}),
+)
+
+
+def _pricing_title(tick: int) -> str:
+    return f"[bold cyan]Bond Pricer — Tick {tick:04d}[/bold cyan]"
+
+
+def _pricing_cells(tick: int, noise_buf: np.ndarray) -> list[list[str]]:
+    """Formatted row values (one list per bond) for this tick's YTM drift."""
+    noise = float(noise_buf[tick % len(noise_buf)])
+    rows: list[list[str]] = []
     for label, spec, base_ytm in SAMPLE_BONDS:
         ytm = base_ytm + noise
         result = pricer.price(spec, ytm)
-        table.add_row(
+        rows.append([
             label,
             f"{ytm:.4%}",
             f"{result.clean:>9.4f}",
@@ -97,27 +110,73 @@ def make_pricing_table(tick: int) -> Table:
             f"{result.accrued:>7.4f}",
             f"{result.modified_dur:>6.3f}",
             f"${result.dv01_per_face:>6.4f}",
-        )
+        ])
+    return rows
+
+
+def make_pricing_table(tick: int, noise_buf: np.ndarray | None = None) -> Table:
+    """Main pricing table — updates each tick with slightly varying YTMs."""
+    table = Table(
+        title=_pricing_title(tick),
+        box=box.ROUNDED,
+        border_style="cyan",
+        show_lines=True,
+    )
+    for header, opts in _PRICING_COLUMNS:
+        table.add_column(header, **opts)
+
+    # Simulate minor YTM drift
+    for row in _pricing_cells(tick, _DEFAULT_NOISE if noise_buf is None else noise_buf):
+        table.add_row(*row)
 
     return table
 
 
+class _PricingView:
+    """
+    Pricing table built once; each tick rewrites only the cells whose
+    formatted value changed (the Bond column never does).
+    """
+
+    def __init__(self, noise_buf: np.ndarray) -> None:
+        self.noise_buf = noise_buf
+        self.table = make_pricing_table(0, noise_buf)
+        self._cells = [column._cells for column in self.table.columns]
+
+    def update(self, tick: int) -> None:
+        self.table.title = _pricing_title(tick)
+        for r, row in enumerate(_pricing_cells(tick, self.noise_buf)):
+            for c in range(1, len(row)):
+                if self._cells[c][r] != row[c]:
+                    self._cells[c][r] = row[c]
+
+
+_DV01_POINTS = 21
+_DV01_BAR_WIDTH = 30
+
+
+@lru_cache(maxsize=8)
+def _dv01_templates(ytm_base: float) -> tuple[np.ndarray, tuple[str, ...]]:
+    """Sweep YTMs plus per-row format strings; only bar and DV01 vary."""
+    ytms = np.linspace(ytm_base - 0.02, ytm_base + 0.02, _DV01_POINTS)
+    templates = []
+    for y in ytms.tolist():
+        color = "green" if y < ytm_base else "red"
+        templates.append(f"[{color}]{y:.2%}[/{color}] [{color}]{{bar}}[/{color}] ${{dv01:.4f}}")
+    return ytms, tuple(templates)
+
+
 def make_dv01_bar(ytm_base: float, spec: BondSpec) -> Panel:
     """ASCII bar chart of DV01 sensitivity across YTM range."""
-    ytms = np.linspace(ytm_base - 0.02, ytm_base + 0.02, 21)
-    dv01s = []
-    for y in ytms:
-        r = pricer.price(spec, y)
-        dv01s.append(r.dv01_per_face)
+    ytms, templates = _dv01_templates(ytm_base)
+    dv01s = pricer.price_batch(spec, ytms).dv01_per_face.tolist()
 
     max_dv01 = max(dv01s)
-    bar_width = 30
     lines: list[str] = []
-    for y, d in zip(ytms, dv01s):
-        filled = int((d / max_dv01) * bar_width)
-        bar = "█" * filled + "░" * (bar_width - filled)
-        color = "green" if y < ytm_base else "red"
-        lines.append(f"[{color}]{y:.2%}[/{color}] [{color}]{bar}[/{color}] ${d:.4f}")
+    for template, d in zip(templates, dv01s):
+        filled = int((d / max_dv01) * _DV01_BAR_WIDTH)
+        bar = "█" * filled + "░" * (_DV01_BAR_WIDTH - filled)
+        lines.append(template.format(bar=bar, dv01=d))
 
     content = "\n".join(lines)
     return Panel(content, title="[bold]DV01 Sensitivity — 10Y UST[/bold]", border_style="blue")
@@ -132,6 +191,7 @@ def run_dashboard(duration_seconds: int = 30) -> None:
     )
 
     _, spec_10y, ytm_10y = SAMPLE_BONDS[1]
+    noise_buf = make_noise_buffer(duration_seconds * 2 + 1)
 
     console.print(
         Panel(
@@ -141,11 +201,21 @@ def run_dashboard(duration_seconds: int = 30) -> None:
         )
     )
 
+    # Persistent renderables: the pricing table is patched in place and the
+    # DV01 sweep (fixed spec and base YTM) only changes with the settlement day
+    view = _PricingView(noise_buf)
+    layout["table"].update(view.table)
+    dv01_day = date.today()
+    layout["dv01"].update(make_dv01_bar(ytm_10y, spec_10y))
+
     tick = 0
-    with Live(layout, refresh_per_second=2, console=console) as live:
+    with Live(layout, auto_refresh=False, console=console) as live:
         start = time.time()
         while time.time() - start < duration_seconds:
-            layout["table"].update(make_pricing_table(tick))
-            layout["dv01"].update(make_dv01_bar(ytm_10y, spec_10y))
+            view.update(tick)
+            if date.today() != dv01_day:
+                dv01_day = date.today()
+                layout["dv01"].update(make_dv01_bar(ytm_10y, spec_10y))
+            live.refresh()
             time.sleep(0.5)
             tick += 1
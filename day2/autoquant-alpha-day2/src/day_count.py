@@ -7,6 +7,7 @@ Supported: 30/360 (US Bond), Act/360, Act/365, Act/Act (ISDA)
 from __future__ import annotations
 from datetime import date
 from enum import Enum, auto
+from functools import lru_cache
 import numpy as np
 
 
@@ -46,25 +47,41 @@ def _days_act_act_isda(d1: date, d2: date) -> float:
     """
     Act/Act ISDA: split across year boundaries.
     Critical for multi-year instruments — simple Act/365 is wrong here.
-    """
-    if d1.year == d2.year:
-        days_in_year = 366.0 if _is_leap(d1.year) else 365.0
-        return (d2 - d1).days / days_in_year
 
-    # Split at year boundary
-    end_of_year = date(d1.year, 12, 31)
-    start_of_next = date(d1.year + 1, 1, 1)
+    Iterative over the year span: first-year remainder (to Dec 31), each
+    intermediate year's Jan 1 → Dec 31 share, then the final-year prefix,
+    with year lengths from the precomputed table.
+    """
+    y1, y2 = d1.year, d2.year
+    if y1 == y2:
+        return (d2 - d1).days / _days_in_year(y1)
 
-    frac_first = (end_of_year - d1).days / (366.0 if _is_leap(d1.year) else 365.0)
-    # Recurse for remaining years
-    frac_rest = _days_act_act_isda(start_of_next, d2)
-    return frac_first + frac_rest
+    frac = (date(y1, 12, 31) - d1).days / _days_in_year(y1)
+    for year in range(y1 + 1, y2):
+        n = _days_in_year(year)
+        frac += (n - 1.0) / n
+    return frac + (d2 - date(y2, 1, 1)).days / _days_in_year(y2)
 
 
+@lru_cache(maxsize=None)
 def _is_leap(year: int) -> bool:
     return (year % 4 == 0 and year % 100 != 0) or (year % 400 == 0)
 
 
+# Year lengths precomputed over any plausible bond horizon; years outside
+# the table fall back to the modulo rule.
+_YEAR_LEN: dict[int, float] = {
+    y: 366.0 if _is_leap(y) else 365.0 for y in range(1900, 2200)
+}
+
+
+def _days_in_year(year: int) -> float:
+    n = _YEAR_LEN.get(year)
+    if n is None:
+        return 366.0 if _is_leap(year) else 365.0
+    return n
+
+
 # Dispatch table — avoids if/elif chains in hot paths
 _CONVENTION_FN = {
     DayCount.THIRTY_360: _days_30_360,
@@ -85,6 +102,54 @@ def year_fraction(
     return _CONVENTION_FN[convention](start, end)
 
 
+def _jan1_ordinal(years: np.ndarray) -> np.ndarray:
+    """Proleptic Gregorian ordinal of Jan 1 of each year (date.toordinal)."""
+    y = years - 1
+    return 365 * y + y // 4 - y // 100 + y // 400 + 1
+
+
+def _year_length(years: np.ndarray) -> np.ndarray:
+    leap = (years % 4 == 0) & ((years % 100 != 0) | (years % 400 == 0))
+    return np.where(leap, 366.0, 365.0)
+
+
+def _vec_30_360(settlement: date, coupon_dates: list[date]) -> np.ndarray:
+    ymd = np.array([(d.year, d.month, d.day) for d in coupon_dates], dtype=np.int64)
+    y2, m2, dd2 = ymd[:, 0], ymd[:, 1], ymd[:, 2]
+    dd1 = 30 if settlement.day == 31 else settlement.day
+    if dd1 == 30:
+        dd2 = np.where(dd2 == 31, 30, dd2)
+    return (
+        360 * (y2 - settlement.year) + 30 * (m2 - settlement.month) + (dd2 - dd1)
+    ) / 360.0
+
+
+def _vec_act_act_isda(settlement: date, coupon_dates: list[date]) -> np.ndarray:
+    """
+    Closed form of the year-by-year split in _days_act_act_isda:
+    first-year remainder + a prefix sum over whole intermediate years
+    + the final-year prefix, each over its own year length.
+    """
+    y1 = settlement.year
+    yo = np.array([(d.year, d.toordinal()) for d in coupon_dates], dtype=np.int64)
+    y2, ends = yo[:, 0], yo[:, 1]
+    len_y1 = _days_in_year(y1)
+
+    # Same year: plain Act / year length
+    same_year = (ends - settlement.toordinal()) / len_y1
+
+    # Split years: mirrors the recursion term for term, including its
+    # Dec-31 boundary, so scalar and vectorized results agree exactly.
+    span = np.arange(y1, max(int(y2.max()), y1) + 1, dtype=np.int64)
+    lengths = _year_length(span)
+    mid_terms = np.concatenate(([0.0], np.cumsum((lengths - 1.0) / lengths)))
+    offset = y2 - y1
+    first = (date(y1, 12, 31) - settlement).days / len_y1
+    mid = mid_terms[offset] - mid_terms[np.minimum(offset, 1)]
+    last = (ends - _jan1_ordinal(y2)) / lengths[offset]
+    return np.where(offset == 0, same_year, first + mid + last)
+
+
 def year_fractions_vectorized(
     settlement: date,
     coupon_dates: list[date],
@@ -93,6 +158,17 @@ def year_fractions_vectorized(
     """
     Vectorized year fractions from settlement to each coupon date.
     Returns float64 array — feed directly into discount factor computation.
+
+    Dates are read once into integer arrays (ordinals / year-month-day);
+    every convention is then plain array arithmetic — no per-date calls
+    into the scalar convention functions.
     """
-    fn = _CONVENTION_FN[convention]
-    return np.array([fn(settlement, cd) for cd in coupon_dates], dtype=np.float64)
+    if not coupon_dates:
+        return np.empty(0, dtype=np.float64)
+    if convention is DayCount.ACT_360 or convention is DayCount.ACT_365:
+        ordinals = np.array([d.toordinal() for d in coupon_dates], dtype=np.int64)
+        day_diff = ordinals - settlement.toordinal()
+        return day_diff / (360.0 if convention is DayCount.ACT_360 else 365.0)
+    if convention is DayCount.THIRTY_360:
+        return _vec_30_360(settlement, coupon_dates)
+    return _vec_act_act_isda(settlement, coupon_dates)
@@ -5,10 +5,14 @@ Target: < 2 seconds wall time on commodity hardware.
 
 from __future__ import annotations
 
+import math
+import os
 import time
 import random
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date, timedelta
+from itertools import repeat
 from rich.console import Console
 
 from src.bond_pricer import BondSpec, BondPricer
@@ -37,29 +41,101 @@ def generate_random_bond(seed: int) -> tuple[BondSpec, float]:
     return spec, ytm
 
 
-def run_stress_test(n_bonds: int = 10_000) -> None:
-    console.print(f"[bold cyan]Stress Test: Repricing {n_bonds:,} bonds[/bold cyan]")
-    
+SpecTuple = tuple[float, float, date, date, int, str]
+
+# One pricer per process: workers keep their schedule cache across chunks.
+_PRICER = BondPricer()
+
+
+def _spec_tuple(spec: BondSpec) -> SpecTuple:
+    """Flatten a BondSpec to plain, cheaply picklable fields."""
+    return (
+        spec.face_value, spec.coupon_rate, spec.maturity_date,
+        spec.issue_date, spec.frequency, spec.day_count.value,
+    )
+
+
+def _price_spec(spec: BondSpec, ytm: float, settlement: date) -> float:
+    """Dirty price of one bond; NaN marks a pricing failure."""
+    try:
+        return _PRICER.price(spec, ytm, settlement=settlement).dirty
+    except Exception:
+        return math.nan
+
+
+def _price_one(spec_tuple: SpecTuple, ytm: float, settlement: date) -> float:
+    """Process-pool entry point: rebuild the BondSpec, then price it."""
+    face, coupon, maturity, issue, frequency, day_count = spec_tuple
+    spec = BondSpec(
+        face_value=face,
+        coupon_rate=coupon,
+        maturity_date=maturity,
+        issue_date=issue,
+        frequency=frequency,
+        day_count=DayCount(day_count),
+    )
+    return _price_spec(spec, ytm, settlement)
+
+
+def _portfolio_pass(
+    specs: list[BondSpec],
+    ytms: list[float],
+    settlement: date,
+) -> tuple[np.ndarray, float, float]:
+    """
+    Same repricing as the per-bond loop, via one structure-of-arrays
+    broadcast. Returns (prices, setup seconds, reprice seconds).
+    """
     pricer = BondPricer()
+    start = time.perf_counter()
+    # float32 storage: the reprice is memory-bound; PV error ~1e-7 relative
+    portfolio = pricer.build_portfolio(specs, settlement, dtype=np.float32)
+    ytm_arr = np.asarray(ytms, dtype=np.float64)
+    setup = time.perf_counter() - start
+
+    start = time.perf_counter()
+    prices = pricer.price_portfolio(portfolio, ytm_arr)
+    return prices, setup, time.perf_counter() - start
+
+
+def run_stress_test(n_bonds: int = 10_000, workers: int | None = None) -> None:
+    """
+    Reprice n_bonds independent bonds. Each reprice is pure, so the batch is
+    fanned out over a process pool when more than one core is available;
+    on a single core the same _price_one runs in-process (no pool overhead).
+    """
+    workers = workers or os.cpu_count() or 1
+    console.print(f"[bold cyan]Stress Test: Repricing {n_bonds:,} bonds[/bold cyan]")
+
     settlement = date.today() + timedelta(days=2)
     bonds = [generate_random_bond(i) for i in range(n_bonds)]
+    ytms = [ytm for _, ytm in bonds]
 
-    console.print(f"[dim]Generated {n_bonds:,} random bonds[/dim]")
+    console.print(f"[dim]Generated {n_bonds:,} random bonds ({workers} worker(s))[/dim]")
+
+    # Warm-up on a throwaway pricer: loads the compiled kernels without
+    # pre-populating _PRICER's schedule cache. Best effort: a bad first
+    # spec is reported by the timed loop like any other failure
+    try:
+        BondPricer().price(bonds[0][0], ytms[0], settlement=settlement)
+    except Exception:
+        pass
 
-    errors = 0
-    prices = []
-    
     start = time.perf_counter()
-    for spec, ytm in bonds:
-        try:
-            result = pricer.price(spec, ytm, settlement=settlement)
-            prices.append(result.dirty)
-        except Exception as e:
-            errors += 1
+    if workers > 1:
+        specs = [_spec_tuple(spec) for spec, _ in bonds]
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            prices = list(ex.map(_price_one, specs, ytms, repeat(settlement), chunksize=256))
+    else:
+        specs = [spec for spec, _ in bonds]
+        prices = list(map(_price_spec, specs, ytms, repeat(settlement)))
 
     elapsed = time.perf_counter() - start
 
     prices_arr = np.array(prices)
+    ok = ~np.isnan(prices_arr)
+    errors = int((~ok).sum())
+    prices_arr = prices_arr[ok]
     throughput = (n_bonds - errors) / elapsed
 
     console.print(f"[bold]Results:[/bold]")
@@ -67,8 +143,21 @@ def run_stress_test(n_bonds: int = 10_000) -> None:
     console.print(f"  Errors:          {errors:>8,}  {'[red]FAIL[/red]' if errors > 0 else '[green]PASS[/green]'}")
     console.print(f"  Wall time:       {elapsed:>8.3f}s  {'[green]PASS[/green]' if elapsed < 2.0 else '[red]SLOW[/red]'}")
     console.print(f"  Throughput:      {throughput:>8,.0f} bonds/s")
-    console.print(f"  Price range:     [{prices_arr.min():.2f}, {prices_arr.max():.2f}]")
-    console.print(f"  Mean price:      {prices_arr.mean():.4f}")
+    if prices_arr.size:
+        console.print(f"  Price range:     [{prices_arr.min():.2f}, {prices_arr.max():.2f}]")
+        console.print(f"  Mean price:      {prices_arr.mean():.4f}")
+
+    if ok.any():
+        # Only bonds the loop priced: a bad spec would make build_portfolio raise
+        keep = np.flatnonzero(ok)
+        portfolio_prices, setup_s, soa_s = _portfolio_pass(
+            [bonds[i][0] for i in keep], [ytms[i] for i in keep], settlement
+        )
+        soa_diff = float(np.abs(portfolio_prices - prices_arr).max())
+        console.print("[bold]Portfolio (SoA) reprice:[/bold]")
+        console.print(f"  Setup (stack):   {setup_s:>8.3f}s")
+        console.print(f"  Reprice:         {soa_s * 1e3:>8.2f}ms  ({keep.size / soa_s:,.0f} bonds/s)")
+        console.print(f"  Max |Δ| vs loop: {soa_diff:.2e}")
 
     if elapsed > 2.0:
         console.print("[red]WARNING: Reprice time exceeded 2s target.[/red]")
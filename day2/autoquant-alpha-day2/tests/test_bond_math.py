@@ -90,6 +90,24 @@ def test_act_act_leap_year():
     assert abs(frac - expected) < 1e-9
 
 
+def _reference_act_act_isda(d1, d2):
+    """Original recursive year split the iterative version must reproduce."""
+    n1 = 366.0 if (d1.year % 4 == 0 and d1.year % 100 != 0) or d1.year % 400 == 0 else 365.0
+    if d1.year == d2.year:
+        return (d2 - d1).days / n1
+    first = (date(d1.year, 12, 31) - d1).days / n1
+    return first + _reference_act_act_isda(date(d1.year + 1, 1, 1), d2)
+
+
+def test_act_act_isda_matches_recursive_split():
+    import random
+    rng = random.Random(3)
+    for _ in range(500):
+        d1 = date.fromordinal(rng.randint(date(1990, 1, 1).toordinal(), date(2040, 1, 1).toordinal()))
+        d2 = date.fromordinal(d1.toordinal() + rng.randint(0, 40 * 366))
+        assert _days_act_act_isda(d1, d2) == pytest.approx(_reference_act_act_isda(d1, d2), abs=1e-12)
+
+
 # ── Discount factor tests ──────────────────────────────────────────────────
 
 def test_discount_factors_monotone():
@@ -203,3 +221,212 @@ def test_longer_maturity_higher_duration():
         f"Long bond duration {r_long.modified_dur:.3f} should exceed "
         f"short bond {r_short.modified_dur:.3f}"
     )
+
+
+def test_price_and_derivative_matches_separate_calls():
+    """Fused kernel must agree with dirty_price and -modified_duration × P."""
+    from src.bond_math import _price_and_derivative, modified_duration
+
+    spec, _ = _make_par_bond()
+    schedule, _ = build_schedule(spec, date(2024, 5, 10))
+    for ytm in [0.01, 0.05, 0.12]:
+        p, dp_dr = _price_and_derivative(schedule.amounts, schedule.times, ytm)
+        expected_p = dirty_price(schedule, ytm)
+        expected_dp = -modified_duration(schedule, ytm) * expected_p
+        assert p == pytest.approx(expected_p, rel=1e-12)
+        assert dp_dr == pytest.approx(expected_dp, rel=1e-12)
+
+
+def test_jit_solver_matches_python_solver(monkeypatch):
+    """Compiled and pure-Python solver paths must recover the same YTM."""
+    import src.bond_math as bm
+
+    spec, _ = _make_par_bond()
+    schedule, _ = build_schedule(spec, date(2024, 5, 10))
+    target = dirty_price(schedule, 0.0611)
+
+    jit_ytm = bm.solve_ytm(schedule, target)
+    monkeypatch.setattr(bm, "NUMBA_AVAILABLE", False)
+    py_ytm = bm.solve_ytm(schedule, target)
+
+    assert jit_ytm == pytest.approx(0.0611, abs=1e-8)
+    assert jit_ytm == pytest.approx(py_ytm, abs=1e-8)
+
+
+def test_discount_factors_match_power_form():
+    """log-exp form must match the textbook 1 / (1 + y/k)^(t·k)."""
+    times = np.linspace(0.25, 30.0, 120)
+    for ytm in [-0.05, 0.001, 0.045, 0.5]:
+        expected = 1.0 / (1.0 + ytm / 2) ** (times * 2)
+        np.testing.assert_allclose(discount_factors(times, ytm), expected, rtol=1e-12)
+
+
+def test_schedule_caches_scaled_times():
+    spec, _ = _make_par_bond()
+    schedule, _ = build_schedule(spec, date(2024, 5, 10))
+    np.testing.assert_array_equal(schedule.scaled_times, schedule.times * spec.frequency)
+    assert schedule.scaled_for(spec.frequency) is schedule.scaled_times
+    assert schedule.scaled_for(12) is None
+    # Pricing at a different frequency must not reuse the cached array
+    expected = float(np.dot(schedule.amounts, 1.0 / (1.0 + 0.05 / 12) ** (schedule.times * 12)))
+    assert dirty_price(schedule, 0.05, frequency=12) == pytest.approx(expected, rel=1e-12)
+
+
+def test_dirty_prices_vec_matches_scalar():
+    """Batch kernel must agree with per-yield dirty_price calls."""
+    from src.bond_math import dirty_prices_vec
+
+    spec, _ = _make_par_bond()
+    schedule, _ = build_schedule(spec, date(2024, 5, 10))
+    ytms = np.linspace(0.0, 0.12, 25)
+    expected = np.array([dirty_price(schedule, y) for y in ytms])
+    np.testing.assert_allclose(dirty_prices_vec(schedule, ytms), expected, rtol=1e-12)
+
+
+@pytest.mark.parametrize("ytm", [0.0, 0.03, 0.05, 0.12])
+def test_bond_metrics_matches_separate_calls(ytm):
+    """Fused (price, mod_dur, dv01) must agree with the three-call pipeline."""
+    from src.bond_math import bond_metrics, dv01, modified_duration
+
+    spec, _ = _make_par_bond()
+    schedule, _ = build_schedule(spec, date(2024, 5, 10))
+    pv, md, dv = bond_metrics(schedule, ytm)
+    assert pv == pytest.approx(dirty_price(schedule, ytm), rel=1e-12)
+    assert md == pytest.approx(modified_duration(schedule, ytm), rel=1e-12)
+    assert dv == pytest.approx(dv01(schedule, ytm), rel=1e-12)
+
+
+def test_accrued_clamps_end_of_month_last_coupon():
+    """Aug 31 coupon → previous coupon clamps to Feb 29 in a leap year."""
+    spec = BondSpec(
+        face_value=100.0,
+        coupon_rate=0.05,
+        maturity_date=date(2024, 8, 31),
+        issue_date=date(2022, 8, 31),
+        frequency=2,
+        day_count=DayCount.ACT_365,
+    )
+    _, accr = build_schedule(spec, date(2024, 5, 10))
+    assert accr == pytest.approx(2.5 * 71 / 184, rel=1e-12)
+
+
+def test_price_batch_matches_scalar_price():
+    """One batch call must agree with per-yield BondPricer.price results."""
+    spec, p = _make_par_bond()
+    settlement = date(2024, 5, 10)
+    ytms = np.linspace(0.025, 0.065, 21)
+    batch = p.price_batch(spec, ytms, settlement=settlement)
+    for i, y in enumerate(ytms):
+        r = p.price(spec, y, settlement=settlement)
+        assert batch.dirty[i] == pytest.approx(r.dirty, rel=1e-12)
+        assert batch.clean[i] == pytest.approx(r.clean, rel=1e-12)
+        assert batch.modified_dur[i] == pytest.approx(r.modified_dur, rel=1e-12)
+        assert batch.dv01_per_face[i] == pytest.approx(r.dv01_per_face, rel=1e-12)
+    assert len(p._schedule_cache) == 1
+
+
+def test_portfolio_prices_match_per_bond():
+    """Padded SoA broadcast must reproduce per-bond dirty prices."""
+    settlement = date(2024, 5, 10)
+    p = BondPricer()
+    specs = [
+        BondSpec(100.0, 0.05, date(2034, 2, 15), date(2024, 2, 15), 2, DayCount.THIRTY_360),
+        BondSpec(100.0, 0.03, date(2026, 11, 30), date(2021, 11, 30), 4, DayCount.ACT_365),
+        BondSpec(1000.0, 0.07, date(2054, 8, 31), date(2024, 2, 29), 1, DayCount.ACT_ACT_ISDA),
+        BondSpec(100.0, 0.0, date(2024, 11, 10), date(2023, 11, 10), 2, DayCount.ACT_360),
+    ]
+    ytms = np.array([0.045, 0.0, 0.08, 0.052])
+    portfolio = p.build_portfolio(specs, settlement)
+    assert portfolio.times.shape == (4, int(portfolio.lengths.max()))
+    expected = [p.price(spec, y, settlement=settlement).dirty for spec, y in zip(specs, ytms)]
+    np.testing.assert_allclose(p.price_portfolio(portfolio, ytms), expected, rtol=1e-12)
+
+    portfolio32 = p.build_portfolio(specs, settlement, dtype=np.float32)
+    assert portfolio32.times.dtype == np.float32
+    prices32 = p.price_portfolio(portfolio32, ytms)
+    assert prices32.dtype == np.float64
+    np.testing.assert_allclose(prices32, expected, rtol=1e-5)
+
+
+def test_pricer_reuses_cached_schedule():
+    """Repricing the same bond at a new YTM must not rebuild the schedule."""
+    spec, p = _make_par_bond()
+    settlement = date(2024, 5, 10)
+    p.price(spec, 0.05, settlement=settlement)
+    p.price(spec, 0.06, settlement=settlement)
+    assert len(p._schedule_cache) == 1
+
+    p.price(spec, 0.05, settlement=date(2024, 5, 11))
+    assert len(p._schedule_cache) == 2
+
+
+def test_pricer_schedule_cache_is_bounded():
+    spec, _ = _make_par_bond()
+    p = BondPricer(max_cached_schedules=3)
+    for day in range(1, 8):
+        p.price(spec, 0.05, settlement=date(2024, 5, day))
+    assert len(p._schedule_cache) == 3
+
+
+def test_halley_solver_converges_across_yields():
+    """Solver must recover deep discount, premium and high-yield levels."""
+    spec, _ = _make_par_bond()
+    schedule, _ = build_schedule(spec, date(2024, 5, 10))
+    for ytm in [-0.01, 0.0, 0.02, 0.05, 0.15, 0.40]:
+        target = dirty_price(schedule, ytm)
+        assert solve_ytm(schedule, target) == pytest.approx(ytm, abs=1e-8)
+
+
+def _reference_coupon_dates(maturity, frequency, settlement):
+    """Step-by-step backward walk the vectorized generator must reproduce."""
+    import calendar
+
+    months_per_period = 12 // frequency
+    dates = [maturity]
+    current = maturity
+    while True:
+        month = current.month - months_per_period
+        year = current.year
+        while month <= 0:
+            month += 12
+            year -= 1
+        day = min(current.day, calendar.monthrange(year, month)[1])
+        prev = date(year, month, day)
+        if prev <= settlement:
+            break
+        dates.insert(0, prev)
+        current = prev
+    return dates
+
+
+@pytest.mark.parametrize("maturity", [
+    date(2034, 2, 15), date(2054, 8, 31), date(2030, 2, 28), date(2032, 2, 29),
+    date(2029, 12, 31), date(2024, 6, 1),
+])
+@pytest.mark.parametrize("frequency", [1, 2, 4, 12])
+def test_coupon_dates_match_backward_walk(maturity, frequency):
+    from src.bond_pricer import _generate_coupon_dates
+
+    settlement = date(2024, 5, 10)
+    spec = BondSpec(
+        face_value=100.0, coupon_rate=0.05, maturity_date=maturity,
+        issue_date=date(2020, 1, 1), frequency=frequency,
+    )
+    assert _generate_coupon_dates(spec, settlement) == _reference_coupon_dates(
+        maturity, frequency, settlement
+    )
+
+
+@pytest.mark.parametrize("convention", list(DayCount))
+def test_year_fractions_vectorized_matches_scalar(convention):
+    """Array day counts must agree with the per-date scalar conventions."""
+    from src.day_count import _CONVENTION_FN, year_fractions_vectorized
+
+    settlement = date(2023, 12, 31)
+    coupon_dates = [date(2024, 2, 29), date(2024, 12, 31), date(2025, 1, 1),
+                    date(2028, 3, 31), date(2053, 8, 31)]
+    expected = [_CONVENTION_FN[convention](settlement, d) for d in coupon_dates]
+    np.testing.assert_allclose(
+        year_fractions_vectorized(settlement, coupon_dates, convention),
+        expected, rtol=0, atol=1e-12,
+    )
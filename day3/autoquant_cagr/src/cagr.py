@@ -11,12 +11,24 @@ from __future__ import annotations
 
 import logging
 import numpy as np
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 
+from .cagr_jit import NUMBA_AVAILABLE, cagr_windows_jit, log_returns_jit
 from .config import TRADING_DAYS_PER_YEAR, TENORS, TENOR_ORDER, build_logger
 
 logger = build_logger("cagr")
 
+# Tenor windows in TENORS order, handed to the compiled kernel as-is.
+_TENOR_NAMES: tuple[str, ...] = tuple(TENORS)
+_TENOR_WINDOWS: np.ndarray = np.array(list(TENORS.values()), dtype=np.int64)
+
+
+@lru_cache(maxsize=None)
+def _upper_pairs(n: int) -> tuple[np.ndarray, np.ndarray]:
+    """Row-major (i, j) index pairs with i < j — np.triu_indices, cached per n."""
+    return np.triu_indices(n, k=1)
+
 
 # ── Data structures ───────────────────────────────────────────────────────
 
@@ -34,19 +46,37 @@ class CAGRSurface:
     symbol: str
     cagr_by_tenor: dict[str, float]   # NaN if insufficient history
     nan_ratio: float                  # quality indicator from source series
+    # TENOR_ORDER-aligned float64 view of cagr_by_tenor (read-only, NaN
+    # for missing tenors), built once: cagr_values[i] is TENOR_ORDER[i]
+    cagr_values: np.ndarray = field(init=False, repr=False, compare=False)
+    # threshold_bps → detect_inversions result (the surface is immutable)
+    _inversions: dict[float, list[tuple[str, str, float]]] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        by_tenor = self.cagr_by_tenor
+        vals = np.fromiter(
+            (by_tenor.get(t, np.nan) for t in TENOR_ORDER),
+            dtype=np.float64,
+            count=len(TENOR_ORDER),
+        )
+        vals.flags.writeable = False
+        object.__setattr__(self, "cagr_values", vals)
+        object.__setattr__(self, "_inversions", {})
 
     def tenors(self) -> list[str]:
         return TENOR_ORDER
 
     def values(self) -> list[float]:
-        return [self.cagr_by_tenor.get(t, float("nan")) for t in TENOR_ORDER]
+        return self.cagr_values.tolist()
 
     def as_pct(self) -> dict[str, str]:
-        result: dict[str, str] = {}
-        for t in TENOR_ORDER:
-            v = self.cagr_by_tenor.get(t, float("nan"))
-            result[t] = f"{v * 100:+.2f}%" if np.isfinite(v) else "  N/A "
-        return result
+        vals = self.cagr_values
+        return {
+            t: f"{v * 100:+.2f}%" if finite else "  N/A "
+            for t, v, finite in zip(TENOR_ORDER, vals.tolist(), np.isfinite(vals).tolist())
+        }
 
     def detect_inversions(
         self, threshold_bps: float = 500.0
@@ -54,21 +84,36 @@ class CAGRSurface:
         """
         Returns list of (short_tenor, long_tenor, spread_bps) where
         the shorter-tenor CAGR exceeds the longer-tenor CAGR by > threshold_bps.
+        Memoized per threshold; callers get a fresh list each time.
         """
-        inversions: list[tuple[str, str, float]] = []
-        valid = [
-            (t, self.cagr_by_tenor[t])
-            for t in TENOR_ORDER
-            if t in self.cagr_by_tenor and np.isfinite(self.cagr_by_tenor[t])
+        return list(self._cached_inversions(threshold_bps))
+
+    def inversion_count(self, threshold_bps: float = 500.0) -> int:
+        """len(detect_inversions(threshold_bps)) without copying the cached list."""
+        return len(self._cached_inversions(threshold_bps))
+
+    def _cached_inversions(self, threshold_bps: float) -> list[tuple[str, str, float]]:
+        cached = self._inversions.get(threshold_bps)
+        if cached is None:
+            cached = self._inversions[threshold_bps] = self._scan_inversions(threshold_bps)
+        return cached
+
+    def _scan_inversions(self, threshold_bps: float) -> list[tuple[str, str, float]]:
+        valid_idx = np.flatnonzero(np.isfinite(self.cagr_values))
+        if len(valid_idx) < 2:
+            return []
+        v = self.cagr_values[valid_idx]
+        # All short/long pairs at once: upper-triangle (i < j) of the spread matrix
+        i_idx, j_idx = _upper_pairs(len(valid_idx))
+        spread = (v[i_idx] - v[j_idx]) * 10_000
+        hits = np.flatnonzero(spread > threshold_bps)
+        names = [TENOR_ORDER[k] for k in valid_idx.tolist()]
+        return [
+            (names[i], names[j], bps)
+            for i, j, bps in zip(
+                i_idx[hits].tolist(), j_idx[hits].tolist(), spread[hits].tolist()
+            )
         ]
-        for i in range(len(valid)):
-            for j in range(i + 1, len(valid)):
-                short_t, short_v = valid[i]
-                long_t, long_v = valid[j]
-                spread_bps = (short_v - long_v) * 10_000
-                if spread_bps > threshold_bps:
-                    inversions.append((short_t, long_t, spread_bps))
-        return inversions
 
 
 # ── Core math ─────────────────────────────────────────────────────────────
@@ -88,22 +133,22 @@ def compute_log_returns(prices: np.ndarray) -> LogReturnSeries:
             source_length=len(prices),
         )
 
-    prices = np.asarray(prices, dtype=np.float64)
+    prices = np.ascontiguousarray(prices, dtype=np.float64)
 
-    with np.errstate(divide="ignore", invalid="ignore"):
-        raw = np.log(prices[1:] / prices[:-1])
-
-    finite_mask = np.isfinite(raw)
-    nan_count = int((~finite_mask).sum())
+    if NUMBA_AVAILABLE:
+        # One fused pass: ratio, log, finiteness check and zero-fill
+        filled, nan_count = log_returns_jit(prices)
+        nan_count = int(nan_count)
+    else:
+        filled, nan_count = _log_returns_numpy(prices)
 
     if nan_count > 0:
         logger.warning(
             "Non-finite log-returns detected: %d/%d → zero-filled",
             nan_count,
-            len(raw),
+            len(filled),
         )
 
-    filled = np.where(finite_mask, raw, 0.0)
     return LogReturnSeries(
         values=filled,
         nan_count=nan_count,
@@ -111,6 +156,19 @@ def compute_log_returns(prices: np.ndarray) -> LogReturnSeries:
     )
 
 
+def _log_returns_numpy(prices: np.ndarray) -> tuple[np.ndarray, int]:
+    """
+    NumPy path when numba is absent: one finiteness reduction, then an
+    in-place zero-fill — no finite_mask / np.where temporaries.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        raw = np.log(prices[1:] / prices[:-1])
+    nan_count = raw.size - int(np.count_nonzero(np.isfinite(raw)))
+    if nan_count:
+        np.nan_to_num(raw, copy=False, nan=0.0, posinf=0.0, neginf=0.0)
+    return raw, nan_count
+
+
 def cagr_from_log_returns(log_rets: np.ndarray, window: int) -> float:
     """
     Geometric CAGR for the trailing `window` trading days.
@@ -129,6 +187,21 @@ def cagr_from_log_returns(log_rets: np.ndarray, window: int) -> float:
     return float(np.exp(total_log_return / years) - 1.0)
 
 
+def cagr_from_log_returns_multi(log_rets: np.ndarray, windows: np.ndarray) -> np.ndarray:
+    """
+    CAGR for several trailing windows at once; element i matches
+    cagr_from_log_returns(log_rets, windows[i]).
+
+    One compiled O(max(windows)) pass over the tail of the series instead
+    of a slice + sum + exp per window. NaN where history is insufficient.
+    """
+    return cagr_windows_jit(
+        np.ascontiguousarray(log_rets, dtype=np.float64),
+        np.ascontiguousarray(windows, dtype=np.int64),
+        TRADING_DAYS_PER_YEAR,
+    )
+
+
 def build_cagr_surface(symbol: str, prices: np.ndarray) -> CAGRSurface:
     """
     Full pipeline: prices → log-returns → CAGR surface.
@@ -143,10 +216,8 @@ def build_cagr_surface(symbol: str, prices: np.ndarray) -> CAGRSurface:
     series = compute_log_returns(prices)
     nan_ratio = series.nan_count / max(len(series.values), 1)
 
-    surface = {
-        tenor: cagr_from_log_returns(series.values, days)
-        for tenor, days in TENORS.items()
-    }
+    cagrs = cagr_from_log_returns_multi(series.values, _TENOR_WINDOWS)
+    surface = dict(zip(_TENOR_NAMES, cagrs.tolist()))
 
     logger.info(
         "CAGR surface built | symbol=%s | price_bars=%d | nan_ratio=%.4f",
@@ -160,3 +231,87 @@ def build_cagr_surface(symbol: str, prices: np.ndarray) -> CAGRSurface:
         cagr_by_tenor=surface,
         nan_ratio=nan_ratio,
     )
+
+
+def build_cagr_surfaces_batch(
+    symbols: list[str],
+    price_matrix: np.ndarray,
+) -> list[CAGRSurface]:
+    """
+    Batch pipeline for N equal-length series: (N, T) prices → N surfaces.
+
+    Log-returns, the non-finite zero-fill and a per-row cumulative sum run
+    as whole-matrix ops; each tenor's CAGR is then one column difference
+    across all symbols. Row i matches build_cagr_surface(symbols[i], row i).
+
+    Args:
+        symbols: N ticker identifiers, aligned with the matrix rows.
+        price_matrix: (N, T) adjusted closes, chronological along axis 1.
+    """
+    prices = np.asarray(price_matrix, dtype=np.float64)
+    if prices.ndim != 2 or prices.shape[0] != len(symbols):
+        raise ValueError(
+            f"price_matrix must be (n_symbols, n_bars); got {prices.shape} "
+            f"for {len(symbols)} symbols"
+        )
+    n_rets = max(prices.shape[1] - 1, 0)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_rets = np.log(prices[:, 1:] / prices[:, :-1])
+    finite = np.isfinite(log_rets)
+    nan_counts = n_rets - finite.sum(axis=1)
+    if nan_counts.any():
+        logger.warning(
+            "Non-finite log-returns detected: %d across %d symbol(s) → zero-filled",
+            int(nan_counts.sum()),
+            int(np.count_nonzero(nan_counts)),
+        )
+        log_rets[~finite] = 0.0
+
+    # cum[:, k] = sum of the first k returns; trailing-w sum = cum[-1] - cum[-w-1]
+    cum = np.zeros((prices.shape[0], n_rets + 1), dtype=np.float64)
+    np.cumsum(log_rets, axis=1, out=cum[:, 1:])
+    total = cum[:, -1]
+
+    columns: list[list[float]] = []
+    for days in _TENOR_WINDOWS.tolist():
+        if days > n_rets or days <= 0:
+            columns.append([float("nan")] * len(symbols))
+            continue
+        window_sum = total - cum[:, n_rets - days]
+        columns.append((np.exp(window_sum * (TRADING_DAYS_PER_YEAR / days)) - 1.0).tolist())
+
+    nan_ratios = (nan_counts / max(n_rets, 1)).tolist()
+    logger.info(
+        "CAGR surfaces built (batch) | symbols=%d | price_bars=%d",
+        len(symbols),
+        prices.shape[1],
+    )
+    return [
+        CAGRSurface(
+            symbol=symbol,
+            cagr_by_tenor=dict(zip(_TENOR_NAMES, row)),
+            nan_ratio=nan_ratio,
+        )
+        for symbol, row, nan_ratio in zip(symbols, zip(*columns), nan_ratios)
+    ]
+
+
+def count_inversions_batch(
+    surfaces: list[CAGRSurface],
+    threshold_bps: float = 500.0,
+) -> np.ndarray:
+    """
+    Per-surface inversion counts for a whole universe in one scan.
+
+    Stacks the TENOR_ORDER-aligned values into an (N, T) matrix and takes
+    every short/long spread (upper-triangle pairs) across all rows at once.
+    NaN tenors compare False, so entry i equals
+    surfaces[i].inversion_count(threshold_bps).
+    """
+    if not surfaces:
+        return np.zeros(0, dtype=np.int64)
+    cagr = np.stack([s.cagr_values for s in surfaces])
+    i_idx, j_idx = _upper_pairs(cagr.shape[1])
+    spread = (cagr[:, i_idx] - cagr[:, j_idx]) * 10_000
+    return np.count_nonzero(spread > threshold_bps, axis=1)
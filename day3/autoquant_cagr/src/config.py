@@ -1,41 +1,150 @@
 """
 Centralised configuration and environment bootstrap.
 All constants live here — no magic numbers in business logic.
+The .env file is parsed on first Alpaca config access, not at import.
 """
 from __future__ import annotations
 
+import atexit
 import os
 import logging
 import logging.handlers
+import queue
+import threading
+from functools import lru_cache
 from pathlib import Path
 from dataclasses import dataclass, field
-from dotenv import load_dotenv
-
-load_dotenv()
 
 # ── Logging setup ─────────────────────────────────────────────────────────
 LOG_DIR = Path("logs")
 LOG_DIR.mkdir(exist_ok=True)
 
+_LOG_FORMAT = logging.Formatter(
+    "%(asctime)s.%(msecs)03d | %(levelname)-8s | %(name)s | %(message)s",
+    datefmt="%Y-%m-%dT%H:%M:%S",
+)
+
+
+class _BufferedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    RotatingFileHandler over a 64 KB write buffer.
+
+    DEBUG/INFO records are not flushed per emit; WARNING+ flushes at once,
+    a background thread flushes every `flush_interval` seconds, and close()
+    (run by logging.shutdown at exit) flushes the rest. File size is tracked
+    in memory so the rollover check never seeks — a seek would force a flush.
+    """
+
+    buffer_size = 64 * 1024
+
+    def __init__(self, *args, flush_interval: float = 30.0, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        try:
+            self._size = os.path.getsize(self.baseFilename)
+        except OSError:
+            self._size = 0
+        self._stop_flush = threading.Event()
+        threading.Thread(
+            target=self._flush_loop,
+            args=(flush_interval,),
+            name=f"log-flush-{Path(self.baseFilename).stem}",
+            daemon=True,
+        ).start()
+
+    def _open(self):
+        return self._builtin_open(
+            self.baseFilename, self.mode, buffering=self.buffer_size,
+            encoding=self.encoding, errors=self.errors,
+        )
+
+    def _flush_loop(self, interval: float) -> None:
+        while not self._stop_flush.wait(interval):
+            self.flush()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            msg = self.format(record) + self.terminator
+            if self.maxBytes > 0 and self._size and self._size + len(msg) >= self.maxBytes:
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(msg)
+            self._size += len(msg)
+            if record.levelno >= logging.WARNING:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def doRollover(self) -> None:
+        super().doRollover()
+        self._size = 0
+
+    def close(self) -> None:
+        self._stop_flush.set()
+        super().close()
+
+
+class _PerLoggerFileRouter(logging.Handler):
+    """
+    Listener-side sink: routes each record to a rotating file named after
+    its logger (logs/<name>.log), plus WARNING+ to the console.
+    Runs only on the QueueListener thread.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._files: dict[str, logging.Handler] = {}
+        self._console = logging.StreamHandler()
+        self._console.setFormatter(_LOG_FORMAT)
+        self._console.setLevel(logging.WARNING)
+
+    def add_logger(self, name: str) -> None:
+        if name in self._files:
+            return  # the file handler (and its flush thread) already exists
+        # Rotating file handler — never fills the disk
+        fh = _BufferedRotatingFileHandler(
+            LOG_DIR / f"{name}.log",
+            maxBytes=10 * 1024 * 1024,  # 10MB
+            backupCount=5,
+        )
+        fh.setFormatter(_LOG_FORMAT)
+        self._files[name] = fh
+
+    def emit(self, record: logging.LogRecord) -> None:
+        fh = self._files.get(record.name)
+        if fh is not None:
+            fh.handle(record)
+        if record.levelno >= self._console.level:
+            self._console.handle(record)
+
+    def close(self) -> None:
+        for fh in self._files.values():
+            fh.close()
+        super().close()
+
+
+# Producers only enqueue; one background listener does formatting and I/O.
+_LOG_QUEUE: queue.Queue = queue.Queue(-1)
+_LOG_ROUTER = _PerLoggerFileRouter()
+_LOG_LISTENER = logging.handlers.QueueListener(
+    _LOG_QUEUE, _LOG_ROUTER, respect_handler_level=False
+)
+_LOG_LISTENER.start()
+atexit.register(_LOG_LISTENER.stop)
+# One producer-side handler shared by every logger; the router picks the
+# file from record.name, so nothing on this side is per-logger.
+_QUEUE_HANDLER = logging.handlers.QueueHandler(_LOG_QUEUE)
+
+
 def build_logger(name: str) -> logging.Logger:
     logger = logging.getLogger(name)
+    if logger.handlers:
+        return logger  # already configured (re-import, reload) — don't double-log
     logger.setLevel(logging.DEBUG)
-    fmt = logging.Formatter(
-        "%(asctime)s.%(msecs)03d | %(levelname)-8s | %(name)s | %(message)s",
-        datefmt="%Y-%m-%dT%H:%M:%S",
-    )
-    # Rotating file handler — never fills the disk
-    fh = logging.handlers.RotatingFileHandler(
-        LOG_DIR / f"{name}.log",
-        maxBytes=10 * 1024 * 1024,  # 10MB
-        backupCount=5,
-    )
-    fh.setFormatter(fmt)
-    ch = logging.StreamHandler()
-    ch.setFormatter(fmt)
-    ch.setLevel(logging.WARNING)
-    logger.addHandler(fh)
-    logger.addHandler(ch)
+    _LOG_ROUTER.add_logger(name)
+    logger.addHandler(_QUEUE_HANDLER)
     return logger
 
 # ── Market constants ──────────────────────────────────────────────────────
@@ -69,4 +178,24 @@ class AlpacaConfig:
     def is_configured(self) -> bool:
         return bool(self.api_key and self.secret_key)
 
-ALPACA_CFG = AlpacaConfig()
+
+@lru_cache(maxsize=1)
+def _load_env() -> None:
+    """Load .env once, on demand."""
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+
+@lru_cache(maxsize=1)
+def get_alpaca_cfg() -> AlpacaConfig:
+    """Process-wide AlpacaConfig: .env parsed and env vars read exactly once."""
+    _load_env()
+    return AlpacaConfig()
+
+
+def __getattr__(name: str):
+    # ALPACA_CFG is resolved lazily (PEP 562): importing config never parses .env
+    if name == "ALPACA_CFG":
+        return get_alpaca_cfg()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,6 +4,7 @@ Rich CLI dashboard: displays live CAGR term structure as a yield-curve-style tab
 from __future__ import annotations
 
 import time
+from functools import lru_cache
 import numpy as np
 from rich.console import Console
 from rich.table import Table
@@ -18,10 +19,13 @@ from .config import TENOR_ORDER
 console = Console()
 
 
-def _color_cagr(value: float) -> Text:
-    if not np.isfinite(value):
-        return Text("  N/A ", style="dim")
-    pct = value * 100
+_NA_CELL = Text("  N/A ", style="dim")
+
+
+@lru_cache(maxsize=4096)
+def _color_cagr_cached(bps: int) -> Text:
+    """Styled cell for a CAGR rounded to the displayed 0.01% (1 bp)."""
+    pct = bps / 100
     label = f"{pct:+7.2f}%"
     if pct >= 15:
         return Text(label, style="bold green")
@@ -33,6 +37,17 @@ def _color_cagr(value: float) -> Text:
         return Text(label, style="bold red")
 
 
+def _color_cagr(value: float) -> Text:
+    """
+    Shared Text per displayed 0.01% bucket. Rich renders cells from copies
+    (Text.wrap splits into new lines), so the cached objects are never
+    mutated — callers must not stylize them in place either.
+    """
+    if not np.isfinite(value):
+        return _NA_CELL
+    return _color_cagr_cached(int(round(value * 10_000)))
+
+
 def render_surface_table(surfaces: list[CAGRSurface]) -> Table:
     table = Table(
         title="[bold cyan]CAGR Term Structure[/] — Return Yield Curve",
@@ -48,12 +63,11 @@ def render_surface_table(surfaces: list[CAGRSurface]) -> Table:
 
     for surf in surfaces:
         row: list[str | Text] = [surf.symbol]
-        for tenor in TENOR_ORDER:
-            v = surf.cagr_by_tenor.get(tenor, float("nan"))
-            row.append(_color_cagr(v))
+        # TENOR_ORDER-aligned array: one bulk conversion, no per-cell dict lookups
+        row.extend(_color_cagr(v) for v in surf.cagr_values.tolist())
         row.append(f"{surf.nan_ratio * 100:.2f}%")
-        inv = surf.detect_inversions(threshold_bps=500)
-        row.append(str(len(inv)) + " ⚠" if inv else "—")
+        n_inv = surf.inversion_count(threshold_bps=500)
+        row.append(f"{n_inv} ⚠" if n_inv else "—")
         table.add_row(*row)
 
     return table
@@ -65,14 +79,15 @@ def run_live_dashboard(
     iterations: int = 10,
 ) -> None:
     """Render the CAGR surface in a live-updating Rich panel."""
-    with Live(console=console, refresh_per_second=4) as live:
+    # Surfaces are immutable for the whole run: build the panel once and
+    # let Live repaint it, rather than rebuilding the table every tick.
+    panel = Panel(
+        render_surface_table(surfaces),
+        title="[bold]AutoQuant-Alpha[/] | Day 3: CAGR Module",
+        subtitle=f"252-day convention | {len(surfaces)} symbol(s)",
+        border_style="blue",
+    )
+    with Live(panel, console=console, auto_refresh=False) as live:
         for _ in range(iterations):
-            table = render_surface_table(surfaces)
-            panel = Panel(
-                table,
-                title="[bold]AutoQuant-Alpha[/] | Day 3: CAGR Module",
-                subtitle=f"252-day convention | {len(surfaces)} symbol(s)",
-                border_style="blue",
-            )
-            live.update(panel)
+            live.refresh()
             time.sleep(refresh_seconds)
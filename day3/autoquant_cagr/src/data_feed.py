@@ -4,13 +4,18 @@ Uses alpaca-py v2 REST client. No WebSocket for this lesson (Day 3 = daily bars)
 """
 from __future__ import annotations
 
-import time
+import asyncio
 import datetime
+import functools
+import hashlib
+import random
+import time
 import numpy as np
 import pandas as pd
 from typing import Optional
 
-from .config import ALPACA_CFG, build_logger
+from .cagr_jit import NUMBA_AVAILABLE, gbm_path_jit
+from .config import build_logger, get_alpaca_cfg
 
 logger = build_logger("data_feed")
 
@@ -25,6 +30,50 @@ except ImportError:
     logger.warning("alpaca-py not installed — live feed disabled")
 
 
+@functools.lru_cache(maxsize=1)
+def _client(api_key: str, secret_key: str) -> "StockHistoricalDataClient":
+    """
+    Process-wide data client, built on first fetch. Reusing it keeps the
+    underlying HTTP session (and its pooled TLS connections) alive across
+    symbols and retries instead of re-handshaking per call.
+    """
+    return StockHistoricalDataClient(api_key=api_key, secret_key=secret_key)
+
+
+# Retry backoff: 0.3s doubling per attempt, capped, with ±50% jitter so
+# concurrent fetches that fail together don't retry in lockstep.
+_BACKOFF_BASE_S = 0.3
+_BACKOFF_CAP_S = 5.0
+_RATE_LIMIT_WINDOW_S = 60.0   # Alpaca free tier: 200 req per rolling minute
+
+
+def _retry_delay(attempt: int, exc: Exception) -> float:
+    """
+    Seconds to wait before retry `attempt + 1`. A 429 carrying a
+    Retry-After header is honored (up to the rate-limit window); anything
+    else gets capped exponential backoff with jitter.
+    """
+    if getattr(exc, "status_code", None) == 429:
+        response = getattr(exc, "response", None)
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        try:
+            return min(_RATE_LIMIT_WINDOW_S, max(0.0, float(retry_after)))
+        except (TypeError, ValueError):
+            pass  # absent or HTTP-date form: fall back to backoff
+    delay = min(_BACKOFF_CAP_S, _BACKOFF_BASE_S * 2 ** (attempt - 1))
+    return delay * random.uniform(0.5, 1.5)
+
+
+def _closes_array(close: pd.Series) -> np.ndarray:
+    """
+    Chronological float64 closes. Alpaca returns bars already in time
+    order, so the sort (and its copy) only runs when the index says so.
+    """
+    if not close.index.is_monotonic_increasing:
+        close = close.sort_index()
+    return np.ascontiguousarray(close.to_numpy(), dtype=np.float64)
+
+
 def fetch_adjusted_closes(
     symbol: str,
     lookback_years: int = 5,
@@ -38,21 +87,20 @@ def fetch_adjusted_closes(
         None if fetch fails after retries.
 
     Rate limit handling:
-        Alpaca free tier: 200 req/min. We add 0.3s backoff between retries.
+        Alpaca free tier: 200 req/min. Retries back off exponentially with
+        jitter from 0.3s; a 429's Retry-After header is honored.
         For a 100-symbol universe, batch requests with a semaphore (see stress_test.py).
     """
     if not ALPACA_AVAILABLE:
         logger.error("alpaca-py not available")
         return None
 
-    if not ALPACA_CFG.is_configured():
+    cfg = get_alpaca_cfg()
+    if not cfg.is_configured():
         logger.error("Alpaca credentials not set — check .env file")
         return None
 
-    client = StockHistoricalDataClient(
-        api_key=ALPACA_CFG.api_key,
-        secret_key=ALPACA_CFG.secret_key,
-    )
+    client = _client(cfg.api_key, cfg.secret_key)
 
     end_dt = datetime.datetime.now(datetime.timezone.utc)
     start_dt = end_dt - datetime.timedelta(days=lookback_years * 366)
@@ -78,7 +126,7 @@ def fetch_adjusted_closes(
             if isinstance(df.index, pd.MultiIndex):
                 df = df.xs(symbol, level="symbol")
 
-            closes = df["close"].sort_index().to_numpy(dtype=np.float64)
+            closes = _closes_array(df["close"])
             logger.info(
                 "Fetched %d bars for %s (attempt %d)", len(closes), symbol, attempt
             )
@@ -90,12 +138,115 @@ def fetch_adjusted_closes(
                 attempt, max_retries, symbol, exc,
             )
             if attempt < max_retries:
-                time.sleep(0.3 * attempt)
+                time.sleep(_retry_delay(attempt, exc))
 
     logger.error("All %d fetch attempts failed for %s", max_retries, symbol)
     return None
 
 
+def fetch_adjusted_closes_batch(
+    symbols: list[str],
+    lookback_years: int = 5,
+    max_retries: int = 3,
+) -> dict[str, np.ndarray]:
+    """
+    Fetch adjusted daily closes for many symbols in ONE StockBarsRequest.
+
+    Returns:
+        symbol → float64 array of adjusted closes, chronological order.
+        Symbols with no bars are omitted; {} if the fetch fails after retries.
+    """
+    if not symbols:
+        return {}
+    if not ALPACA_AVAILABLE:
+        logger.error("alpaca-py not available")
+        return {}
+
+    cfg = get_alpaca_cfg()
+    if not cfg.is_configured():
+        logger.error("Alpaca credentials not set — check .env file")
+        return {}
+
+    client = _client(cfg.api_key, cfg.secret_key)
+
+    end_dt = datetime.datetime.now(datetime.timezone.utc)
+    start_dt = end_dt - datetime.timedelta(days=lookback_years * 366)
+
+    request = StockBarsRequest(
+        symbol_or_symbols=list(symbols),
+        timeframe=TimeFrame(1, TimeFrameUnit.Day),
+        start=start_dt,
+        end=end_dt,
+        adjustment="all",   # split + dividend adjusted
+    )
+
+    for attempt in range(1, max_retries + 1):
+        try:
+            df: pd.DataFrame = client.get_stock_bars(request).df
+
+            if df.empty:
+                logger.warning("Empty response for %d symbols", len(symbols))
+                return {}
+
+            # MultiIndex (symbol, timestamp): demultiplex per symbol
+            closes = {
+                str(sym): _closes_array(group["close"].droplevel("symbol"))
+                for sym, group in df.groupby(level="symbol", sort=False)
+            }
+            missing = [s for s in symbols if s not in closes]
+            if missing:
+                logger.warning("No bars returned for: %s", ", ".join(missing))
+            logger.info(
+                "Fetched bars for %d/%d symbols in one request (attempt %d)",
+                len(closes), len(symbols), attempt,
+            )
+            return closes
+
+        except Exception as exc:
+            logger.warning(
+                "Batch fetch attempt %d/%d failed (%d symbols): %s",
+                attempt, max_retries, len(symbols), exc,
+            )
+            if attempt < max_retries:
+                time.sleep(_retry_delay(attempt, exc))
+
+    logger.error("All %d batch fetch attempts failed", max_retries)
+    return {}
+
+
+async def fetch_all(
+    symbols: list[str],
+    lookback_years: int = 5,
+    max_concurrency: int = 10,
+) -> dict[str, np.ndarray]:
+    """
+    Per-symbol fetches run concurrently (sync client calls on worker
+    threads), at most `max_concurrency` in flight to stay inside Alpaca's
+    request-rate limit. Returns symbol → closes for the fetches that
+    succeeded.
+    """
+    sem = asyncio.Semaphore(max_concurrency)
+
+    async def fetch_one(symbol: str) -> tuple[str, Optional[np.ndarray]]:
+        async with sem:
+            return symbol, await asyncio.to_thread(
+                fetch_adjusted_closes, symbol, lookback_years
+            )
+
+    results = await asyncio.gather(*(fetch_one(s) for s in symbols))
+    return {symbol: closes for symbol, closes in results if closes is not None}
+
+
+def symbol_seed(symbol: str, modulus: int = 1000) -> int:
+    """
+    Stable per-symbol RNG seed. Unlike hash(), which is salted per
+    interpreter unless PYTHONHASHSEED is set, this is identical across runs.
+    """
+    digest = hashlib.blake2b(symbol.encode(), digest_size=4).digest()
+    return int.from_bytes(digest, "little") % modulus
+
+
+@functools.lru_cache(maxsize=128)
 def generate_synthetic_prices(
     n_days: int = 1260,
     initial_price: float = 100.0,
@@ -106,12 +257,59 @@ def generate_synthetic_prices(
     """
     Geometric Brownian Motion price series for offline testing.
     μ=12%, σ=20% annualized by default (plausible US equity).
+
+    Memoized on its arguments (the path is a pure function of them); the
+    shared result is read-only — copy it before modifying.
     """
     rng = np.random.default_rng(seed)
     dt = 1.0 / 252
     drift = (annual_return - 0.5 * annual_vol ** 2) * dt
     diffusion = annual_vol * np.sqrt(dt)
 
-    log_rets = drift + diffusion * rng.standard_normal(n_days)
-    prices = initial_price * np.exp(np.cumsum(log_rets))
-    return np.insert(prices, 0, initial_price)  # prepend starting price
+    shocks = rng.standard_normal(n_days)
+    if NUMBA_AVAILABLE:
+        # Same shocks, fused drift/cumsum/exp loop into a preallocated path
+        out = gbm_path_jit(shocks, initial_price, drift, diffusion)
+        out.flags.writeable = False
+        return out
+
+    # In-place chain into a preallocated path: no np.insert realloc + copy
+    out = np.empty(n_days + 1, dtype=np.float64)
+    out[0] = initial_price
+    log_rets = np.multiply(shocks, diffusion, out=shocks)
+    log_rets += drift
+    np.cumsum(log_rets, out=log_rets)
+    np.exp(log_rets, out=log_rets)
+    np.multiply(log_rets, initial_price, out=out[1:])
+    out.flags.writeable = False
+    return out
+
+
+def generate_synthetic_prices_batch(
+    n_days: int,
+    annual_returns: np.ndarray,
+    annual_vols: np.ndarray,
+    initial_price: float = 100.0,
+    seed: int = 42,
+) -> np.ndarray:
+    """
+    N independent GBM paths in one draw: returns an (N, n_days + 1) matrix,
+    each row shaped like generate_synthetic_prices(n_days, ...) output.
+    Drift and diffusion are per-row vectors broadcast across the bars.
+    """
+    annual_returns = np.asarray(annual_returns, dtype=np.float64)
+    annual_vols = np.asarray(annual_vols, dtype=np.float64)
+    rng = np.random.default_rng(seed)
+    dt = 1.0 / 252
+    drift = ((annual_returns - 0.5 * annual_vols ** 2) * dt)[:, None]
+    diffusion = (annual_vols * np.sqrt(dt))[:, None]
+
+    prices = np.empty((len(annual_returns), n_days + 1), dtype=np.float64)
+    prices[:, 0] = initial_price
+    log_rets = rng.standard_normal((len(annual_returns), n_days))
+    log_rets *= diffusion
+    log_rets += drift
+    np.cumsum(log_rets, axis=1, out=prices[:, 1:])
+    np.exp(prices[:, 1:], out=prices[:, 1:])
+    prices[:, 1:] *= initial_price
+    return prices
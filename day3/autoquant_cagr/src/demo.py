@@ -5,12 +5,19 @@ Run: python -m src.demo
 """
 from __future__ import annotations
 
+import asyncio
+
 import numpy as np
 from rich.console import Console
 
 from .config import ALPACA_CFG
 from .cagr import build_cagr_surface
-from .data_feed import fetch_adjusted_closes, generate_synthetic_prices
+from .data_feed import (
+    fetch_adjusted_closes_batch,
+    fetch_all,
+    generate_synthetic_prices,
+    symbol_seed,
+)
 from .dashboard import run_live_dashboard
 
 console = Console()
@@ -21,16 +28,22 @@ DEMO_SYMBOLS = ["SPY", "QQQ", "IWM", "GLD", "TLT"]
 def main() -> None:
     surfaces = []
 
-    for symbol in DEMO_SYMBOLS:
-        prices: np.ndarray | None = None
+    # One multi-symbol request for the whole universe; anything it missed is
+    # retried per symbol concurrently, then each symbol is a dict lookup
+    live: dict[str, np.ndarray] = {}
+    if ALPACA_CFG.is_configured():
+        console.log(f"[cyan]Fetching live data:[/] {', '.join(DEMO_SYMBOLS)}")
+        live = fetch_adjusted_closes_batch(DEMO_SYMBOLS, lookback_years=5)
+        missing = [s for s in DEMO_SYMBOLS if s not in live]
+        if missing:
+            live.update(asyncio.run(fetch_all(missing, lookback_years=5)))
 
-        if ALPACA_CFG.is_configured():
-            console.log(f"[cyan]Fetching live data:[/] {symbol}")
-            prices = fetch_adjusted_closes(symbol, lookback_years=5)
+    for symbol in DEMO_SYMBOLS:
+        prices: np.ndarray | None = live.get(symbol)
 
         if prices is None:
             console.log(f"[yellow]Using synthetic GBM data for:[/] {symbol}")
-            rng = hash(symbol) % 1000  # deterministic seed per symbol
+            rng = symbol_seed(symbol)  # deterministic seed per symbol
             prices = generate_synthetic_prices(
                 n_days=1260,
                 annual_return=0.08 + (rng % 10) * 0.01,
@@ -13,13 +13,28 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 from src.cagr import (
     compute_log_returns,
     cagr_from_log_returns,
+    cagr_from_log_returns_multi,
     build_cagr_surface,
+    build_cagr_surfaces_batch,
+    count_inversions_batch,
     CAGRSurface,
 )
-from src.data_feed import generate_synthetic_prices
+from src.data_feed import generate_synthetic_prices, generate_synthetic_prices_batch
 from src.config import TRADING_DAYS_PER_YEAR
 
 
+@pytest.fixture(scope="session")
+def clean_prices_252() -> np.ndarray:
+    """One year of clean synthetic closes, shared (read-only) across tests."""
+    return generate_synthetic_prices(n_days=252)
+
+
+@pytest.fixture(scope="session")
+def clean_prices_1512() -> np.ndarray:
+    """Six years of clean synthetic closes: enough history for every tenor."""
+    return generate_synthetic_prices(n_days=1512)
+
+
 class TestLogReturns:
 
     def test_basic_computation(self):
@@ -43,9 +58,23 @@ class TestLogReturns:
         series = compute_log_returns(prices)
         assert len(series.values) == 0
 
-    def test_nan_ratio_is_zero_for_clean_data(self):
-        prices = generate_synthetic_prices(n_days=252)
+    def test_nan_price_zero_fills(self):
+        prices = np.array([100.0, np.nan, 101.0, 102.0], dtype=np.float64)
         series = compute_log_returns(prices)
+        assert series.nan_count == 2
+        assert series.values[2] == pytest.approx(np.log(102.0 / 101.0))
+
+    def test_numpy_fallback_matches_kernel(self, monkeypatch):
+        import src.cagr as cagr_mod
+        prices = np.array([100.0, 0.0, 100.0, np.nan, 101.0, np.inf, 102.0])
+        expected = compute_log_returns(prices)
+        monkeypatch.setattr(cagr_mod, "NUMBA_AVAILABLE", False)
+        fallback = compute_log_returns(prices)
+        assert fallback.nan_count == expected.nan_count
+        np.testing.assert_array_equal(fallback.values, expected.values)
+
+    def test_nan_ratio_is_zero_for_clean_data(self, clean_prices_252):
+        series = compute_log_returns(clean_prices_252)
         assert series.nan_count == 0
 
 
@@ -96,16 +125,36 @@ class TestCAGR:
         # Geometric should be slightly lower due to volatility drag
         assert geometric_cagr <= arithmetic_cagr + 1e-9
 
+    def test_multi_window_matches_scalar(self):
+        rng = np.random.default_rng(7)
+        log_rets = rng.normal(0.0004, 0.012, 300)
+        windows = np.array([252, 5, 21, 504, 63, 300, 1], dtype=np.int64)
+        multi = cagr_from_log_returns_multi(log_rets, windows)
+        for w, got in zip(windows, multi):
+            expected = cagr_from_log_returns(log_rets, int(w))
+            if np.isnan(expected):
+                assert np.isnan(got)
+            else:
+                assert got == pytest.approx(expected, rel=1e-12)
+
 
 class TestCAGRSurface:
 
-    def test_surface_has_all_tenors(self):
-        prices = generate_synthetic_prices(n_days=1512)
-        surf = build_cagr_surface("TEST", prices)
+    def test_surface_has_all_tenors(self, clean_prices_1512):
+        surf = build_cagr_surface("TEST", clean_prices_1512)
         from src.config import TENORS
         for tenor in TENORS:
             assert tenor in surf.cagr_by_tenor
 
+    def test_cagr_values_aligned_with_tenor_order(self):
+        from src.config import TENOR_ORDER
+        surf = build_cagr_surface("TEST", generate_synthetic_prices(n_days=300))
+        assert surf.cagr_values.shape == (len(TENOR_ORDER),)
+        for i, tenor in enumerate(TENOR_ORDER):
+            np.testing.assert_equal(surf.cagr_values[i], surf.cagr_by_tenor[tenor])
+        with pytest.raises(ValueError):
+            surf.cagr_values[0] = 0.0
+
     def test_short_tenors_nan_for_short_series(self):
         """Only 10 bars → all tenors except 1W should be NaN."""
         prices = generate_synthetic_prices(n_days=10)
@@ -113,11 +162,23 @@ class TestCAGRSurface:
         assert not np.isnan(surf.cagr_by_tenor.get("1W", float("nan")))
         assert np.isnan(surf.cagr_by_tenor.get("1M", float("nan")))
 
-    def test_nan_ratio_tracked(self):
-        prices = generate_synthetic_prices(n_days=252)
-        surf = build_cagr_surface("CLEAN", prices)
+    def test_nan_ratio_tracked(self, clean_prices_252):
+        surf = build_cagr_surface("CLEAN", clean_prices_252)
         assert surf.nan_ratio == 0.0
 
+    def test_batch_matches_single_symbol(self):
+        prices = np.stack([
+            generate_synthetic_prices(n_days=300, seed=s) for s in range(4)
+        ])
+        prices[2, 50] = 0.0  # halt bar → zero-filled in both paths
+        symbols = ["A", "B", "C", "D"]
+        batch = build_cagr_surfaces_batch(symbols, prices)
+        for sym, row, surf in zip(symbols, prices, batch):
+            single = build_cagr_surface(sym, row)
+            assert surf.symbol == sym
+            assert surf.nan_ratio == single.nan_ratio
+            np.testing.assert_allclose(surf.values(), single.values(), rtol=1e-12, atol=1e-12)
+
 
 class TestInversionDetection:
 
@@ -163,3 +224,186 @@ class TestInversionDetection:
             nan_ratio=0.0,
         )
         assert surf.detect_inversions(threshold_bps=500) == []
+
+    def test_memoized_result_is_not_shared(self):
+        surf = self._make_inverted_surface()
+        first = surf.detect_inversions(threshold_bps=500)
+        first.clear()
+        assert surf.detect_inversions(threshold_bps=500)
+        assert len(surf.detect_inversions(threshold_bps=5_000)) < len(
+            surf.detect_inversions(threshold_bps=500)
+        )
+
+    def test_inversion_count_matches_detect(self):
+        surf = self._make_inverted_surface()
+        for threshold in (100.0, 500.0, 5_000.0):
+            assert surf.inversion_count(threshold) == len(surf.detect_inversions(threshold))
+
+    def test_batch_counts_match_per_surface(self):
+        prices = generate_synthetic_prices_batch(
+            300, np.full(6, 0.1), np.linspace(0.1, 0.6, 6), seed=3
+        )
+        surfaces = build_cagr_surfaces_batch([f"S{i}" for i in range(6)], prices)
+        surfaces.append(self._make_inverted_surface())
+        counts = count_inversions_batch(surfaces, threshold_bps=500)
+        assert counts.tolist() == [s.inversion_count(500) for s in surfaces]
+        assert count_inversions_batch([]).shape == (0,)
+
+    def test_matches_pairwise_scan_with_nan_tenors(self):
+        """Vectorized scan must return the same pairs, in order, as a nested loop."""
+        from src.config import TENOR_ORDER
+        rng = np.random.default_rng(11)
+        values = rng.normal(0.1, 0.2, len(TENOR_ORDER))
+        values[[2, 5]] = np.nan
+        surf = CAGRSurface("RND", dict(zip(TENOR_ORDER, values.tolist())), 0.0)
+        valid = [(t, v) for t, v in zip(TENOR_ORDER, values) if np.isfinite(v)]
+        expected = [
+            (a, b, (va - vb) * 10_000)
+            for i, (a, va) in enumerate(valid)
+            for b, vb in valid[i + 1:]
+            if (va - vb) * 10_000 > 100.0
+        ]
+        assert surf.detect_inversions(threshold_bps=100.0) == expected
+
+
+class TestFetchAll:
+
+    def test_concurrent_fetch_respects_limit_and_drops_failures(self, monkeypatch):
+        import asyncio
+        import threading
+        import time
+        import src.data_feed as data_feed
+
+        in_flight = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def fake_fetch(symbol, lookback_years=5):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.02)
+            with lock:
+                in_flight -= 1
+            return None if symbol == "BAD" else np.array([1.0, 2.0])
+
+        monkeypatch.setattr(data_feed, "fetch_adjusted_closes", fake_fetch)
+        symbols = ["A", "B", "BAD", "C", "D", "E"]
+        result = asyncio.run(data_feed.fetch_all(symbols, max_concurrency=2))
+        assert sorted(result) == ["A", "B", "C", "D", "E"]
+        assert peak <= 2
+
+
+class TestSyntheticPrices:
+
+    def test_symbol_seed_is_pinned_not_salted(self):
+        from src.data_feed import symbol_seed
+        # Fixed values: hash() would differ between interpreter runs
+        assert symbol_seed("SPY") == 787
+        assert symbol_seed("QQQ") == 949
+
+    def test_cached_path_is_read_only(self):
+        prices = generate_synthetic_prices(n_days=50, seed=5)
+        assert generate_synthetic_prices(n_days=50, seed=5) is prices
+        with pytest.raises(ValueError):
+            prices[0] = 0.0
+
+    def test_synthetic_prices_kernel_matches_numpy(self):
+        rng = np.random.default_rng(5)
+        drift, diffusion = 0.0004, 0.0126
+        shocks = rng.standard_normal(500)
+        from src.cagr_jit import gbm_path_jit
+        expected = np.insert(100.0 * np.exp(np.cumsum(drift + diffusion * shocks)), 0, 100.0)
+        np.testing.assert_allclose(gbm_path_jit(shocks, 100.0, drift, diffusion), expected, rtol=1e-12)
+
+    def test_synthetic_prices_numpy_fallback_matches_kernel(self, monkeypatch):
+        import src.data_feed as data_feed
+        expected = generate_synthetic_prices(n_days=300, seed=9)
+        monkeypatch.setattr(data_feed, "NUMBA_AVAILABLE", False)
+        data_feed.generate_synthetic_prices.cache_clear()
+        fallback = data_feed.generate_synthetic_prices(n_days=300, seed=9)
+        assert fallback.shape == (301,) and fallback[0] == 100.0
+        np.testing.assert_allclose(fallback, expected, rtol=1e-12)
+
+    def test_synthetic_batch_shape_and_start(self):
+        prices = generate_synthetic_prices_batch(
+            n_days=252, annual_returns=[0.05, 0.2, 0.1], annual_vols=[0.1, 0.3, 0.0],
+        )
+        assert prices.shape == (3, 253)
+        assert np.all(prices[:, 0] == 100.0)
+        # Zero vol → deterministic drift path
+        assert prices[2, -1] == pytest.approx(100.0 * np.exp(0.1), rel=1e-12)
+
+
+class TestClosesArray:
+
+    def test_sorts_only_out_of_order_bars(self):
+        import pandas as pd
+        from src.data_feed import _closes_array
+        idx = pd.date_range("2024-01-01", periods=4, freq="D")
+        in_order = pd.Series([1.0, 2.0, 3.0, 4.0], index=idx)
+        np.testing.assert_array_equal(_closes_array(in_order), [1.0, 2.0, 3.0, 4.0])
+        shuffled = in_order.iloc[[2, 0, 3, 1]]
+        out = _closes_array(shuffled)
+        np.testing.assert_array_equal(out, [1.0, 2.0, 3.0, 4.0])
+        assert out.dtype == np.float64 and out.flags.c_contiguous
+
+
+class TestRetryDelay:
+
+    def test_exponential_backoff_with_jitter_is_capped(self, monkeypatch):
+        import src.data_feed as data_feed
+        monkeypatch.setattr(data_feed.random, "uniform", lambda lo, hi: hi)
+        delays = [data_feed._retry_delay(a, RuntimeError("boom")) for a in (1, 2, 3, 10)]
+        assert delays == pytest.approx([0.45, 0.9, 1.8, 7.5])
+
+    def test_rate_limit_honors_retry_after(self):
+        import types
+        import src.data_feed as data_feed
+
+        def rate_limited(retry_after):
+            exc = RuntimeError("429")
+            exc.status_code = 429
+            exc.response = types.SimpleNamespace(headers={"Retry-After": retry_after})
+            return exc
+
+        assert data_feed._retry_delay(1, rate_limited("12")) == 12.0
+        assert data_feed._retry_delay(1, rate_limited("600")) == 60.0
+        # Unparseable header: regular jittered backoff
+        assert 0.15 <= data_feed._retry_delay(1, rate_limited("soon")) <= 0.45
+
+
+class TestDashboardCells:
+
+    def test_color_cagr_reuses_text_per_displayed_bucket(self):
+        from src.dashboard import _color_cagr
+        a = _color_cagr(0.123401)
+        assert a is _color_cagr(0.123399)
+        assert a.plain == " +12.34%" and str(a.style) == "green"
+        assert str(_color_cagr(-0.25).style) == "bold red"
+        assert _color_cagr(float("nan")).plain == "  N/A "
+
+
+class TestLoggerWiring:
+
+    def test_loggers_share_one_queue_handler_and_file(self):
+        from src import config
+        first = config.build_logger("cagr")
+        routed = config._LOG_ROUTER._files["cagr"]
+        again = config.build_logger("cagr")
+        assert again is first and again.handlers.count(config._QUEUE_HANDLER) == 1
+        assert config._LOG_ROUTER._files["cagr"] is routed
+        assert config._QUEUE_HANDLER in config.build_logger("data_feed").handlers
+
+    def test_logger_with_handlers_is_left_alone(self):
+        import logging
+        from src import config
+        logger = logging.getLogger("test_cagr.preconfigured")
+        own = logging.NullHandler()
+        logger.addHandler(own)
+        try:
+            assert config.build_logger("test_cagr.preconfigured").handlers == [own]
+            assert "test_cagr.preconfigured" not in config._LOG_ROUTER._files
+        finally:
+            logger.removeHandler(own)
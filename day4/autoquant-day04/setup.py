@@ -8,10 +8,12 @@ setup(
     python_requires=">=3.11",
     install_requires=[
         "alpaca-py>=0.13.0",
+        "numpy>=1.24",
         "rich>=13.0",
     ],
     extras_require={
         "dev": ["pytest>=7.4", "pytest-asyncio>=0.23"],
+        "fast": ["orjson>=3.9", "msgpack>=1.0"],
     },
 )
 
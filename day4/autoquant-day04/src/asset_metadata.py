@@ -3,8 +3,11 @@ AssetMetadata — immutable, schema-validated representation of a single asset.
 Uses __slots__ for memory efficiency and frozen=True for hashability.
 """
 from __future__ import annotations
+import sys
 import time
 from dataclasses import dataclass, field, asdict
+from operator import itemgetter
+from typing import Iterable
 import json
 
 try:
@@ -15,6 +18,15 @@ except ImportError:
     Asset = None  # type: ignore
 
 
+# Serialized field order (to_dict keys) — one C-level itemgetter pulls all of
+# them out of a record instead of seven separate subscripts.
+_DICT_FIELDS = (
+    "symbol", "exchange", "asset_class", "tradable", "fractionable",
+    "min_order_size", "price_increment",
+)
+_dict_values = itemgetter(*_DICT_FIELDS)
+
+
 @dataclass(frozen=True, slots=True)
 class AssetMetadata:
     """
@@ -30,12 +42,17 @@ class AssetMetadata:
     price_increment: float
     fetched_at: float  # time.monotonic() timestamp
     ttl_seconds: float = 3600.0
+    # fetched_at + ttl_seconds, fixed at construction: validity is one compare
+    expires_at: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "expires_at", self.fetched_at + self.ttl_seconds)
 
     # ── Validity ────────────────────────────────────────────────────────
     @property
     def is_valid(self) -> bool:
         """True if TTL has not expired."""
-        return (time.monotonic() - self.fetched_at) < self.ttl_seconds
+        return time.monotonic() < self.expires_at
 
     @property
     def age_seconds(self) -> float:
@@ -49,9 +66,9 @@ class AssetMetadata:
         All numeric fields are explicitly cast — Alpaca returns some as strings.
         """
         return cls(
-            symbol=str(asset.symbol),
-            exchange=str(asset.exchange.value) if hasattr(asset.exchange, "value") else str(asset.exchange),
-            asset_class=str(asset.asset_class.value) if hasattr(asset.asset_class, "value") else str(asset.asset_class),
+            symbol=sys.intern(str(asset.symbol)),
+            exchange=sys.intern(str(asset.exchange.value) if hasattr(asset.exchange, "value") else str(asset.exchange)),
+            asset_class=sys.intern(str(asset.asset_class.value) if hasattr(asset.asset_class, "value") else str(asset.asset_class)),
             tradable=bool(asset.tradable),
             fractionable=bool(asset.fractionable),
             min_order_size=float(asset.min_order_size) if asset.min_order_size is not None else 1.0,
@@ -63,16 +80,54 @@ class AssetMetadata:
     @classmethod
     def from_dict(cls, d: dict, ttl_seconds: float = 3600.0) -> "AssetMetadata":
         """Deserialize from JSON-safe dict. fetched_at resets to now on load."""
-        return cls(
-            symbol=d["symbol"],
-            exchange=d["exchange"],
-            asset_class=d["asset_class"],
-            tradable=bool(d["tradable"]),
-            fractionable=bool(d["fractionable"]),
-            min_order_size=float(d["min_order_size"]),
-            price_increment=float(d["price_increment"]),
-            fetched_at=time.monotonic(),  # reset — will revalidate within first TTL
-            ttl_seconds=ttl_seconds,
+        return cls.from_dicts((d,), ttl_seconds)[0]
+
+    @classmethod
+    def from_dicts(cls, dicts: Iterable[dict], ttl_seconds: float = 3600.0) -> list["AssetMetadata"]:
+        """
+        Batch from_dict for cold start: fields unpacked by one itemgetter
+        call, positional construction, and a single fetched_at shared by
+        the whole batch. String fields are interned: a registry holds a
+        handful of distinct exchange/asset_class values, not one copy each.
+        """
+        now = time.monotonic()  # reset — will revalidate within first TTL
+        intern = sys.intern
+        return [
+            cls(intern(symbol), intern(exchange), intern(asset_class), bool(tradable), bool(fractionable),
+                float(min_order_size), float(price_increment), now, ttl_seconds)
+            for symbol, exchange, asset_class, tradable, fractionable, min_order_size, price_increment
+            in map(_dict_values, dicts)
+        ]
+
+    @classmethod
+    def from_record(cls, rec: list | tuple, ttl_seconds: float = 3600.0) -> "AssetMetadata":
+        """Inverse of to_record(). fetched_at resets to now on load."""
+        return cls.from_records((rec,), ttl_seconds)[0]
+
+    @classmethod
+    def from_records(cls, recs: Iterable[list | tuple], ttl_seconds: float = 3600.0) -> list["AssetMetadata"]:
+        """Batch from_record with one fetched_at for the whole batch."""
+        now = time.monotonic()
+        intern = sys.intern
+        return [
+            cls(intern(symbol), intern(exchange), intern(asset_class), bool(flags & 1), bool(flags & 2),
+                float(min_order_size), float(price_increment), now, ttl_seconds)
+            for symbol, exchange, asset_class, flags, min_order_size, price_increment in recs
+        ]
+
+    def to_record(self) -> tuple:
+        """
+        Compact positional form for binary persistence: field names are
+        implied by position, the two booleans share one flags int
+        (bit 0 tradable, bit 1 fractionable). fetched_at is excluded.
+        """
+        return (
+            self.symbol,
+            self.exchange,
+            self.asset_class,
+            int(self.tradable) | int(self.fractionable) << 1,
+            self.min_order_size,
+            self.price_increment,
         )
 
     def to_dict(self) -> dict:
@@ -9,38 +9,265 @@ Design contract:
 """
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import os
+import random
+import sys
 import time
 from collections.abc import Iterator, MutableMapping
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import replace
+from functools import lru_cache
 from pathlib import Path
-from typing import Generator
+from typing import Callable, Generator
+
+import numpy as np
 
 from src.asset_metadata import AssetMetadata
 
+# Optional fast JSON codec — falls back to stdlib json with identical output shape
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional binary codec for the on-disk cache
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Binary registry files start with this; JSON never does (it opens with "{")
+_MSGPACK_MAGIC = b"AQ"
+
+
+def _json_dumps(payload: dict) -> bytes:
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+    return json.dumps(payload, indent=2).encode()
+
+
+def _json_loads(data: bytes) -> dict:
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+
+def _encode_registry(entries: dict[str, AssetMetadata], binary: bool) -> bytes:
+    """
+    Serialize {key: metadata}. Binary form: magic + msgpack list of
+    [key, *metadata.to_record()] rows — no per-record field names.
+    Falls back to JSON when msgpack is not installed.
+    """
+    if binary and MSGPACK_AVAILABLE:
+        rows = [(key, *meta.to_record()) for key, meta in entries.items()]
+        return _MSGPACK_MAGIC + msgpack.packb(rows, use_bin_type=True)
+    return _json_dumps({key: meta.to_dict() for key, meta in entries.items()})
+
+
+def _decode_registry(data: bytes, ttl_seconds: float) -> dict[str, AssetMetadata]:
+    """Inverse of _encode_registry; the format is detected from the magic."""
+    if data[:2] == _MSGPACK_MAGIC:
+        if not MSGPACK_AVAILABLE:
+            raise RuntimeError("Registry file is msgpack-encoded but msgpack is not installed")
+        rows = msgpack.unpackb(data[2:], raw=False)
+        metas = AssetMetadata.from_records((row[1:] for row in rows), ttl_seconds)
+        return dict(zip(map(sys.intern, (row[0] for row in rows)), metas))
+    raw = _json_loads(data)
+    return dict(zip(map(sys.intern, raw), AssetMetadata.from_dicts(raw.values(), ttl_seconds)))
+
+
+def _write_registry(target: Path, entries: dict[str, AssetMetadata]) -> None:
+    """
+    Encode and write atomically: the bytes go to a sibling temp file that
+    os.replace() swaps in, so a crash mid-write never leaves a truncated
+    registry for the next cold start.
+    """
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp = target.with_name(target.name + ".tmp")
+    tmp.write_bytes(_encode_registry(entries, binary=target.suffix == ".msgpack"))
+    os.replace(tmp, target)
+    logger.info("Registry persisted: %d entries → %s", len(entries), target)
+
+
 # ── Backoff Generator ────────────────────────────────────────────────────────
 
+_BACKOFF_BASE = 0.5
+_BACKOFF_FACTOR = 2.0
+_BACKOFF_CAP = 30.0
+
+
 def _exponential_delays(
-    base: float = 0.5, factor: float = 2.0, cap: float = 30.0
+    base: float = _BACKOFF_BASE,
+    factor: float = _BACKOFF_FACTOR,
+    cap: float = _BACKOFF_CAP,
+    rng: random.Random | None = None,
 ) -> Generator[float, None, None]:
-    """Yields exponentially increasing delays, capped at `cap` seconds."""
+    """
+    Yields exponentially increasing delays, capped at `cap` seconds, each
+    scaled by a uniform(0.5, 1.5) jitter so concurrent prefetch workers
+    that fail together don't retry in lockstep. Pass `rng` for
+    reproducible sequences.
+    """
+    uniform = (rng or random).uniform
     delay = base
     while True:
-        yield min(delay, cap)
+        yield min(delay, cap) * uniform(0.5, 1.5)
         delay *= factor
 
 
+# ── Refresh Policy ───────────────────────────────────────────────────────────
+
+_TTL_GROWTH = 1.5
+_TTL_CAP = 86400.0
+
+RefreshPolicy = Callable[[AssetMetadata | None, AssetMetadata], float]
+
+
+def change_aware_ttl(previous: AssetMetadata | None, fetched: AssetMetadata) -> float:
+    """
+    Default refresh policy. A refetch that returns exactly what was cached
+    stretches the symbol's TTL by 1.5× (capped at one day), so stable
+    names like SPY stop costing an API call every hour; any change — or a
+    first fetch — resets to the registry's base TTL (`fetched.ttl_seconds`).
+    """
+    if previous is not None and previous.to_dict() == fetched.to_dict():
+        return min(previous.ttl_seconds * _TTL_GROWTH, _TTL_CAP)
+    return fetched.ttl_seconds
+
+
 # ── Canonical Key ─────────────────────────────────────────────────────────────
 
+@lru_cache(maxsize=4096)
 def _normalize_symbol(raw: str) -> str:
     """
     Normalize ticker symbol to Alpaca canonical form.
     BRK.B -> BRK/B, lowercase -> uppercase, strip whitespace.
+
+    Memoized: a strategy's universe is small and hit repeatedly, so warm
+    lookups skip the three temporary strings. The result is interned so
+    every spelling maps to one shared key object.
     """
-    return raw.strip().upper().replace(".", "/")
+    return sys.intern(raw.strip().upper().replace(".", "/"))
+
+
+# ── Store ─────────────────────────────────────────────────────────────────────
+
+class _TTLStore(dict):
+    """
+    symbol → AssetMetadata dict that also keeps every entry's expiry
+    (expires_at) in a parallel float64 array, so whole-store
+    validity is one vectorized compare instead of a per-entry Python loop.
+
+    Reads are plain dict reads. Writes go through __setitem__ / __delitem__
+    (and the mutators below), which keep `_expires` row-aligned with `_keys`;
+    deletion swaps the last row into the hole.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._row: dict[str, int] = {}
+        self._keys: list[str] = []
+        self._expires = np.empty(64, dtype=np.float64)
+
+    def _reserve(self, n_rows: int) -> None:
+        """Geometric growth: amortized O(1) appends."""
+        capacity = len(self._expires)
+        if n_rows > capacity:
+            grown = np.empty(max(2 * capacity, n_rows), dtype=np.float64)
+            grown[: len(self._keys)] = self._expires[: len(self._keys)]
+            self._expires = grown
+
+    def __setitem__(self, key: str, meta: AssetMetadata) -> None:
+        row = self._row.get(key)
+        if row is None:
+            row = len(self._keys)
+            self._reserve(row + 1)
+            self._row[key] = row
+            self._keys.append(key)
+        self._expires[row] = meta.expires_at
+        super().__setitem__(key, meta)
+
+    def load(self, entries: dict[str, AssetMetadata]) -> None:
+        """
+        Bulk insert for cold start. A dict-to-dict merge sizes the hash
+        table once (no incremental rehashes) and runs in C; new rows are
+        appended and their expiries written in one vectorized store.
+        """
+        row = self._row
+        expires = self._expires
+        new_keys = []
+        for key, meta in entries.items():
+            existing = row.get(key)
+            if existing is None:
+                new_keys.append(key)
+            else:
+                expires[existing] = meta.expires_at
+        start = len(self._keys)
+        self._reserve(start + len(new_keys))
+        self._expires[start : start + len(new_keys)] = np.fromiter(
+            (entries[key].expires_at for key in new_keys),
+            dtype=np.float64,
+            count=len(new_keys),
+        )
+        row.update(zip(new_keys, range(start, start + len(new_keys))))
+        self._keys.extend(new_keys)
+        super().update(entries)
+
+    def __delitem__(self, key: str) -> None:
+        super().__delitem__(key)
+        row = self._row.pop(key)
+        last = self._keys.pop()
+        if last != key:
+            self._keys[row] = last
+            self._row[last] = row
+            self._expires[row] = self._expires[len(self._keys)]
+
+    _MISSING = object()
+
+    def pop(self, key, default=_MISSING):
+        if key not in self:
+            if default is _TTLStore._MISSING:
+                raise KeyError(key)
+            return default
+        value = super().__getitem__(key)
+        del self[key]
+        return value
+
+    def popitem(self):
+        if not self._keys:
+            raise KeyError("popitem(): dictionary is empty")
+        key = self._keys[-1]
+        return key, self.pop(key)
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args, **kwargs) -> None:
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def clear(self) -> None:
+        super().clear()
+        self._row.clear()
+        self._keys.clear()
+
+    def valid_mask(self, now: float) -> np.ndarray:
+        """Boolean mask over `_keys`: True where the entry has not expired."""
+        return self._expires[: len(self._keys)] > now
+
+    def count_valid(self, now: float) -> int:
+        return int(np.count_nonzero(self.valid_mask(now)))
+
+    def valid_keys(self, now: float) -> list[str]:
+        keys = self._keys
+        return [keys[i] for i in np.flatnonzero(self.valid_mask(now)).tolist()]
 
 
 # ── Registry ──────────────────────────────────────────────────────────────────
@@ -54,17 +281,27 @@ class AssetRegistry(MutableMapping):
     Use prefetch() at strategy startup to warm the cache in a single API batch call.
     """
 
-    _PERSIST_PATH = Path("data/asset_registry.json")
+    _PERSIST_PATH = Path("data/asset_registry.msgpack")
+    # Pre-msgpack default; still read on cold start if no binary file exists
+    _LEGACY_PERSIST_PATH = Path("data/asset_registry.json")
 
     def __init__(
         self,
         ttl_seconds: float = 3600.0,
         max_retries: int = 3,
         alpaca_client=None,
+        refresh_policy: RefreshPolicy = change_aware_ttl,
     ) -> None:
-        self._store: dict[str, AssetMetadata] = {}
+        self._store: _TTLStore = _TTLStore()
         self._ttl = ttl_seconds
+        # (cached entry or None, fresh fetch) → TTL for the fresh entry
+        self._refresh_policy = refresh_policy
         self._max_retries = max_retries
+        # AIMD backoff start: grows on rate-limited (429) attempts, decays on
+        # success, so a throttled burst starts later retries from the learned
+        # delay. Only the single-threaded lookup path writes it.
+        self._backoff_base = _BACKOFF_BASE
+        self._persist_pool: ThreadPoolExecutor | None = None  # created by persist_async
         self._client = alpaca_client  # alpaca.trading.TradingClient
         self._miss_count = 0
         self._hit_count = 0
@@ -72,9 +309,10 @@ class AssetRegistry(MutableMapping):
     # ── MutableMapping ABC ──────────────────────────────────────────────────
 
     def __getitem__(self, symbol: str) -> AssetMetadata:
+        # Hot path: one dict probe, validity inlined (no is_valid property call)
         key = _normalize_symbol(symbol)
         entry = self._store.get(key)
-        if entry is not None and entry.is_valid:
+        if entry is not None and time.monotonic() < entry.expires_at:
             self._hit_count += 1
             return entry
         # Cache miss or expired entry
@@ -83,9 +321,15 @@ class AssetRegistry(MutableMapping):
     def __missing__(self, key: str) -> AssetMetadata:
         self._miss_count += 1
         logger.debug("Cache miss for %s — fetching from Alpaca", key)
-        metadata = self._fetch_with_backoff(key)
-        self._store[key] = metadata
-        return metadata
+        return self._admit(key, self._fetch_with_backoff(key))
+
+    def _admit(self, key: str, fetched: AssetMetadata) -> AssetMetadata:
+        """Store a fresh fetch under the TTL chosen by the refresh policy."""
+        ttl = self._refresh_policy(self._store.get(key), fetched)
+        if ttl != fetched.ttl_seconds:
+            fetched = replace(fetched, ttl_seconds=ttl)  # recomputes expires_at
+        self._store[key] = fetched
+        return fetched
 
     def __setitem__(self, symbol: str, metadata: AssetMetadata) -> None:
         self._store[_normalize_symbol(symbol)] = metadata
@@ -98,19 +342,35 @@ class AssetRegistry(MutableMapping):
 
     def __len__(self) -> int:
         """Returns count of non-expired entries only."""
-        return sum(1 for v in self._store.values() if v.is_valid)
+        return self._store.count_valid(time.monotonic())
+
+    def get(self, symbol: str, default: AssetMetadata | None = None) -> AssetMetadata | None:
+        """
+        The valid cached entry for `symbol`, else `default` — never fetches.
+        Prefer this over `if sym in reg: reg[sym]` in hot loops: one
+        normalization and one dict probe instead of two.
+        (Mapping.get would call __getitem__ and fetch on a miss.)
+        """
+        entry = self._store.get(_normalize_symbol(symbol))
+        if entry is not None and time.monotonic() < entry.expires_at:
+            self._hit_count += 1
+            return entry
+        return default
 
     def __contains__(self, symbol: object) -> bool:
         if not isinstance(symbol, str):
             return False
-        key = _normalize_symbol(symbol)
-        entry = self._store.get(key)
-        return entry is not None and entry.is_valid
+        entry = self._store.get(_normalize_symbol(symbol))
+        return entry is not None and time.monotonic() < entry.expires_at
 
     # ── Fetch Logic ──────────────────────────────────────────────────────────
 
-    def _fetch_with_backoff(self, symbol: str) -> AssetMetadata:
-        """Fetch asset from Alpaca with exponential backoff on rate-limit errors."""
+    def _fetch_with_backoff(self, symbol: str, adapt: bool = True) -> AssetMetadata:
+        """
+        Fetch asset from Alpaca with exponential backoff on rate-limit errors.
+        With adapt=False (prefetch workers) the learned backoff start is read
+        but never updated, so concurrent failures can't compound it.
+        """
         if self._client is None:
             raise RuntimeError(
                 f"No Alpaca client configured. Cannot fetch metadata for {symbol!r}. "
@@ -118,15 +378,21 @@ class AssetRegistry(MutableMapping):
             )
         last_exc: Exception | None = None
         for attempt, delay in enumerate(
-            _exponential_delays(), start=1
+            _exponential_delays(base=self._backoff_base, factor=_BACKOFF_FACTOR), start=1
         ):
             if attempt > self._max_retries:
                 break
             try:
                 asset = self._client.get_asset(symbol)
+                if adapt:
+                    self._backoff_base = max(_BACKOFF_BASE, self._backoff_base / _BACKOFF_FACTOR)
                 return AssetMetadata.from_alpaca_asset(asset, ttl_seconds=self._ttl)
             except Exception as exc:
                 last_exc = exc
+                if adapt and getattr(exc, "status_code", None) == 429:
+                    self._backoff_base = min(_BACKOFF_CAP, self._backoff_base * _BACKOFF_FACTOR)
+                if attempt == self._max_retries:
+                    break  # no point sleeping before giving up
                 logger.warning(
                     "Attempt %d/%d failed for %s: %s — retrying in %.1fs",
                     attempt, self._max_retries, symbol, exc, delay,
@@ -139,21 +405,55 @@ class AssetRegistry(MutableMapping):
 
     # ── Batch Prefetch ────────────────────────────────────────────────────────
 
-    def prefetch(self, symbols: list[str]) -> dict[str, AssetMetadata | Exception]:
+    def prefetch(
+        self, symbols: list[str], max_workers: int = 16
+    ) -> dict[str, AssetMetadata | Exception]:
         """
-        Populate cache for a list of symbols using individual fetches.
-        Returns a dict of {symbol: AssetMetadata | Exception}.
+        Populate cache for a list of symbols.
+        Returns a dict of {symbol: AssetMetadata | Exception}, in input order.
+
+        Valid entries are served from cache; the misses (one per canonical
+        key) are fetched concurrently on a thread pool, so wall time is
+        roughly the slowest fetch rather than the sum. Results are stored
+        from this thread as they complete — workers never touch _store.
         In production, replace with a single /v2/assets?symbols= batch call
         when Alpaca supports it.
         """
         results: dict[str, AssetMetadata | Exception] = {}
+        pending: dict[str, list[str]] = {}  # canonical key → requested spellings
+        now = time.monotonic()
         for sym in symbols:
-            try:
-                results[sym] = self[sym]
-            except Exception as exc:
-                results[sym] = exc
-                logger.error("prefetch failed for %s: %s", sym, exc)
-        return results
+            key = _normalize_symbol(sym)
+            entry = self._store.get(key)
+            if entry is not None and now < entry.expires_at:
+                self._hit_count += 1
+                results[sym] = entry
+            else:
+                pending.setdefault(key, []).append(sym)
+
+        if pending:
+            self._miss_count += len(pending)
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(pending))) as pool:
+                futures = {pool.submit(self._fetch_with_backoff, key, False): key for key in pending}
+                for future in as_completed(futures):
+                    key = futures[future]
+                    try:
+                        outcome: AssetMetadata | Exception = self._admit(key, future.result())
+                    except Exception as exc:
+                        outcome = exc
+                        logger.error("prefetch failed for %s: %s", key, exc)
+                    for sym in pending[key]:
+                        results[sym] = outcome
+        return {sym: results[sym] for sym in symbols}
+
+    async def async_prefetch(
+        self, symbols: list[str], max_workers: int = 16
+    ) -> dict[str, AssetMetadata | Exception]:
+        """
+        prefetch() for async callers: runs off the event loop so the
+        strategy keeps ticking while the (sync) Alpaca client fetches.
+        """
+        return await asyncio.to_thread(self.prefetch, symbols, max_workers)
 
     # ── Metrics ──────────────────────────────────────────────────────────────
 
@@ -175,32 +475,49 @@ class AssetRegistry(MutableMapping):
     # ── Persistence ───────────────────────────────────────────────────────────
 
     def persist(self, path: Path | None = None) -> None:
-        """Serialize valid entries to JSON for cold-start recovery."""
+        """
+        Serialize valid entries for cold-start recovery: msgpack rows for a
+        .msgpack path (the default), JSON for anything else.
+        """
         target = path or self._PERSIST_PATH
-        target.parent.mkdir(parents=True, exist_ok=True)
-        payload = {
-            sym: meta.to_dict()
-            for sym, meta in self._store.items()
-            if meta.is_valid
-        }
-        target.write_text(json.dumps(payload, indent=2))
-        logger.info("Registry persisted: %d entries → %s", len(payload), target)
+        _write_registry(target, self._valid_snapshot())
+
+    async def persist_async(self, path: Path | None = None) -> None:
+        """
+        persist() without blocking the event loop: the valid entries are
+        snapshotted here (cheap, on the loop thread, so no concurrent
+        mutation is seen), then encoded and written on the registry's
+        single persist thread — back-to-back calls land in order.
+        """
+        target = path or self._PERSIST_PATH
+        snapshot = self._valid_snapshot()
+        if self._persist_pool is None:
+            self._persist_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="registry-persist")
+        await asyncio.get_running_loop().run_in_executor(
+            self._persist_pool, _write_registry, target, snapshot
+        )
+
+    def _valid_snapshot(self) -> dict[str, AssetMetadata]:
+        store = self._store
+        return {sym: store[sym] for sym in store.valid_keys(time.monotonic())}
 
     def load_from_disk(self, path: Path | None = None) -> int:
         """
-        Load entries from disk. Entries are marked with current fetched_at
-        (so they are valid but will be refreshed within one TTL window).
+        Load entries from disk (msgpack or JSON, detected from the file).
+        Entries are marked with current fetched_at (so they are valid but
+        will be refreshed within one TTL window).
         Returns number of entries loaded.
         """
         target = path or self._PERSIST_PATH
+        if path is None and not target.exists():
+            target = self._LEGACY_PERSIST_PATH
         if not target.exists():
             logger.info("No persisted registry found at %s", target)
             return 0
-        raw = json.loads(target.read_text())
-        for sym, d in raw.items():
-            self._store[sym] = AssetMetadata.from_dict(d, ttl_seconds=self._ttl)
-        logger.info("Registry cold-start: %d entries loaded from %s", len(raw), target)
-        return len(raw)
+        loaded = _decode_registry(target.read_bytes(), self._ttl)
+        self._store.load(loaded)
+        logger.info("Registry cold-start: %d entries loaded from %s", len(loaded), target)
+        return len(loaded)
 
     # ── Force Invalidate ──────────────────────────────────────────────────────
 
@@ -209,6 +526,17 @@ class AssetRegistry(MutableMapping):
         key = _normalize_symbol(symbol)
         self._store.pop(key, None)
 
+    def compact(self) -> None:
+        """
+        Rebuild the store at its current size. dicts never shrink on delete,
+        so after heavy invalidation churn the hash table (and the expiry
+        array) stay sized for the peak; call this after warmup or a large
+        eviction wave to get a tight, tombstone-free table back.
+        """
+        compacted = _TTLStore()
+        compacted.load(dict(self._store))
+        self._store = compacted
+
     def invalidate_all(self) -> None:
         """Nuke the entire cache. Use after a corporate action event."""
         self._store.clear()
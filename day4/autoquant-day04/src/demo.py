@@ -59,13 +59,15 @@ def _make_table(registry: AssetRegistry, symbols: list[str]) -> Table:
     table.add_column("Age (s)", width=10)
     table.add_column("Status", width=10)
 
+    now = time.monotonic()  # one clock read: every row's age/status share it
     for sym in symbols:
         meta = registry._store.get(sym)
         if meta is None:
             table.add_row(sym, "-", "-", "-", "-", "-", "-", "[dim]UNCACHED[/dim]")
             continue
-        age = f"{meta.age_seconds:.0f}"
-        status = "[green]VALID[/green]" if meta.is_valid else "[red]EXPIRED[/red]"
+        age_s = now - meta.fetched_at
+        age = f"{age_s:.0f}"
+        status = "[green]VALID[/green]" if now < meta.expires_at else "[red]EXPIRED[/red]"
         table.add_row(
             meta.symbol,
             meta.exchange,
@@ -135,7 +137,7 @@ def run_demo() -> None:
 
     # Persist to disk
     registry.persist()
-    console.print("\n[dim]Registry persisted to data/asset_registry.json[/dim]")
+    console.print("\n[dim]Registry persisted to data/asset_registry.msgpack[/dim]")
 
 if __name__ == "__main__":
     run_demo()
@@ -6,6 +6,9 @@ from __future__ import annotations
 
 import random
 import time
+from array import array
+
+import numpy as np
 
 from src.asset_registry import AssetRegistry
 from src.asset_metadata import AssetMetadata
@@ -30,30 +33,35 @@ def run():
 
     print(f"Stress test: {N_LOOKUPS:,} lookups across {N_ASSETS} assets (warm cache)\n")
 
-    times_ms = []
-    t_total = time.monotonic()
-    for _ in range(N_LOOKUPS):
-        sym = random.choice(symbols)
-        t0 = time.perf_counter()
+    # Access sequence drawn up front: the timed loop measures only the registry
+    picks = random.choices(symbols, k=N_LOOKUPS)
+    times_ns = array("q", bytes(8 * N_LOOKUPS))  # preallocated, no append resizes
+    clock = time.perf_counter_ns
+
+    t_total = time.perf_counter_ns()
+    for i, sym in enumerate(picks):
+        t0 = clock()
         _ = registry[sym]
-        times_ms.append((time.perf_counter() - t0) * 1_000)
+        times_ns[i] = clock() - t0
+    total_s = (time.perf_counter_ns() - t_total) / 1e9
 
-    total_s = time.monotonic() - t_total
-    times_ms.sort()
-    p = lambda pct: times_ms[int(len(times_ms) * pct)]
+    # O(N) selection of just the percentiles we report, instead of a full sort
+    lat_ns = np.frombuffer(times_ns, dtype=np.int64)
+    ranks = [int(N_LOOKUPS * q) for q in (0.50, 0.95, 0.99)] + [N_LOOKUPS - 1]
+    p50, p95, p99, worst = np.partition(lat_ns, ranks)[ranks] / 1e6
 
     print(f"  Total wall time : {total_s*1000:.1f}ms")
     print(f"  Throughput      : {N_LOOKUPS/total_s:,.0f} lookups/sec")
-    print(f"  P50 latency     : {p(0.50):.4f}ms")
-    print(f"  P95 latency     : {p(0.95):.4f}ms")
-    print(f"  P99 latency     : {p(0.99):.4f}ms")
-    print(f"  Max latency     : {times_ms[-1]:.4f}ms")
+    print(f"  P50 latency     : {p50:.4f}ms")
+    print(f"  P95 latency     : {p95:.4f}ms")
+    print(f"  P99 latency     : {p99:.4f}ms")
+    print(f"  Max latency     : {worst:.4f}ms")
     print(f"\n  Hit rate        : {registry.hit_rate:.2%}")
 
-    if p(0.99) < 5.0:
+    if p99 < 5.0:
         print("\n  \033[92m✓ P99 < 5ms — PASS\033[0m")
     else:
-        print(f"\n  \033[91m✗ P99 {p(0.99):.3f}ms > 5ms — FAIL\033[0m")
+        print(f"\n  \033[91m✗ P99 {p99:.3f}ms > 5ms — FAIL\033[0m")
 
 
 if __name__ == "__main__":
@@ -8,8 +8,11 @@ import json
 import sys
 import time
 import random
+from array import array
 from pathlib import Path
 
+import numpy as np
+
 from src.asset_registry import AssetRegistry
 from src.asset_metadata import AssetMetadata
 
@@ -45,18 +48,22 @@ def run_verify():
         f"Cold-start: {count} assets loaded in {cold_start_ms:.1f}ms (target: <2000ms)"))
 
     # ── Test 2: Hit rate ────────────────────────────────────────────────────
-    for _ in range(10_000):
-        reg[random.choice(SYMBOLS[:500])]
+    for sym in random.choices(SYMBOLS[:500], k=10_000):
+        reg[sym]
     results.append(check(reg.hit_rate > 0.99,
         f"Hit rate: {reg.hit_rate:.2%} (target: >99%)"))
 
     # ── Test 3: P99 latency ─────────────────────────────────────────────────
-    times = []
-    for _ in range(10_000):
-        t = time.monotonic()
-        reg[random.choice(SYMBOLS[:500])]
-        times.append((time.monotonic() - t) * 1000)
-    p99 = sorted(times)[int(len(times) * 0.99)]
+    # Picks drawn before timing; only the lookup is inside the clock reads
+    picks = random.choices(SYMBOLS[:500], k=10_000)
+    times_ns = array("q", bytes(8 * len(picks)))
+    clock = time.perf_counter_ns
+    for i, sym in enumerate(picks):
+        t = clock()
+        reg[sym]
+        times_ns[i] = clock() - t
+    k99 = int(len(times_ns) * 0.99)
+    p99 = np.partition(np.frombuffer(times_ns, dtype=np.int64), k99)[k99] / 1e6
     results.append(check(p99 < 5.0, f"P99 lookup latency: {p99:.3f}ms (target: <5ms)"))
 
     # ── Test 4: TTL invalidation triggers re-fetch ──────────────────────────
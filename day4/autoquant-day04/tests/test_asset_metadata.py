@@ -1,4 +1,5 @@
 """Unit tests for AssetMetadata dataclass."""
+import json
 import time
 import pytest
 from src.asset_metadata import AssetMetadata
@@ -21,6 +22,12 @@ def test_is_valid_expired():
     assert _meta(ttl=3600.0, age=4000.0).is_valid is False
 
 
+def test_expires_at_is_precomputed_deadline():
+    meta = _meta(ttl=60.0)
+    assert meta.expires_at == meta.fetched_at + 60.0
+    assert "expires_at" not in repr(meta)
+
+
 def test_age_seconds_approx():
     meta = _meta(age=100.0)
     assert 99.0 < meta.age_seconds < 101.0
@@ -35,12 +42,42 @@ def test_to_dict_roundtrip():
     assert restored.is_valid  # from_dict resets fetched_at to now
 
 
+def test_record_roundtrip():
+    original = _meta()
+    rec = original.to_record()
+    assert rec[3] == 0b11  # tradable | fractionable
+    assert AssetMetadata.from_record(rec).to_dict() == original.to_dict()
+
+
+def test_batch_decoders_share_one_fetched_at():
+    original = _meta()
+    metas = AssetMetadata.from_dicts([original.to_dict()] * 3, ttl_seconds=60.0)
+    assert len({m.fetched_at for m in metas}) == 1
+    assert all(m.to_dict() == original.to_dict() and m.ttl_seconds == 60.0 for m in metas)
+    recs = AssetMetadata.from_records([original.to_record()] * 2)
+    assert recs[0] == recs[1] and recs[0].to_dict() == original.to_dict()
+
+
+def test_decoded_string_fields_are_interned():
+    dicts = json.loads(json.dumps([_meta().to_dict(), _meta().to_dict()]))
+    a, b = AssetMetadata.from_dicts(dicts)
+    assert a.exchange is b.exchange and a.asset_class is b.asset_class and a.symbol is b.symbol
+
+
 def test_frozen_immutability():
     meta = _meta()
     with pytest.raises(Exception):  # FrozenInstanceError
         meta.symbol = "TSLA"  # type: ignore
 
 
+def test_slots_layout_has_no_instance_dict():
+    meta = _meta()
+    assert not hasattr(meta, "__dict__")
+    assert set(AssetMetadata.__slots__) == set(meta.to_dict()) | {
+        "fetched_at", "ttl_seconds", "expires_at",
+    }
+
+
 def test_min_order_size_is_float():
     meta = AssetMetadata(
         symbol="X", exchange="NYSE", asset_class="us_equity",
@@ -1,9 +1,17 @@
 """Unit tests for AssetRegistry MutableMapping."""
+import asyncio
 import json
+import random
+import sys
+import threading
 import time
 import pytest
+from dataclasses import replace
+from itertools import islice
 from pathlib import Path
-from src.asset_registry import AssetRegistry, _normalize_symbol
+from types import SimpleNamespace
+import src.asset_registry as asset_registry
+from src.asset_registry import AssetRegistry, _exponential_delays, _normalize_symbol
 from src.asset_metadata import AssetMetadata
 
 
@@ -28,6 +36,41 @@ def test_normalize_strip_whitespace():
     assert _normalize_symbol("  TSLA  ") == "TSLA"
 
 
+def test_normalize_returns_one_shared_key():
+    assert _normalize_symbol("brk.b") is _normalize_symbol(" BRK.B ")
+
+
+# ── Backoff ──────────────────────────────────────────────────────────────────
+
+def test_backoff_is_jittered_capped_and_reproducible():
+    delays = list(islice(_exponential_delays(rng=random.Random(7)), 8))
+    assert delays == list(islice(_exponential_delays(rng=random.Random(7)), 8))
+    for nominal, d in zip([0.5, 1, 2, 4, 8, 16, 30, 30], delays):
+        assert 0.5 * nominal <= d <= 1.5 * nominal
+
+
+def test_backoff_start_grows_on_rate_limit_and_decays_on_success(monkeypatch):
+    monkeypatch.setattr(asset_registry.time, "sleep", lambda s: None)
+    client = _SlowClient(delay=0.0)
+    reg = AssetRegistry(max_retries=2, alpaca_client=client)
+    with pytest.raises(RuntimeError):
+        reg._fetch_with_backoff("THROTTLED")
+    assert reg._backoff_base == 2.0
+    reg._fetch_with_backoff("GOOD")
+    assert reg._backoff_base == 1.0
+    assert client.calls == ["THROTTLED", "THROTTLED", "GOOD"]
+
+
+def test_backoff_start_ignores_other_errors_and_prefetch_workers(monkeypatch):
+    monkeypatch.setattr(asset_registry.time, "sleep", lambda s: None)
+    reg = AssetRegistry(max_retries=3, alpaca_client=_SlowClient(delay=0.0))
+    with pytest.raises(RuntimeError):
+        reg._fetch_with_backoff("BAD")  # "unknown symbol" is not a 429
+    results = reg.prefetch(["BAD", "THROTTLED", "THROTTLED2"])
+    assert all(isinstance(r, RuntimeError) for r in results.values())
+    assert reg._backoff_base == 0.5
+
+
 # ── Cache Behavior ───────────────────────────────────────────────────────────
 
 def test_getitem_returns_valid_cached():
@@ -48,12 +91,44 @@ def test_expired_entry_triggers_miss():
     assert reg._miss_count == 1
 
 
+def test_unchanged_refetch_stretches_ttl_and_change_resets_it():
+    client = _SlowClient(delay=0.0)
+    reg = AssetRegistry(ttl_seconds=3600.0, alpaca_client=client)
+    reg._store["AAPL"] = _mock_meta("AAPL", ttl=60_000.0, age=70_000.0)
+    assert reg["AAPL"].ttl_seconds == 86400.0  # 90_000 capped to one day
+    reg._store["MSFT"] = _mock_meta("MSFT", ttl=7200.0, age=8000.0)
+    assert reg["MSFT"].ttl_seconds == 10800.0
+    reg._store["TSLA"] = replace(_mock_meta("TSLA", ttl=7200.0, age=8000.0), tradable=False)
+    fresh = reg["TSLA"]
+    assert fresh.ttl_seconds == 3600.0 and fresh.tradable
+    assert fresh.expires_at == fresh.fetched_at + 3600.0
+
+
+def test_custom_refresh_policy_receives_cached_and_fetched():
+    seen = []
+    policy = lambda old, new: seen.append((old, new)) or 42.0
+    reg = AssetRegistry(max_retries=1, alpaca_client=_SlowClient(delay=0.0), refresh_policy=policy)
+    assert reg["NEW"].ttl_seconds == 42.0
+    assert seen[0][0] is None and seen[0][1].symbol == "NEW"
+    assert reg.prefetch(["OTHER"])["OTHER"].ttl_seconds == 42.0
+
+
 def test_contains_excludes_expired():
     reg = AssetRegistry()
     reg._store["EXPIRED"] = _mock_meta("EXPIRED", ttl=10.0, age=100.0)
     assert "EXPIRED" not in reg
 
 
+def test_get_returns_valid_entry_or_default_without_fetching():
+    reg = AssetRegistry()
+    reg._store["AAPL"] = _mock_meta("AAPL")
+    reg._store["OLD"] = _mock_meta("OLD", ttl=10.0, age=100.0)
+    assert reg.get("aapl") is reg._store["AAPL"]
+    assert reg.get("OLD") is None
+    assert reg.get("NOPE", "fallback") == "fallback"  # no client: would raise if it fetched
+    assert (reg._hit_count, reg._miss_count) == (1, 0)
+
+
 def test_len_excludes_expired():
     reg = AssetRegistry()
     reg._store["VALID"] = _mock_meta("VALID", age=0.0)
@@ -61,6 +136,47 @@ def test_len_excludes_expired():
     assert len(reg) == 1
 
 
+def test_len_tracks_deletes_and_overwrites():
+    reg = AssetRegistry()
+    for i in range(100):  # past the initial expiry-array capacity
+        reg._store[f"S{i}"] = _mock_meta(f"S{i}", ttl=10.0, age=100.0 if i % 2 else 0.0)
+    assert len(reg) == 50
+    del reg._store["S0"]                       # valid row, swapped with the last
+    reg._store.pop("S1")                       # expired row
+    reg._store["S3"] = _mock_meta("S3")        # expired → refreshed in place
+    assert len(reg) == 50
+    assert sorted(reg._store.valid_keys(time.monotonic())) == sorted(
+        k for k, v in reg._store.items() if v.is_valid
+    )
+    reg.invalidate_all()
+    assert len(reg) == 0
+
+
+def test_bulk_load_merges_with_existing_entries():
+    reg = AssetRegistry()
+    reg._store["OLD"] = _mock_meta("OLD", ttl=10.0, age=100.0)
+    reg._store["KEEP"] = _mock_meta("KEEP")
+    reg._store.load({f"N{i}": _mock_meta(f"N{i}") for i in range(100)} | {"OLD": _mock_meta("OLD")})
+    assert len(reg._store) == 102 and len(reg) == 102
+    del reg._store["N0"]
+    reg._store["KEEP"] = _mock_meta("KEEP", ttl=10.0, age=100.0)
+    assert len(reg) == 100
+
+
+def test_compact_shrinks_churned_store():
+    reg = AssetRegistry()
+    for i in range(2000):
+        reg._store[f"S{i}"] = _mock_meta(f"S{i}")
+    for i in range(10, 2000):
+        reg.invalidate(f"S{i}")
+    reg._store["DEAD"] = _mock_meta("DEAD", ttl=10.0, age=100.0)
+    before = sys.getsizeof(reg._store)
+    reg.compact()
+    assert sys.getsizeof(reg._store) < before / 10
+    assert len(reg._store) == 11 and len(reg) == 10
+    assert reg["S3"].symbol == "S3"
+
+
 def test_invalidate_removes_entry():
     reg = AssetRegistry()
     reg._store["SPY"] = _mock_meta("SPY")
@@ -102,6 +218,60 @@ def test_persist_excludes_expired(tmp_path):
     assert "DEAD" not in saved
 
 
+def test_persist_roundtrip_without_orjson(tmp_path, monkeypatch):
+    monkeypatch.setattr(asset_registry, "ORJSON_AVAILABLE", False)
+    path = tmp_path / "registry.json"
+    reg = AssetRegistry()
+    reg._store["IBM"] = _mock_meta("IBM")
+    reg.persist(path)
+    assert json.loads(path.read_text())["IBM"]["exchange"] == "NASDAQ"
+    assert AssetRegistry().load_from_disk(path) == 1
+
+
+def test_persist_async_writes_atomically(tmp_path):
+    path = tmp_path / "registry.msgpack"
+    path.write_bytes(b"stale")
+    reg = AssetRegistry()
+    reg._store["AMD"] = _mock_meta("AMD")
+    asyncio.run(reg.persist_async(path))
+    assert [p.name for p in tmp_path.iterdir()] == ["registry.msgpack"]  # temp file renamed away
+    assert AssetRegistry().load_from_disk(path) == 1
+
+
+def test_msgpack_persist_roundtrip(tmp_path):
+    pytest.importorskip("msgpack")
+    path = tmp_path / "registry.msgpack"
+    reg = AssetRegistry()
+    reg._store["BRK/B"] = _mock_meta("BRK.B")
+    reg._store["DEAD"] = _mock_meta("DEAD", ttl=10.0, age=100.0)
+    reg.persist(path)
+    assert path.read_bytes()[:2] == b"AQ"
+
+    reg2 = AssetRegistry()
+    assert reg2.load_from_disk(path) == 1
+    restored = reg2._store["BRK/B"]
+    assert restored.to_dict() == _mock_meta("BRK.B").to_dict()
+    assert restored.is_valid
+
+
+def test_msgpack_path_falls_back_to_json_without_msgpack(tmp_path, monkeypatch):
+    monkeypatch.setattr(asset_registry, "MSGPACK_AVAILABLE", False)
+    path = tmp_path / "registry.msgpack"
+    reg = AssetRegistry()
+    reg._store["IBM"] = _mock_meta("IBM")
+    reg.persist(path)
+    assert json.loads(path.read_bytes())["IBM"]["exchange"] == "NASDAQ"
+    assert AssetRegistry().load_from_disk(path) == 1
+
+
+def test_default_load_falls_back_to_legacy_json(tmp_path, monkeypatch):
+    legacy = tmp_path / "asset_registry.json"
+    legacy.write_text(json.dumps({"SPY": _mock_meta("SPY").to_dict()}))
+    monkeypatch.setattr(AssetRegistry, "_PERSIST_PATH", tmp_path / "asset_registry.msgpack")
+    monkeypatch.setattr(AssetRegistry, "_LEGACY_PERSIST_PATH", legacy)
+    assert AssetRegistry().load_from_disk() == 1
+
+
 # ── Hit Rate ─────────────────────────────────────────────────────────────────
 
 def test_hit_rate_calculation():
@@ -111,3 +281,62 @@ def test_hit_rate_calculation():
         reg["QQQ"]
     reg._miss_count = 1  # simulate one initial miss
     assert reg.hit_rate == pytest.approx(9 / 10)
+
+
+# ── Prefetch ─────────────────────────────────────────────────────────────────
+
+class _SlowClient:
+    """get_asset stand-in: fixed latency, tracks peak concurrency."""
+
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.calls = []
+        self.in_flight = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def get_asset(self, symbol):
+        with self._lock:
+            self.calls.append(symbol)
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        time.sleep(self.delay)
+        with self._lock:
+            self.in_flight -= 1
+        if symbol == "BAD":
+            raise ValueError("unknown symbol")
+        if symbol.startswith("THROTTLED"):
+            exc = RuntimeError("too many requests")
+            exc.status_code = 429
+            raise exc
+        return SimpleNamespace(
+            symbol=symbol, exchange="NASDAQ", asset_class="us_equity",
+            tradable=True, fractionable=True, min_order_size="1", price_increment="0.01",
+        )
+
+
+def test_prefetch_fetches_misses_concurrently():
+    client = _SlowClient()
+    reg = AssetRegistry(max_retries=1, alpaca_client=client)
+    reg._store["SPY"] = _mock_meta("SPY")
+    symbols = ["SPY", "aapl", "AAPL", "brk.b", "MSFT", "NVDA", "AMD", "TSLA"]
+
+    start = time.perf_counter()
+    results = reg.prefetch(symbols)
+    elapsed = time.perf_counter() - start
+
+    assert list(results) == symbols
+    assert results["aapl"] is results["AAPL"] is reg._store["AAPL"]
+    assert results["brk.b"].symbol == "BRK/B"
+    assert sorted(client.calls) == ["AAPL", "AMD", "BRK/B", "MSFT", "NVDA", "TSLA"]
+    assert client.peak > 1 and elapsed < 6 * client.delay
+    assert (reg._hit_count, reg._miss_count) == (1, 6)
+
+
+def test_prefetch_reports_failures_per_symbol(monkeypatch):
+    monkeypatch.setattr(asset_registry.time, "sleep", lambda s: None)
+    reg = AssetRegistry(max_retries=1, alpaca_client=_SlowClient(delay=0.0))
+    results = asyncio.run(reg.async_prefetch(["GOOD", "BAD"]))
+    assert results["GOOD"].symbol == "GOOD"
+    assert isinstance(results["BAD"], RuntimeError)
+    assert "BAD" not in reg._store
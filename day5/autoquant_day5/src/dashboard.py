@@ -10,8 +10,11 @@ import asyncio
 import os
 import sys
 import time
+from collections import deque
 from datetime import datetime, timezone
 from decimal import Decimal
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 from typing import Optional
 import httpx
@@ -51,6 +54,12 @@ def compute_fsm_state(ratio: float) -> str:
     return "SAFE"
 
 
+@lru_cache(maxsize=32)
+def _fmt_second(epoch_s: int) -> str:
+    """HH:MM:SS UTC label; cached so history rows aren't re-formatted every frame."""
+    return datetime.fromtimestamp(epoch_s, timezone.utc).strftime("%H:%M:%S UTC")
+
+
 def build_gauge(ratio: float, width: int = 40) -> Text:
     """ASCII progress bar for equity ratio."""
     filled = int(ratio * width)
@@ -74,48 +83,122 @@ def build_threshold_table() -> Table:
     return t
 
 
-async def fetch_account(api_key: str, secret: str) -> Optional[dict]:
+# Static panels: THRESHOLDS and the title never change, so build them once
+# and hand the same objects to every frame.
+_HEADER_PANEL = Panel(
+    Text("⚡ AutoQuant-Alpha | Day 5 — Margin Monitor", justify="center", style="bold cyan"),
+    box=box.DOUBLE,
+)
+_THRESHOLD_PANEL = Panel(
+    build_threshold_table(),
+    title="Hysteresis Thresholds",
+    border_style="blue",
+)
+
+
+# Shared across polls so each 3s refresh reuses a kept-alive connection
+# rather than opening (and TLS-negotiating) a new one.
+_CLIENT = httpx.AsyncClient(
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0),
+    timeout=4.0,
+)
+
+
+async def fetch_account(
+    api_key: str,
+    secret: str,
+    client: Optional[httpx.AsyncClient] = None,
+) -> Optional[dict]:
     headers = {
         "APCA-API-KEY-ID":     api_key,
         "APCA-API-SECRET-KEY": secret,
     }
     try:
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(
-                "https://paper-api.alpaca.markets/v2/account",
-                headers=headers,
-                timeout=4.0,
-            )
-            resp.raise_for_status()
-            return resp.json()
+        resp = await (client or _CLIENT).get(
+            "https://paper-api.alpaca.markets/v2/account",
+            headers=headers,
+        )
+        resp.raise_for_status()
+        return resp.json()
     except Exception as exc:
         return None
 
 
-async def run_dashboard(api_key: str, secret: str) -> None:
-    history: list[tuple[float, str, str]] = []  # (ratio, state, timestamp)
+def build_layout() -> tuple[Layout, Layout, dict[str, Panel]]:
+    """
+    Layout skeleton, built once per session. Returns the root layout, the
+    right-hand column, and the dynamic panels whose `renderable` each
+    frame swaps in place.
+    """
+    layout = Layout()
+    layout.split_column(
+        Layout(name="header", size=3),
+        Layout(name="main"),
+        Layout(name="footer", size=3),
+    )
+    layout["main"].split_row(
+        Layout(name="left"),
+        Layout(name="right"),
+    )
+    layout["header"].update(_HEADER_PANEL)
+
+    panels = {
+        "account": Panel("", title="[bold]Account State[/bold]", border_style="cyan"),
+        "gauge":   Panel("", title="Equity Ratio", border_style="green"),
+        "state":   Panel(""),
+        "history": Panel("", title="Recent History", box=box.SIMPLE),
+    }
+    right_content = Layout(name="right_content")
+    right_content.split_column(
+        Layout(panels["gauge"], name="gauge", size=5),
+        Layout(panels["state"], name="state", size=5),
+        Layout(_THRESHOLD_PANEL, name="thresholds"),
+    )
+    layout["footer"].update(panels["history"])
+    return layout, right_content, panels
+
+
+_WAITING_LEFT  = Panel("[yellow]Waiting for account data...[/yellow]")
+_WAITING_RIGHT = Panel("[dim]Connecting to Alpaca...[/dim]")
+
+
+async def wait_for_update(updated: Optional[asyncio.Event], timeout: float) -> bool:
+    """
+    Block until `updated` fires or `timeout` elapses (the idle heartbeat).
+    Returns True if woken by an update. Updates that land while a frame is
+    being drawn coalesce into one wake-up. Without an event this is a
+    plain sleep.
+    """
+    if updated is None:
+        await asyncio.sleep(timeout)
+        return False
+    try:
+        await asyncio.wait_for(updated.wait(), timeout)
+    except TimeoutError:
+        return False
+    updated.clear()
+    return True
+
+
+async def run_dashboard(
+    api_key: str,
+    secret: str,
+    updated: Optional[asyncio.Event] = None,
+) -> None:
+    """
+    Poll and render the account. Pass `updated` (e.g. MarginMonitor.updated)
+    to repaint as soon as the stream sees an account change, with
+    `refresh_interval` as the quiet-period fallback.
+    """
+    history: deque[tuple[float, str, int]] = deque(maxlen=20)  # (ratio, state, epoch second)
     refresh_interval = 3.0
+    layout, right_content, panels = build_layout()
 
-    with Live(console=console, refresh_per_second=2, screen=True) as live:
+    # Data changes once per poll, so repaint once per poll instead of on a timer
+    with Live(layout, console=console, auto_refresh=False, screen=True) as live:
         while True:
             data = await fetch_account(api_key, secret)
-            now_str = datetime.now(timezone.utc).strftime("%H:%M:%S UTC")
-
-            layout = Layout()
-            layout.split_column(
-                Layout(name="header", size=3),
-                Layout(name="main"),
-                Layout(name="footer", size=3),
-            )
-            layout["main"].split_row(
-                Layout(name="left"),
-                Layout(name="right"),
-            )
-
-            layout["header"].update(Panel(
-                Text("⚡ AutoQuant-Alpha | Day 5 — Margin Monitor", justify="center", style="bold cyan"),
-                box=box.DOUBLE,
-            ))
+            now_s = int(time.time())
 
             if data:
                 equity       = Decimal(data.get("equity", "0"))
@@ -126,9 +209,7 @@ async def run_dashboard(api_key: str, secret: str) -> None:
 
                 ratio = float(equity / last_equity) if last_equity else 1.0
                 state = compute_fsm_state(ratio)
-                history.append((ratio, state, now_str))
-                if len(history) > 20:
-                    history.pop(0)
+                history.append((ratio, state, now_s))
 
                 style = LEVEL_STYLES.get(state, "white")
 
@@ -141,47 +222,28 @@ async def run_dashboard(api_key: str, secret: str) -> None:
                 account_table.add_row("Maintenance Margin", f"${maint_margin:,.2f}")
                 account_table.add_row("Portfolio Value",    f"${portfolio:,.2f}")
 
-                layout["left"].update(Panel(
-                    account_table,
-                    title="[bold]Account State[/bold]",
-                    border_style="cyan",
-                ))
-
-                right_content = Layout()
-                right_content.split_column(
-                    Layout(name="gauge", size=5),
-                    Layout(name="state", size=5),
-                    Layout(name="thresholds"),
-                )
-
-                gauge = build_gauge(ratio)
-                right_content["gauge"].update(Panel(gauge, title="Equity Ratio", border_style="green"))
-                right_content["state"].update(Panel(
-                    Text(f"FSM State: {state}", style=style, justify="center"),
-                    border_style=style.split()[-1] if "on" not in style else "red",
-                ))
-                right_content["thresholds"].update(Panel(
-                    build_threshold_table(),
-                    title="Hysteresis Thresholds",
-                    border_style="blue",
-                ))
+                panels["account"].renderable = account_table
+                panels["gauge"].renderable = build_gauge(ratio)
+                panels["state"].renderable = Text(f"FSM State: {state}", style=style, justify="center")
+                panels["state"].border_style = style.split()[-1] if "on" not in style else "red"
+                layout["left"].update(panels["account"])
                 layout["right"].update(right_content)
             else:
-                layout["left"].update(Panel("[yellow]Waiting for account data...[/yellow]"))
-                layout["right"].update(Panel("[dim]Connecting to Alpaca...[/dim]"))
+                layout["left"].update(_WAITING_LEFT)
+                layout["right"].update(_WAITING_RIGHT)
 
             # History table
             hist_table = Table(box=box.SIMPLE, show_header=True, header_style="bold")
             hist_table.add_column("Time UTC", style="dim")
             hist_table.add_column("Ratio", justify="right")
             hist_table.add_column("State")
-            for r, s, t in reversed(history[-5:]):
+            for r, s, t in islice(reversed(history), 5):
                 st = LEVEL_STYLES.get(s, "white")
-                hist_table.add_row(t, f"{r:.4f}", f"[{st}]{s}[/{st}]")
+                hist_table.add_row(_fmt_second(t), f"{r:.4f}", f"[{st}]{s}[/{st}]")
 
-            layout["footer"].update(Panel(hist_table, title="Recent History", box=box.SIMPLE))
-            live.update(layout)
-            await asyncio.sleep(refresh_interval)
+            panels["history"].renderable = hist_table
+            live.refresh()
+            await wait_for_update(updated, refresh_interval)
 
 
 async def main() -> None:
@@ -190,8 +252,17 @@ async def main() -> None:
     if not api_key or not secret:
         console.print("[red]ALPACA_API_KEY and ALPACA_SECRET_KEY must be set in .env[/red]")
         sys.exit(1)
-    await run_dashboard(api_key, secret)
+    try:
+        await run_dashboard(api_key, secret)
+    finally:
+        await _CLIENT.aclose()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # libuv-backed loop when installed: cheaper WS frame and socket dispatch
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
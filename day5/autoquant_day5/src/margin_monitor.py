@@ -10,11 +10,13 @@ import asyncio
 import json
 import logging
 import os
+import random
 import sys
 import time
+from bisect import bisect_right
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from decimal import Decimal, ROUND_HALF_EVEN
 from enum import Enum, auto
 from typing import Callable, Optional
 import numpy as np
@@ -22,6 +24,28 @@ import websockets
 import httpx
 from dotenv import load_dotenv
 
+# Optional fast JSON codec for WS frames (~3x faster parse than stdlib)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    from numba import config as numba_config, njit, prange
+    NUMBA_AVAILABLE = True
+    NUMBA_THREADED = numba_config.NUMBA_NUM_THREADS > 1
+except ImportError:  # pragma: no cover — exercised only without numba
+    NUMBA_AVAILABLE = False
+    NUMBA_THREADED = False
+    prange = range
+
+    def njit(*args, **kwargs):  # type: ignore[no-redef]
+        """No-op stand-in for numba.njit."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
+
 load_dotenv()
 
 logging.basicConfig(
@@ -34,6 +58,15 @@ logging.basicConfig(
 )
 log = logging.getLogger("margin_monitor")
 
+if ORJSON_AVAILABLE:
+    _json_loads = orjson.loads
+
+    def _json_dumps(payload: dict) -> str:
+        return orjson.dumps(payload).decode()
+else:
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+
 
 # ─── Domain Types ────────────────────────────────────────────────────────────
 
@@ -71,30 +104,93 @@ LEVEL_ORDER = [
     AlertLevel.LIQUIDATION,
 ]
 
+_LEVEL_INDEX: dict[AlertLevel, int] = {level: i for i, level in enumerate(LEVEL_ORDER)}
+
+# THRESHOLDS packed into tuples aligned with LEVEL_ORDER[1:] (index i is
+# level i + 1), so the per-tick state computation is plain float compares.
+_ENTERS: tuple[float, ...] = tuple(THRESHOLDS[level].enter for level in LEVEL_ORDER[1:])
+_EXITS:  tuple[float, ...] = tuple(THRESHOLDS[level].exit for level in LEVEL_ORDER[1:])
+# Ascending enters: the number above a ratio is its danger band, found by
+# one bisect instead of a scan
+_ENTERS_ASC_T: tuple[float, ...] = tuple(sorted(_ENTERS))
+
+
+def _compute_state_idx(ratio: float, cur_idx: int) -> int:
+    """
+    Next LEVEL_ORDER index for `ratio` given the current index: escalate to
+    the most severe band whose enter threshold the ratio is below, otherwise
+    step down one level once the current band's exit threshold is cleared.
+    """
+    band = len(_ENTERS_ASC_T) - bisect_right(_ENTERS_ASC_T, ratio)
+    if band:
+        return band
+    if cur_idx and ratio >= _EXITS[cur_idx - 1]:
+        return cur_idx - 1
+    return cur_idx
+
+
+# Array forms for the batch paths (searchsorted wants ascending order)
+_ENTERS_ASC = np.array(_ENTERS_ASC_T, dtype=np.float64)
+_ENTERS_ARR = np.array(_ENTERS, dtype=np.float64)
+_EXITS_ARR  = np.array(_EXITS, dtype=np.float64)
+
+
+# fastmath is deliberately off here: its no-NaN assumption could change how
+# a NaN ratio compares, and this kernel must match _compute_state_idx
+@njit("int8[:](float64[:], int64, float64[:], float64[:])", cache=True, boundscheck=False)
+def _replay_states_nb(
+    ratios: np.ndarray,
+    start_idx: int,
+    enters: np.ndarray,
+    exits: np.ndarray,
+) -> np.ndarray:
+    """_compute_state_idx applied along a ratio series; returns the state after each tick."""
+    out = np.empty(ratios.shape[0], dtype=np.int8)
+    cur = start_idx
+    for j in range(ratios.shape[0]):
+        ratio = ratios[j]
+        escalated = False
+        for i in range(enters.shape[0] - 1, -1, -1):
+            if ratio < enters[i]:
+                cur = i + 1
+                escalated = True
+                break
+        if not escalated and cur > 0 and ratio >= exits[cur - 1]:
+            cur -= 1
+        out[j] = cur
+    return out
+
 
 @dataclass
 class AccountSnapshot:
-    equity:               Decimal
-    last_equity:          Decimal
-    buying_power:         Decimal
-    maintenance_margin:   Decimal
-    initial_margin:       Decimal
-    portfolio_value:      Decimal
-    timestamp:            datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    # float64 throughout: every consumer (ratio, FSM thresholds) is float
+    # math, and Alpaca sends at most 2dp, which a float round-trips exactly
+    # for display.
+    equity:               float
+    last_equity:          float
+    buying_power:         float
+    maintenance_margin:   float
+    initial_margin:       float
+    portfolio_value:      float
+    timestamp:            float = field(default_factory=time.time)  # epoch seconds
 
     @property
     def equity_ratio(self) -> float:
         """Current equity as fraction of last_equity (day-start baseline)."""
         if self.last_equity == 0:
             return 1.0
-        return float(self.equity / self.last_equity)
+        return self.equity / self.last_equity
 
     @property
     def margin_utilization(self) -> float:
         """Fraction of available maintenance margin consumed."""
         if self.portfolio_value == 0:
             return 0.0
-        return float(self.maintenance_margin / self.portfolio_value)
+        return self.maintenance_margin / self.portfolio_value
+
+    @property
+    def timestamp_utc(self) -> datetime:
+        return datetime.fromtimestamp(self.timestamp, timezone.utc)
 
 
 @dataclass
@@ -102,7 +198,11 @@ class MarginAlert:
     level:      AlertLevel
     ratio:      float
     snapshot:   AccountSnapshot
-    fired_at:   datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    fired_at:   float = field(default_factory=time.time)  # epoch seconds
+
+    @property
+    def fired_at_utc(self) -> datetime:
+        return datetime.fromtimestamp(self.fired_at, timezone.utc)
 
 
 # ─── Hysteresis FSM ──────────────────────────────────────────────────────────
@@ -115,6 +215,7 @@ class MarginFSM:
 
     def __init__(self) -> None:
         self._state: AlertLevel = AlertLevel.SAFE
+        self._state_idx: int = 0  # LEVEL_ORDER index of _state; kept in lockstep
         self._last_fired: dict[AlertLevel, float] = {}
         self._alert_rate_limit_seconds: float = 60.0
 
@@ -127,34 +228,31 @@ class MarginFSM:
         Feed a new equity ratio. Returns AlertLevel if a transition occurred,
         None if state is unchanged.
         """
-        new_state = self._compute_state(ratio)
-        if new_state == self._state:
+        new_idx = _compute_state_idx(ratio, self._state_idx)
+        if new_idx == self._state_idx:
             return None
 
         prev = self._state
-        self._state = new_state
+        new_state = LEVEL_ORDER[new_idx]
+        self._state, self._state_idx = new_state, new_idx
         log.info(f"FSM transition: {prev.name} → {new_state.name} (ratio={ratio:.4f})")
         return new_state
 
-    def _compute_state(self, ratio: float) -> AlertLevel:
-        current_idx = LEVEL_ORDER.index(self._state)
-
-        # Check escalation (moving toward danger)
-        for level in reversed(LEVEL_ORDER[1:]):  # skip SAFE
-            threshold = THRESHOLDS[level]
-            if ratio < threshold.enter:
-                return level
-
-        # Check de-escalation (recovering toward safety)
-        # Must clear the exit band of current state
-        if self._state != AlertLevel.SAFE:
-            threshold = THRESHOLDS[self._state]
-            if ratio >= threshold.exit:
-                # De-escalate one level
-                idx = LEVEL_ORDER.index(self._state)
-                return LEVEL_ORDER[max(0, idx - 1)]
-
-        return self._state
+    def update_batch(self, ratios: np.ndarray) -> np.ndarray:
+        """
+        Feed a block of equity ratios at once. Returns the LEVEL_ORDER index
+        after each ratio (int8) and leaves the FSM in the final state; only
+        the net transition across the block is logged.
+        """
+        ratios = np.ascontiguousarray(ratios, dtype=np.float64)
+        states = _replay_states_nb(ratios, self._state_idx, _ENTERS_ARR, _EXITS_ARR)
+        if states.size and states[-1] != self._state_idx:
+            prev = self._state
+            new_idx = int(states[-1])
+            new_state = LEVEL_ORDER[new_idx]
+            self._state, self._state_idx = new_state, new_idx
+            log.info(f"FSM transition: {prev.name} → {new_state.name} (batch of {states.size})")
+        return states
 
     def should_fire(self, level: AlertLevel) -> bool:
         """Rate limit: fire at most once per 60s per severity level."""
@@ -165,6 +263,44 @@ class MarginFSM:
         return False
 
 
+# Eager signature: compiled (or loaded from cache) at import, so the first
+# P&L call never pays the JIT pause. C-contiguous inputs ([::1]) let LLVM
+# vectorise the reduction; an any-layout signature keeps it scalar.
+@njit(
+    "float64(float64[::1], float64[::1], float64[::1])",
+    cache=True, fastmath=True, boundscheck=False, error_model="numpy",
+)
+def _unrealized_pnl_nb(
+    quantities: np.ndarray,
+    avg_entries: np.ndarray,
+    current_prices: np.ndarray,
+) -> float:
+    """sum(q * (price - entry)) in one pass: no temporary, no cancellation."""
+    total = 0.0
+    for i in range(quantities.shape[0]):
+        total += quantities[i] * (current_prices[i] - avg_entries[i])
+    return total
+
+
+# Books at least this large (multi-account scans) are split across numba's
+# worker threads when there is more than one. Compiled lazily: parallel=True
+# costs ~1s of compile that the usual 10k-position path shouldn't pay at import.
+_PARALLEL_PNL_MIN = 100_000
+
+
+@njit(cache=True, fastmath=True, parallel=True, boundscheck=False, error_model="numpy")
+def _unrealized_pnl_par_nb(
+    quantities: np.ndarray,
+    avg_entries: np.ndarray,
+    current_prices: np.ndarray,
+) -> float:
+    """Threaded variant of _unrealized_pnl_nb; prange reduces per-thread partials."""
+    total = 0.0
+    for i in prange(quantities.shape[0]):
+        total += quantities[i] * (current_prices[i] - avg_entries[i])
+    return total
+
+
 # ─── Vectorized P&L Engine ───────────────────────────────────────────────────
 
 class EquityCalculator:
@@ -179,22 +315,56 @@ class EquityCalculator:
         avg_entries:   np.ndarray,  # float64, shape (N,)
         current_prices: np.ndarray, # float64, shape (N,)
     ) -> float:
-        """Single BLAS dot product — numerically stable for up to ~10k positions."""
+        """
+        Fused single-pass kernel under numba; otherwise two BLAS dots,
+        q·price − q·entry, which allocate no temporaries. Both stay
+        numerically stable for ~10k positions.
+        """
         if quantities.size == 0:
             return 0.0
-        price_deltas = current_prices - avg_entries
-        return float(np.dot(quantities, price_deltas))
+        if NUMBA_AVAILABLE:
+            kernel = (
+                _unrealized_pnl_par_nb
+                if NUMBA_THREADED and quantities.size >= _PARALLEL_PNL_MIN
+                else _unrealized_pnl_nb
+            )
+            return float(kernel(
+                np.ascontiguousarray(quantities, dtype=np.float64),
+                np.ascontiguousarray(avg_entries, dtype=np.float64),
+                np.ascontiguousarray(current_prices, dtype=np.float64),
+            ))
+        return float(np.vdot(quantities, current_prices) - np.vdot(quantities, avg_entries))
+
+    def batch_states(self, ratios: np.ndarray) -> np.ndarray:
+        """
+        Danger band (LEVEL_ORDER index) for every ratio in one searchsorted.
+        Ignores hysteresis, which only matters on the way back up — use
+        replay_states() for an exact FSM path.
+        """
+        ratios = np.asarray(ratios, dtype=np.float64)
+        return (len(_ENTERS_ASC) - np.searchsorted(_ENTERS_ASC, ratios, side="right")).astype(np.int8)
+
+    def replay_states(
+        self,
+        ratios: np.ndarray,
+        start: AlertLevel = AlertLevel.SAFE,
+    ) -> np.ndarray:
+        """Exact MarginFSM state (LEVEL_ORDER index) after each ratio, hysteresis included."""
+        ratios = np.ascontiguousarray(ratios, dtype=np.float64)
+        return _replay_states_nb(ratios, LEVEL_ORDER.index(start), _ENTERS_ARR, _EXITS_ARR)
 
     def compute_equity_ratio(
         self,
-        equity: Decimal,
-        last_equity: Decimal,
+        equity: float,
+        last_equity: float,
     ) -> float:
-        if last_equity == Decimal("0"):
+        if not last_equity:
             return 1.0
-        return float(
-            (equity / last_equity).quantize(Decimal("0.0001"), rounding=ROUND_HALF_EVEN)
-        )
+        return float(equity) / float(last_equity)
+
+
+# Reconnect jitter source; module-level so tests can seed it
+_RNG = random.Random()
 
 
 # ─── Alpaca WebSocket Client ──────────────────────────────────────────────────
@@ -244,7 +414,7 @@ class AlpacaAccountStream:
             await self._subscribe(ws)
 
             async for raw in ws:
-                msg = json.loads(raw)
+                msg = _json_loads(raw)
                 if isinstance(msg, list):
                     for event in msg:
                         self._on_update(event)
@@ -252,27 +422,26 @@ class AlpacaAccountStream:
                     self._on_update(msg)
 
     async def _authenticate(self, ws) -> None:
-        await ws.send(json.dumps({
+        await ws.send(_json_dumps({
             "action": "auth",
             "key":    self._api_key,
             "secret": self._secret_key,
         }))
-        resp = json.loads(await ws.recv())
+        resp = _json_loads(await ws.recv())
         log.debug(f"Auth response: {resp}")
 
     async def _subscribe(self, ws) -> None:
-        await ws.send(json.dumps({
+        await ws.send(_json_dumps({
             "action": "listen",
             "data":   {"streams": ["account_updates", "trade_updates"]},
         }))
-        resp = json.loads(await ws.recv())
+        resp = _json_loads(await ws.recv())
         log.debug(f"Subscribe response: {resp}")
 
     def _backoff_delay(self) -> float:
-        import random
         self._reconnect_attempts += 1
         base = min(2 ** self._reconnect_attempts, self._max_reconnect_delay)
-        jitter = random.uniform(0, base * 0.3)
+        jitter = _RNG.uniform(0, base * 0.3)
         return base + jitter
 
     def stop(self) -> None:
@@ -281,28 +450,38 @@ class AlpacaAccountStream:
 
 # ─── REST Snapshot ────────────────────────────────────────────────────────────
 
-async def fetch_account_snapshot(api_key: str, secret: str) -> AccountSnapshot:
+# One pooled client for the process: reconnect re-snapshots reuse a
+# kept-alive connection instead of paying a TCP+TLS handshake each time.
+_CLIENT = httpx.AsyncClient(
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0),
+    timeout=5.0,
+)
+
+
+async def fetch_account_snapshot(
+    api_key: str,
+    secret: str,
+    client: Optional[httpx.AsyncClient] = None,
+) -> AccountSnapshot:
     """Fetch current account state via REST. Used on startup and reconnect."""
     headers = {
         "APCA-API-KEY-ID":     api_key,
         "APCA-API-SECRET-KEY": secret,
     }
-    async with httpx.AsyncClient() as client:
-        resp = await client.get(
-            "https://paper-api.alpaca.markets/v2/account",
-            headers=headers,
-            timeout=5.0,
-        )
-        resp.raise_for_status()
-        data = resp.json()
+    resp = await (client or _CLIENT).get(
+        "https://paper-api.alpaca.markets/v2/account",
+        headers=headers,
+    )
+    resp.raise_for_status()
+    data = resp.json()
 
     return AccountSnapshot(
-        equity             = Decimal(data.get("equity", "0")),
-        last_equity        = Decimal(data.get("last_equity", "0")),
-        buying_power       = Decimal(data.get("buying_power", "0")),
-        maintenance_margin = Decimal(data.get("maintenance_margin", "0")),
-        initial_margin     = Decimal(data.get("initial_margin", "0")),
-        portfolio_value    = Decimal(data.get("portfolio_value", "0")),
+        equity             = float(data.get("equity", 0.0)),
+        last_equity        = float(data.get("last_equity", 0.0)),
+        buying_power       = float(data.get("buying_power", 0.0)),
+        maintenance_margin = float(data.get("maintenance_margin", 0.0)),
+        initial_margin     = float(data.get("initial_margin", 0.0)),
+        portfolio_value    = float(data.get("portfolio_value", 0.0)),
     )
 
 
@@ -313,12 +492,12 @@ def parse_account_update(event: dict) -> Optional[AccountSnapshot]:
     data = event.get("data", {})
     try:
         return AccountSnapshot(
-            equity             = Decimal(str(data.get("equity", "0"))),
-            last_equity        = Decimal(str(data.get("last_equity", "0"))),
-            buying_power       = Decimal(str(data.get("buying_power", "0"))),
-            maintenance_margin = Decimal(str(data.get("maintenance_margin", "0"))),
-            initial_margin     = Decimal(str(data.get("initial_margin", "0"))),
-            portfolio_value    = Decimal(str(data.get("portfolio_value", "0"))),
+            equity             = float(data.get("equity", 0.0)),
+            last_equity        = float(data.get("last_equity", 0.0)),
+            buying_power       = float(data.get("buying_power", 0.0)),
+            maintenance_margin = float(data.get("maintenance_margin", 0.0)),
+            initial_margin     = float(data.get("initial_margin", 0.0)),
+            portfolio_value    = float(data.get("portfolio_value", 0.0)),
         )
     except Exception as exc:
         log.error(f"Failed to parse account update: {exc} | data={data}")
@@ -327,6 +506,59 @@ def parse_account_update(event: dict) -> Optional[AccountSnapshot]:
 
 # ─── Alert Dispatcher ─────────────────────────────────────────────────────────
 
+class AlertHistoryStore:
+    """
+    Columnar ring buffer of fired alerts: LEVEL_ORDER index (int8), equity
+    ratio (float64) and fire time (int64 epoch µs) in parallel arrays, so
+    post-hoc analytics (counts per level, ratio stats) are NumPy reductions
+    rather than loops over MarginAlert objects. Oldest rows are overwritten
+    once `capacity` is reached.
+    """
+
+    def __init__(self, capacity: int = 10_000) -> None:
+        self._levels = np.empty(capacity, dtype=np.int8)
+        self._ratios = np.empty(capacity, dtype=np.float64)
+        self._ts_us  = np.empty(capacity, dtype=np.int64)
+        self._next = 0   # write position
+        self.n = 0       # rows held (<= capacity)
+
+    def append(self, alert: MarginAlert) -> None:
+        i = self._next
+        self._levels[i] = _LEVEL_INDEX[alert.level]
+        self._ratios[i] = alert.ratio
+        self._ts_us[i]  = int(alert.fired_at * 1_000_000)
+        self._next = (i + 1) % len(self._levels)
+        self.n = min(self.n + 1, len(self._levels))
+
+    def __len__(self) -> int:
+        return self.n
+
+    def _chronological(self, column: np.ndarray) -> np.ndarray:
+        if self.n < len(column):
+            return column[: self.n]
+        return np.concatenate((column[self._next :], column[: self._next]))
+
+    @property
+    def levels(self) -> np.ndarray:
+        return self._chronological(self._levels)
+
+    @property
+    def ratios(self) -> np.ndarray:
+        return self._chronological(self._ratios)
+
+    @property
+    def timestamps_us(self) -> np.ndarray:
+        return self._chronological(self._ts_us)
+
+    def level_counts(self) -> np.ndarray:
+        """Alerts fired per level, indexed like LEVEL_ORDER."""
+        return np.bincount(self._levels[: self.n], minlength=len(LEVEL_ORDER))
+
+
+# Indexed like LEVEL_ORDER; built once rather than per dispatch
+_LEVEL_EMOJI: tuple[str, ...] = ("✅", "⚠️ ", "🔴", "🚨", "💀")
+
+
 class AlertDispatcher:
     """
     Dispatches margin alerts. In production, extend this to send
@@ -334,24 +566,20 @@ class AlertDispatcher:
     Currently: structured log output + in-memory alert history.
     """
 
-    def __init__(self) -> None:
-        self.history: list[MarginAlert] = []
+    def __init__(self, max_history: int = 10_000) -> None:
+        # Bounded: a long-running daemon keeps only the most recent alerts
+        self.history: deque[MarginAlert] = deque(maxlen=max_history)
+        self.store = AlertHistoryStore(max_history)
 
     def dispatch(self, alert: MarginAlert) -> None:
         self.history.append(alert)
-        level_emoji = {
-            AlertLevel.SAFE:        "✅",
-            AlertLevel.WARN:        "⚠️ ",
-            AlertLevel.CRITICAL:    "🔴",
-            AlertLevel.MARGIN_CALL: "🚨",
-            AlertLevel.LIQUIDATION: "💀",
-        }
-        emoji = level_emoji.get(alert.level, "❓")
+        self.store.append(alert)
+        emoji = _LEVEL_EMOJI[_LEVEL_INDEX[alert.level]]
         log.warning(
             f"{emoji} MARGIN ALERT | Level={alert.level.name} "
             f"| ratio={alert.ratio:.4f} "
-            f"| equity={alert.snapshot.equity} "
-            f"| buying_power={alert.snapshot.buying_power}"
+            f"| equity={alert.snapshot.equity:.2f} "
+            f"| buying_power={alert.snapshot.buying_power:.2f}"
         )
 
 
@@ -367,6 +595,9 @@ class MarginMonitor:
         self._calc      = EquityCalculator()
         self._dispatcher = AlertDispatcher()
         self._snapshot: Optional[AccountSnapshot] = None
+        # Set on every account update; an in-process dashboard waits on it
+        # instead of polling on a fixed timer
+        self.updated    = asyncio.Event()
         self._stream    = AlpacaAccountStream(
             api_key    = api_key,
             secret_key = secret_key,
@@ -379,6 +610,7 @@ class MarginMonitor:
             return
 
         self._snapshot = snapshot
+        self.updated.set()
         ratio = self._calc.compute_equity_ratio(snapshot.equity, snapshot.last_equity)
         new_state = self._fsm.update(ratio)
 
@@ -393,7 +625,7 @@ class MarginMonitor:
             self._snapshot.equity, self._snapshot.last_equity
         )
         log.info(
-            f"Initial state | equity={self._snapshot.equity} "
+            f"Initial state | equity={self._snapshot.equity:.2f} "
             f"| ratio={ratio:.4f} | FSM={self._fsm.state.name}"
         )
         await self._stream.run()
@@ -410,8 +642,17 @@ async def main() -> None:
         sys.exit(1)
 
     monitor = MarginMonitor(api_key=api_key, secret_key=secret)
-    await monitor.run()
+    try:
+        await monitor.run()
+    finally:
+        await _CLIENT.aclose()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # libuv-backed loop when installed: cheaper WS frame and socket dispatch
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
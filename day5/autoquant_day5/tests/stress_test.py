@@ -6,12 +6,13 @@ Verifies alert ordering, hysteresis, and rate limiting under load.
 
 from __future__ import annotations
 
+import logging
 import sys
 import os
 import time
+import numpy as np
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
-from decimal import Decimal
 from datetime import datetime, timezone
 from rich.console import Console
 from rich.table import Table
@@ -32,12 +33,12 @@ console = Console()
 
 def make_snapshot(equity: float, last_equity: float = 100_000.0) -> AccountSnapshot:
     return AccountSnapshot(
-        equity             = Decimal(str(equity)),
-        last_equity        = Decimal(str(last_equity)),
-        buying_power       = Decimal(str(equity * 2)),
-        maintenance_margin = Decimal(str(equity * 0.25)),
-        initial_margin     = Decimal(str(equity * 0.50)),
-        portfolio_value    = Decimal(str(equity * 4)),
+        equity             = float(equity),
+        last_equity        = float(last_equity),
+        buying_power       = equity * 2.0,
+        maintenance_margin = equity * 0.25,
+        initial_margin     = equity * 0.50,
+        portfolio_value    = equity * 4.0,
     )
 
 
@@ -83,8 +84,17 @@ def run_crash_scenario() -> None:
     fired_levels = [a.level for a in dispatcher.history]
     expected = [AlertLevel.WARN, AlertLevel.CRITICAL, AlertLevel.MARGIN_CALL, AlertLevel.LIQUIDATION]
     assert fired_levels == expected, f"Expected {expected}, got {fired_levels}"
+    assert dispatcher.store.levels.tolist() == [LEVEL_ORDER.index(l) for l in expected]
     console.print("[bold green]✅ Alert ordering verified[/bold green]")
 
+    # A one-way crash never exercises hysteresis: the vectorized bands must
+    # agree with the FSM tick for tick
+    ratios = np.array(equity_levels, dtype=np.float64) / 100_000
+    fsm_states = [LEVEL_ORDER.index(AlertLevel[state]) for _, _, state, _ in results]
+    assert calc.batch_states(ratios).tolist() == fsm_states
+    assert calc.replay_states(ratios).tolist() == fsm_states
+    console.print("[bold green]✅ Batch states match FSM[/bold green]")
+
 
 def run_recovery_scenario() -> None:
     console.rule("[bold green]Stress Test: Recovery with Hysteresis[/bold green]")
@@ -132,8 +142,37 @@ def run_rate_limit_scenario() -> None:
     console.print("[bold green]✅ Rate limiting verified[/bold green]")
 
 
+def run_replay_scenario(n_ticks: int = 1_000_000) -> None:
+    console.rule("[bold cyan]Stress Test: Batch FSM Replay[/bold cyan]")
+    rng    = np.random.default_rng(7)
+    ratios = np.clip(1.0 + np.cumsum(rng.normal(0.0, 0.004, n_ticks)), 0.4, 1.2)
+    calc   = EquityCalculator()
+
+    t0 = time.perf_counter()
+    replayed = calc.replay_states(ratios)
+    batch_ms = (time.perf_counter() - t0) * 1000
+
+    fsm = MarginFSM()
+    sample = ratios[:50_000]
+    fsm_log = logging.getLogger("margin_monitor")
+    fsm_log.disabled = True  # thousands of transitions; time the FSM, not the log
+    t0 = time.perf_counter()
+    for r in sample.tolist():
+        fsm.update(r)
+    loop_ms = (time.perf_counter() - t0) * 1000 * (n_ticks / sample.size)
+    fsm_log.disabled = False
+
+    assert LEVEL_ORDER[replayed[sample.size - 1]] == fsm.state
+    console.print(
+        f"{n_ticks:,} ticks | replay_states {batch_ms:.1f}ms "
+        f"| MarginFSM loop ≈{loop_ms:,.0f}ms (extrapolated)"
+    )
+    console.print("[bold green]✅ Batch replay verified[/bold green]")
+
+
 if __name__ == "__main__":
     run_crash_scenario()
     run_recovery_scenario()
     run_rate_limit_scenario()
+    run_replay_scenario()
     console.print("\n[bold green]All stress tests passed.[/bold green]")
@@ -5,19 +5,36 @@ Unit tests for MarginFSM, HysteresisThreshold, and EquityCalculator.
 
 from __future__ import annotations
 
-import sys
+import asyncio
+import json
 import os
+import random
+import sys
+import time
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
+from datetime import timezone
 from decimal import Decimal
+import httpx
 import numpy as np
 import pytest
 
+import margin_monitor
+from dashboard import wait_for_update
 from margin_monitor import (
+    AccountSnapshot,
+    AlertDispatcher,
     AlertLevel,
+    AlpacaAccountStream,
+    MarginAlert,
+    MarginMonitor,
     HysteresisThreshold,
     MarginFSM,
     EquityCalculator,
+    LEVEL_ORDER,
+    fetch_account_snapshot,
+    _unrealized_pnl_nb,
+    _unrealized_pnl_par_nb,
 )
 
 
@@ -89,6 +106,30 @@ class TestMarginFSM:
         result = fsm.update(0.87)  # still in WARN, no new transition
         assert result is None
 
+    def test_recovery_steps_down_one_level_past_exit(self):
+        fsm = MarginFSM()
+        fsm.update(0.78)               # → CRITICAL
+        assert fsm.update(0.95) == AlertLevel.WARN  # one step, not straight to SAFE
+        assert fsm.update(0.95) == AlertLevel.SAFE
+
+    def test_update_batch_matches_scalar_updates(self):
+        rng = np.random.default_rng(11)
+        ratios = np.clip(1.0 + np.cumsum(rng.normal(0.0, 0.01, 1_000)), 0.5, 1.1)
+        scalar, batch = MarginFSM(), MarginFSM()
+        batch.update(0.85)  # start both mid-ladder
+        scalar.update(0.85)
+        expected = []
+        for r in ratios[:500].tolist():
+            scalar.update(r)
+            expected.append(LEVEL_ORDER.index(scalar.state))
+        assert batch.update_batch(ratios[:500]).tolist() == expected
+        assert batch.state == scalar.state
+        for r in ratios[500:].tolist():
+            scalar.update(r)
+        batch.update_batch(ratios[500:])
+        assert batch.state == scalar.state
+        assert batch.update_batch(np.array([])).size == 0
+
 
 class TestEquityCalculator:
     def setup_method(self):
@@ -108,6 +149,20 @@ class TestEquityCalculator:
         )
         assert pnl == 0.0
 
+    def test_unrealized_pnl_accepts_strided_views(self):
+        # Column slices of a (N, 3) book are not C-contiguous
+        book = np.array([[100.0, 10.0, 12.0], [50.0, 20.0, 18.0]])
+        pnl = self.calc.compute_unrealized_pnl(book[:, 0], book[:, 1], book[:, 2])
+        assert abs(pnl - 100.0) < 1e-9
+
+    def test_parallel_pnl_kernel_matches_serial(self):
+        rng = np.random.default_rng(7)
+        qtys = rng.uniform(-1000, 1000, 1000)
+        entries = rng.uniform(10, 500, 1000)
+        prices = entries * rng.uniform(0.9, 1.1, 1000)
+        serial = _unrealized_pnl_nb(qtys, entries, prices)
+        assert abs(_unrealized_pnl_par_nb(qtys, entries, prices) - serial) < 1e-6
+
     def test_equity_ratio_normal(self):
         ratio = self.calc.compute_equity_ratio(
             Decimal("85000"), Decimal("100000")
@@ -128,9 +183,31 @@ class TestEquityCalculator:
         assert ratio < 1.0
         assert ratio > 0.9990
 
+    def test_batch_states_bands_without_hysteresis(self):
+        ratios = np.array([0.95, 0.90, 0.89, 0.75, 0.60, 0.59])
+        assert self.calc.batch_states(ratios).tolist() == [0, 0, 1, 2, 3, 4]
+
+    def test_replay_states_matches_fsm(self):
+        rng = np.random.default_rng(3)
+        ratios = np.clip(1.0 + np.cumsum(rng.normal(0.0, 0.01, 2_000)), 0.5, 1.1)
+        fsm = MarginFSM()
+        expected = []
+        for r in ratios.tolist():
+            fsm.update(r)
+            expected.append(LEVEL_ORDER.index(fsm.state))
+        assert self.calc.replay_states(ratios).tolist() == expected
+
+    def test_replay_states_treats_nan_like_fsm(self):
+        ratios = np.array([0.85, np.nan, 0.95, np.nan, 0.75])
+        fsm = MarginFSM()
+        expected = []
+        for r in ratios.tolist():
+            fsm.update(r)
+            expected.append(LEVEL_ORDER.index(fsm.state))
+        assert self.calc.replay_states(ratios).tolist() == expected
+
     def test_vectorized_large_portfolio(self):
         """Stress: 10,000 positions should compute in < 10ms."""
-        import time
         N = 10_000
         rng = np.random.default_rng(42)
         qtys    = rng.uniform(1, 1000, N)
@@ -141,3 +218,97 @@ class TestEquityCalculator:
         elapsed_ms = (time.perf_counter() - t0) * 1000
         assert elapsed_ms < 10.0, f"Took {elapsed_ms:.2f}ms, expected < 10ms"
         assert isinstance(pnl, float)
+
+
+class TestAccountSnapshotFetch:
+    def test_reuses_injected_client(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request.headers["APCA-API-KEY-ID"])
+            return httpx.Response(200, json={"equity": "85000", "last_equity": "100000"})
+
+        async def fetch_twice():
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                return [await fetch_account_snapshot("k", "s", client=client) for _ in range(2)]
+
+        snaps = asyncio.run(fetch_twice())
+        assert calls == ["k", "k"]
+        assert snaps[0].equity == 85000.0 and snaps[0].buying_power == 0.0
+
+
+class TestAccountStreamCodec:
+    def test_auth_frame_is_text_json(self):
+        class FakeWS:
+            sent = []
+
+            async def send(self, msg):
+                self.sent.append(msg)
+
+            async def recv(self):
+                return b'{"stream":"authorization","data":{"status":"authorized"}}'
+
+        stream = AlpacaAccountStream("key", "secret", on_update=lambda e: None)
+        ws = FakeWS()
+        asyncio.run(stream._authenticate(ws))
+        assert isinstance(ws.sent[0], str)
+        assert json.loads(ws.sent[0]) == {"action": "auth", "key": "key", "secret": "secret"}
+
+
+class TestAlertDispatcher:
+    def test_history_is_bounded(self):
+        snap = AccountSnapshot(85_000.0, 100_000.0, 0.0, 0.0, 0.0, 0.0)
+        dispatcher = AlertDispatcher(max_history=3)
+        for ratio in (0.89, 0.79, 0.69, 0.59):
+            dispatcher.dispatch(MarginAlert(level=AlertLevel.WARN, ratio=ratio, snapshot=snap))
+        assert [a.ratio for a in dispatcher.history] == [0.79, 0.69, 0.59]
+
+    def test_columnar_store_wraps_in_fire_order(self):
+        snap = AccountSnapshot(85_000.0, 100_000.0, 0.0, 0.0, 0.0, 0.0)
+        dispatcher = AlertDispatcher(max_history=3)
+        fired = [(AlertLevel.WARN, 0.89), (AlertLevel.CRITICAL, 0.79),
+                 (AlertLevel.WARN, 0.88), (AlertLevel.LIQUIDATION, 0.55)]
+        for level, ratio in fired:
+            dispatcher.dispatch(MarginAlert(level=level, ratio=ratio, snapshot=snap))
+        store = dispatcher.store
+        assert len(store) == 3
+        assert store.ratios.tolist() == [0.79, 0.88, 0.55]
+        assert store.levels.tolist() == [2, 1, 4]
+        assert store.level_counts().tolist() == [0, 1, 1, 0, 1]
+        assert np.all(np.diff(store.timestamps_us) >= 0)
+
+    def test_timestamps_are_epoch_floats_with_lazy_datetime(self):
+        before = time.time()
+        snap = AccountSnapshot(85_000.0, 100_000.0, 0.0, 0.0, 0.0, 0.0)
+        alert = MarginAlert(level=AlertLevel.WARN, ratio=0.85, snapshot=snap)
+        assert before <= snap.timestamp <= alert.fired_at <= time.time()
+        assert alert.fired_at_utc.tzinfo is timezone.utc
+        assert abs(snap.timestamp_utc.timestamp() - snap.timestamp) < 1e-6
+
+
+class TestUpdateSignal:
+    def test_account_update_sets_event_and_wakes_dashboard(self):
+        async def scenario():
+            monitor = MarginMonitor("k", "s")
+            assert await wait_for_update(monitor.updated, 0.01) is False
+            monitor._handle_event({"stream": "trade_updates", "data": {}})
+            assert not monitor.updated.is_set()
+            monitor._handle_event({"stream": "account_updates",
+                                   "data": {"equity": "99000", "last_equity": "100000"}})
+            assert await wait_for_update(monitor.updated, 5.0) is True
+            assert not monitor.updated.is_set()
+
+        asyncio.run(scenario())
+
+
+class TestReconnectBackoff:
+    def test_backoff_is_seedable_and_capped(self, monkeypatch):
+        def delays(seed):
+            monkeypatch.setattr(margin_monitor, "_RNG", random.Random(seed))
+            stream = AlpacaAccountStream("k", "s", on_update=lambda e: None)
+            return [stream._backoff_delay() for _ in range(7)]
+
+        first = delays(11)
+        assert first == delays(11)
+        for base, d in zip([2, 4, 8, 16, 30, 30, 30], first):
+            assert base <= d <= base * 1.3
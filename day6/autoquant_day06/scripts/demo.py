@@ -34,6 +34,12 @@ console = Console()
 
 ORDERS: list[dict] = []
 
+_STATE_COLORS = {
+    "CLOSED": "green",
+    "OPEN": "red",
+    "HALF_OPEN": "yellow",
+}
+
 
 def mock_order(symbol: str, qty: int, side: str = "buy") -> dict:
     """Mock order that succeeds — wrapped by FaultInjector in demo."""
@@ -46,14 +52,8 @@ def mock_order(symbol: str, qty: int, side: str = "buy") -> dict:
     }
 
 
-def build_table(orders: list[dict], wrapper: RetryWrapper) -> Table:
-    stats = wrapper.stats()
-    state_color = {
-        "CLOSED": "green",
-        "OPEN": "red",
-        "HALF_OPEN": "yellow",
-    }.get(stats["circuit_state"], "white")
-
+def make_table() -> Table:
+    """Empty order table; rows are appended as orders complete."""
     table = Table(
         title=f"[bold]AutoQuant-Alpha | Day 6 — Retry Wrapper Demo[/bold]",
         show_header=True,
@@ -65,26 +65,30 @@ def build_table(orders: list[dict], wrapper: RetryWrapper) -> Table:
     table.add_column("Qty", justify="right")
     table.add_column("Order ID")
     table.add_column("Result")
+    return table
+
 
-    for i, o in enumerate(orders, 1):
-        table.add_row(
-            str(i),
-            o.get("symbol", "—"),
-            str(o.get("qty", "—")),
-            o.get("order_id", "—"),
-            f"[green]{o['status']}[/green]" if o.get("status") == "accepted"
-            else f"[red]{o.get('status', 'FAILED')}[/red]",
-        )
-
-    footer = (
+def update_table(table: Table, order: dict, wrapper: RetryWrapper) -> None:
+    """Append one order row and refresh the stats caption in place."""
+    status = order.get("status", "FAILED")
+    color = "green" if status == "accepted" else "red"
+    table.add_row(
+        str(table.row_count + 1),
+        order.get("symbol", "—"),
+        str(order.get("qty", "—")),
+        order.get("order_id", "—"),
+        f"[{color}]{status}[/{color}]",
+    )
+
+    stats = wrapper.stats()
+    state_color = _STATE_COLORS.get(stats["circuit_state"], "white")
+    table.caption = (
         f"  Calls: {stats['call_count']}  "
         f"Retries: {stats['retry_count']}  "
         f"Retry Rate: {stats['retry_rate']:.1%}  "
         f"Circuit: [{state_color}]{stats['circuit_state']}[/{state_color}]  "
         f"Trips: {stats['circuit_trips']}"
     )
-    table.caption = footer
-    return table
 
 
 async def run_demo() -> None:
@@ -109,7 +113,8 @@ async def run_demo() -> None:
     symbols = ["AAPL", "MSFT", "NVDA", "TSLA", "AMZN",
                "META", "GOOGL", "SPY", "QQQ", "IWM"]
 
-    with Live(console=console, refresh_per_second=4) as live:
+    table = make_table()
+    with Live(table, console=console, refresh_per_second=4) as live:
         for i, symbol in enumerate(symbols):
             try:
                 result = await wrapper.call(injected, symbol, 10)
@@ -121,7 +126,8 @@ async def run_demo() -> None:
                     "order_id": "—",
                     "status": f"FAILED: {type(exc).__name__}",
                 })
-            live.update(build_table(ORDERS, wrapper))
+            update_table(table, ORDERS[-1], wrapper)
+            live.refresh()
             await asyncio.sleep(0.4)
 
     console.print()
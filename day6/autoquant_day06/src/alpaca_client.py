@@ -6,6 +6,7 @@ as typed APIError exceptions for the RetryWrapper.
 from __future__ import annotations
 
 import os
+import threading
 import uuid
 from typing import Any
 
@@ -17,12 +18,24 @@ from alpaca.common.exceptions import APIError as AlpacaAPIError
 from retry_wrapper import APIError
 
 
-def _make_client() -> TradingClient:
-    return TradingClient(
-        api_key=os.environ["ALPACA_API_KEY"],
-        secret_key=os.environ["ALPACA_SECRET_KEY"],
-        paper=True,
-    )
+# One TradingClient per process: its requests.Session keeps the HTTPS
+# connection alive across retries and symbols instead of a fresh TLS
+# handshake per call. Calls arrive from executor threads, hence the lock.
+_CLIENT: TradingClient | None = None
+_CLIENT_LOCK = threading.Lock()
+
+
+def _client() -> TradingClient:
+    global _CLIENT
+    if _CLIENT is None:
+        with _CLIENT_LOCK:
+            if _CLIENT is None:
+                _CLIENT = TradingClient(
+                    api_key=os.environ["ALPACA_API_KEY"],
+                    secret_key=os.environ["ALPACA_SECRET_KEY"],
+                    paper=True,
+                )
+    return _CLIENT
 
 
 def submit_market_order(symbol: str, qty: int, side: str = "buy") -> dict[str, Any]:
@@ -30,7 +43,7 @@ def submit_market_order(symbol: str, qty: int, side: str = "buy") -> dict[str, A
     Synchronous order submission — intended to be called via RetryWrapper.call().
     Returns a dict with order metadata including client_order_id.
     """
-    client = _make_client()
+    client = _client()
     client_order_id = str(uuid.uuid4())
 
     order_data = MarketOrderRequest(
@@ -58,12 +71,10 @@ def submit_market_order(symbol: str, qty: int, side: str = "buy") -> dict[str, A
 
 def check_duplicate_order(client_order_id: str) -> dict[str, Any] | None:
     """Query Alpaca to check if a client_order_id was already accepted."""
-    client = _make_client()
+    client = _client()
     try:
-        orders = client.get_orders()
-        for order in orders:
-            if str(order.client_order_id) == client_order_id:
-                return {"order_id": str(order.id), "status": str(order.status)}
-    except AlpacaAPIError:
-        pass
-    return None
+        # Server-side lookup: one order on the wire instead of every open one
+        order = client.get_order_by_client_id(client_order_id)
+    except AlpacaAPIError:  # 404 when no order carries this id
+        return None
+    return {"order_id": str(order.id), "status": str(order.status)}
@@ -23,25 +23,28 @@ class FaultInjector:
         status_code: int = 429,
         burst_at: int | None = None,
         burst_duration: int = 3,
+        seed: int | None = None,
     ) -> None:
         self._func = real_func
         self._failure_rate = failure_rate
         self._status_code = status_code
         self._burst_at = burst_at
         self._burst_duration = burst_duration
+        # Burst window as a half-open call-number range; an empty [0, 0)
+        # when there is no burst, so __call__ needs no None check
+        self._burst_start = burst_at if burst_at is not None else 0
+        self._burst_end = burst_at + burst_duration if burst_at is not None else 0
         self._call_count = 0
+        # Own generator: a seed makes a fault profile reproducible without
+        # reseeding the process-wide random module
+        self._rng = random.Random(seed)
 
     def __call__(self, *args: Any, **kwargs: Any) -> Any:
-        self._call_count += 1
+        self._call_count = n = self._call_count + 1
 
-        in_burst = (
-            self._burst_at is not None
-            and self._burst_at <= self._call_count < self._burst_at + self._burst_duration
-        )
-
-        if in_burst or random.random() < self._failure_rate:
+        if self._burst_start <= n < self._burst_end or self._rng.random() < self._failure_rate:
             raise APIError(
-                f"Injected fault (call #{self._call_count})",
+                f"Injected fault (call #{n})",
                 status_code=self._status_code,
             )
 
@@ -6,6 +6,7 @@ Production-grade async retry wrapper with circuit breaker.
 from __future__ import annotations
 
 import asyncio
+import inspect
 import random
 import time
 from dataclasses import dataclass, field
@@ -26,6 +27,12 @@ class CircuitState(Enum):
 class CircuitOpenError(RuntimeError):
     """Raised when a request is rejected by an open circuit."""
 
+    def __init__(self, trip_count: int = 0) -> None:
+        # Static message: fast-fail callers usually swallow this, so don't
+        # format anything they won't read
+        super().__init__("Circuit OPEN")
+        self.trip_count = trip_count
+
 
 class MaxRetriesExceeded(RuntimeError):
     """Raised when all retry attempts are exhausted."""
@@ -37,7 +44,7 @@ class APIError(Exception):
         self.status_code = status_code
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RetryConfig:
     max_attempts: int = 5
     base_delay: float = 0.5
@@ -45,18 +52,35 @@ class RetryConfig:
     retryable_codes: frozenset[int] = frozenset({429, 500, 502, 503, 504})
     circuit_open_duration: float = 60.0
     failure_threshold: int = 3
+    # Run sync callables in the default thread pool. Keep on for blocking I/O
+    # (alpaca-py HTTP); turn off for cheap sync callables to skip the
+    # thread handoff. Coroutine functions are always awaited directly.
+    use_executor: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class CircuitBreaker:
     config: RetryConfig
     state: CircuitState = CircuitState.CLOSED
     _failures: int = field(default=0, repr=False)
-    _last_failure_time: float = field(default=0.0, repr=False)
+    # monotonic() at which an OPEN circuit may probe again; fixed when the
+    # failure is recorded so the fast-fail check is a single compare
+    _reset_deadline: float = field(default=0.0, repr=False, init=False)
     _total_trips: int = field(default=0, repr=False)
 
+    def __post_init__(self) -> None:
+        self._reset_deadline = self.config.circuit_open_duration
+
+    @property
+    def _last_failure_time(self) -> float:
+        return self._reset_deadline - self.config.circuit_open_duration
+
+    @_last_failure_time.setter
+    def _last_failure_time(self, value: float) -> None:
+        self._reset_deadline = value + self.config.circuit_open_duration
+
     def record_success(self) -> None:
-        if self.state == CircuitState.HALF_OPEN:
+        if self.state is CircuitState.HALF_OPEN:
             log.info("circuit.closed", previous_state="HALF_OPEN")
         self.state = CircuitState.CLOSED
         self._failures = 0
@@ -65,7 +89,7 @@ class CircuitBreaker:
         self._failures += 1
         self._last_failure_time = time.monotonic()
         if self._failures >= self.config.failure_threshold:
-            if self.state != CircuitState.OPEN:
+            if self.state is not CircuitState.OPEN:
                 self._total_trips += 1
                 log.warning(
                     "circuit.opened",
@@ -75,8 +99,7 @@ class CircuitBreaker:
             self.state = CircuitState.OPEN
 
     def should_attempt_reset(self) -> bool:
-        elapsed = time.monotonic() - self._last_failure_time
-        return elapsed >= self.config.circuit_open_duration
+        return time.monotonic() >= self._reset_deadline
 
     @property
     def trip_count(self) -> int:
@@ -92,83 +115,99 @@ class RetryWrapper:
     def __init__(self, config: RetryConfig | None = None) -> None:
         self.config = config or RetryConfig()
         self.circuit = CircuitBreaker(config=self.config)
+        # Full-jitter ceilings per attempt; the config is frozen, so these are
+        # constants for the wrapper's lifetime
+        self._caps = tuple(
+            min(self.config.cap_delay, self.config.base_delay * (1 << attempt))
+            for attempt in range(self.config.max_attempts)
+        )
+        # Bounds attempts in flight so a burst of callers cannot all hit the
+        # API at once; the rest queue for a slot. The breaker is checked only
+        # on entry to call(), so queued attempts still run after it opens.
+        self._in_flight = asyncio.Semaphore(self.config.failure_threshold * 2)
         self._call_count = 0
         self._retry_count = 0
 
     def _jitter_delay(self, attempt: int) -> float:
         """AWS full-jitter: uniform sample from [0, min(cap, base * 2^attempt)]"""
-        exponential = self.config.base_delay * (2 ** attempt)
-        capped = min(self.config.cap_delay, exponential)
-        return random.uniform(0, capped)
+        if attempt < len(self._caps):
+            return self._caps[attempt] * random.random()
+        return min(self.config.cap_delay, self.config.base_delay * (1 << attempt)) * random.random()
 
     async def call(self, func: Callable, *args: Any, **kwargs: Any) -> Any:
         """
         Execute func(*args, **kwargs) with retry + circuit breaker.
-        func may be synchronous; it is dispatched via run_in_executor to
-        avoid blocking the event loop.
+        Coroutine functions are awaited in place. Sync functions are
+        dispatched via run_in_executor to avoid blocking the event loop,
+        or called inline when config.use_executor is False.
         """
         self._call_count += 1
+        cfg = self.config
+        circuit = self.circuit
 
-        if self.circuit.state == CircuitState.OPEN:
-            if self.circuit.should_attempt_reset():
-                self.circuit.state = CircuitState.HALF_OPEN
-                log.info("circuit.half_open")
-            else:
-                raise CircuitOpenError(
-                    f"Circuit is OPEN — failing fast "
-                    f"(trips={self.circuit.trip_count})"
-                )
+        # Enum members are singletons: `is` is a pointer compare
+        if circuit.state is CircuitState.OPEN:
+            if not circuit.should_attempt_reset():
+                raise CircuitOpenError(circuit.trip_count)
+            circuit.state = CircuitState.HALF_OPEN
+            log.info("circuit.half_open")
 
-        loop = asyncio.get_event_loop()
         last_exc: Exception | None = None
-
-        for attempt in range(self.config.max_attempts):
+        is_coroutine = inspect.iscoroutinefunction(func)
+        # Executor target is the same for every attempt; bind it once, and
+        # not at all when there is nothing to bind
+        bound = partial(func, *args, **kwargs) if (args or kwargs) and not is_coroutine else func
+        # Callable objects such as FaultInjector carry no __name__
+        fname = getattr(func, "__name__", type(func).__name__)
+
+        for attempt in range(cfg.max_attempts):
             try:
-                result = await loop.run_in_executor(
-                    None, partial(func, *args, **kwargs)
-                )
-                self.circuit.record_success()
-                log.debug(
-                    "api.call.success",
-                    attempt=attempt,
-                    func=func.__name__,
-                )
+                async with self._in_flight:
+                    if is_coroutine:
+                        result = await func(*args, **kwargs)
+                    elif cfg.use_executor:
+                        result = await asyncio.get_running_loop().run_in_executor(None, bound)
+                    else:
+                        result = func(*args, **kwargs)
+                # No per-success log: stats() already counts these, and a
+                # filtered-out debug call still builds its kwargs
+                circuit.record_success()
                 return result
 
             except APIError as exc:
                 last_exc = exc
-                if exc.status_code not in self.config.retryable_codes:
+                if exc.status_code not in cfg.retryable_codes:
                     log.error(
                         "api.call.non_retryable",
                         status_code=exc.status_code,
-                        func=func.__name__,
+                        func=fname,
                     )
                     raise
 
-                self.circuit.record_failure()
+                circuit.record_failure()
                 self._retry_count += 1
 
-                if self.circuit.state == CircuitState.OPEN:
+                if circuit.state is CircuitState.OPEN:
                     log.warning(
                         "api.call.circuit_tripped",
                         attempt=attempt,
-                        func=func.__name__,
+                        func=fname,
                     )
-                    raise CircuitOpenError("Circuit tripped mid-retry sequence") from exc
+                    raise CircuitOpenError(circuit.trip_count) from exc
 
-                if attempt < self.config.max_attempts - 1:
+                if attempt < cfg.max_attempts - 1:
                     delay = self._jitter_delay(attempt)
                     log.warning(
                         "api.call.retry",
                         attempt=attempt + 1,
-                        max_attempts=self.config.max_attempts,
+                        max_attempts=cfg.max_attempts,
                         delay_s=round(delay, 3),
                         status_code=exc.status_code,
                     )
                     await asyncio.sleep(delay)
 
         raise MaxRetriesExceeded(
-            f"Exhausted {self.config.max_attempts} attempts"
+            f"Exhausted {cfg.max_attempts} attempts"
         ) from last_exc
 
     @property
@@ -6,6 +6,9 @@ Run: pytest tests/ -v --asyncio-mode=auto
 from __future__ import annotations
 
 import asyncio
+import dataclasses
+import random
+import threading
 import time
 import pytest
 
@@ -16,6 +19,7 @@ from retry_wrapper import (
     RetryWrapper, RetryConfig, APIError,
     CircuitBreaker, CircuitState, CircuitOpenError, MaxRetriesExceeded,
 )
+from fault_injector import FaultInjector
 
 
 @pytest.fixture
@@ -37,6 +41,30 @@ async def test_success_no_retry(fast_config):
     assert w.stats()["retry_count"] == 0
 
 
+@pytest.mark.asyncio
+async def test_coroutine_function_is_awaited_directly(fast_config):
+    calls = 0
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        if calls < 2:
+            raise APIError("rate limited", 429)
+        return threading.current_thread()
+
+    w = RetryWrapper(fast_config)
+    assert await w.call(fetch) is threading.current_thread()
+    assert w.stats()["retry_count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_sync_dispatch_honours_use_executor(fast_config):
+    here = threading.current_thread()
+    pooled = await RetryWrapper(fast_config).call(threading.current_thread)
+    inline_cfg = dataclasses.replace(fast_config, use_executor=False)
+    inline = await RetryWrapper(inline_cfg).call(threading.current_thread)
+    assert pooled is not here and inline is here
+
+
 @pytest.mark.asyncio
 async def test_retries_on_retryable_code(fast_config):
     call_count = 0
@@ -127,10 +155,70 @@ async def test_jitter_delay_distribution(fast_config):
     assert max(delays) - min(delays) > 0.001, "No jitter variance — broken RNG?"
 
 
+@pytest.mark.asyncio
+async def test_callable_object_without_name_trips_circuit(fast_config):
+    inj = FaultInjector(lambda: "ok", failure_rate=1.0, status_code=503)
+    w = RetryWrapper(fast_config)
+    with pytest.raises(CircuitOpenError) as exc_info:  # not AttributeError from logging
+        await w.call(inj)
+    assert exc_info.value.trip_count == 1
+
+
+def test_fault_injector_burst_window():
+    inj = FaultInjector(lambda: "ok", failure_rate=0.0, burst_at=3, burst_duration=2)
+    outcomes = []
+    for _ in range(6):
+        try:
+            outcomes.append(inj())
+        except APIError as exc:
+            outcomes.append(exc.status_code)
+    assert outcomes == ["ok", "ok", 429, 429, "ok", "ok"]
+    assert FaultInjector(lambda: "ok", failure_rate=0.0)() == "ok"
+
+
+def test_fault_injector_seed_reproduces_fault_sequence():
+    def outcomes(inj):
+        seq = []
+        for _ in range(50):
+            try:
+                seq.append(inj())
+            except APIError:
+                seq.append(None)
+        return seq
+
+    first = outcomes(FaultInjector(lambda: "ok", failure_rate=0.5, seed=42))
+    assert first == outcomes(FaultInjector(lambda: "ok", failure_rate=0.5, seed=42))
+    assert None in first and "ok" in first
+
+
+def test_jitter_ceiling_doubles_per_attempt_until_cap(fast_config):
+    w = RetryWrapper(fast_config)
+    assert w._caps == (0.01, 0.02, 0.04, 0.08)
+    for attempt, ceiling in enumerate([0.01, 0.02, 0.04, 0.08, 0.1, 0.1]):
+        assert all(0 <= w._jitter_delay(attempt) <= ceiling for _ in range(100))
+
+
+@pytest.mark.asyncio
+async def test_in_flight_attempts_bounded_by_twice_threshold(fast_config):
+    in_flight = peak = 0
+
+    async def slow_ok():
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.005)
+        in_flight -= 1
+        return "ok"
+
+    w = RetryWrapper(fast_config)
+    outcomes = await asyncio.gather(*(w.call(slow_ok) for _ in range(20)))
+    assert outcomes == ["ok"] * 20
+    assert peak == 2 * fast_config.failure_threshold
+
+
 @pytest.mark.asyncio
 async def test_stress_high_concurrency(fast_config):
     """50 concurrent callers, 20% fault rate. No duplicate-success, no hangs."""
-    import random
     call_results: list[str] = []
 
     def sometimes_fail():